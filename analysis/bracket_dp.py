@@ -0,0 +1,144 @@
+import numpy as np
+
+from core.match_engine import MatchEngine
+from core.pairwise import PairwiseTable
+
+# How losers of the same round are ordered in the final ranking:
+#   "match":  by match order (batch_sim.get_rankings_from_knockout, FIFA 2026)
+#   "rating": by rating, best first, ties in slot order (PlayoffTournament.get_rankings)
+RANKINGS = ("match", "rating")
+
+def _poisson_pmf(mu, max_goals):
+    """ (..., max_goals + 1) Poisson probabilities of 0..max_goals goals for every mean in `mu`. """
+    k = np.arange(max_goals + 1)
+    log_fact = np.cumsum(np.log(np.maximum(k, 1)))
+    return np.exp(k * np.log(mu)[..., None] - mu[..., None] - log_fact)
+
+def knockout_matrix(ratings, engine = None, max_goals: int = 20):
+    """
+    P[i, j]: probability that team i, playing as team1, beats team j in a
+    knockout match of `engine` (default MatchEngine()).
+
+    Follows simulate_match: a forced win decides the match, a forced draw
+    goes to extra time (Poisson means from the pairwise table) and, if still
+    level, to penalties won by team1 with its win probability.
+    """
+    engine = engine if engine is not None else MatchEngine()
+    table = PairwiseTable.build(ratings, engine)
+
+    p1 = _poisson_pmf(table.et1, max_goals)
+    p2 = _poisson_pmf(table.et2, max_goals)
+    level = (p1 * p2).sum(axis = -1)
+    ahead = (p1[..., 1:] * np.cumsum(p2, axis = -1)[..., :-1]).sum(axis = -1)
+
+    return table.win + table.draw * (ahead + level * table.win)
+
+def bracket_of(stage):
+    """ Team indices of a KnockoutStage's opening round, in bracket order (teams need an `index`). """
+    if len(stage.teams) == 32: teams = stage._build_fifa2026_round_of_32()
+    else: teams = sorted(stage.teams, key = lambda t: (t.group, t.group_pos))
+    return np.array([t.index for t in teams])
+
+def _count_distribution(probs):
+    """ Distribution of the number of successes of independent Bernoulli(probs) trials (Poisson-binomial). """
+    dist = np.array([1.0])
+    for p in probs: dist = np.append(dist * (1 - p), 0) + np.append(0, dist * p)
+    return dist
+
+def expected_rho(expected_position, ratings):
+    """
+    Expected Spearman ρ between finishing position and rating (same tie-aware
+    ranks as EloCorrelationEvaluator.evaluate_batch).
+
+    Positions are always a permutation of 1..n, so the variance of their ranks
+    is fixed and ρ is linear in the positions: the expectation is exact.
+    """
+    pos = np.asarray(expected_position, dtype = float)
+    elos = np.asarray(ratings, dtype = float)
+    n = pos.size
+
+    x = n - pos + 1
+    y = n - (elos[None, :] > elos[:, None]).sum(axis = 1) - ((elos[None, :] == elos[:, None]).sum(axis = 1) - 1) / 2
+    mean = (n + 1) / 2
+
+    var_x = ((np.arange(1, n + 1) - mean) ** 2).sum()
+    return float(((x - mean) * (y - mean)).sum() / np.sqrt(var_x * ((y - mean) ** 2).sum()))
+
+def analyze_bracket(ratings, bracket, engine = None, ranking: str = "match"):
+    """
+    Exact outcome distribution of a fixed single-elimination bracket.
+
+    ratings: rating of every team of the field (team index order)
+    bracket: team indices in bracket order; slot 2k plays slot 2k + 1 (as
+             team1 / team2) and winners keep their order, as in KnockoutStage,
+             PlayoffTournament and core.bracket.BracketEngine
+    engine:  MatchEngine whose model gives the match probabilities (default MatchEngine())
+    ranking: one of RANKINGS
+
+    A dynamic programme over the rounds: a team's chance to win round r is its
+    chance to reach r times the chance-weighted win probability against every
+    team of the opposite half of its block, O(n²) per round.
+
+    Returns a dict, rows in bracket order:
+        teams:             the bracket
+        reach:             (n, rounds + 1) probability of winning at least k matches
+        champion:          (n,) probability of winning the bracket
+        positions:         (n, n) probability of finishing 1st, 2nd, ...
+        expected_position: (n,) expected finishing position
+        expected_rho:      expected Spearman ρ between position and rating
+    """
+    if ranking not in RANKINGS: raise ValueError(f"Unknown ranking {ranking!r}; expected one of {RANKINGS}")
+
+    ratings = np.asarray(ratings)
+    teams = np.asarray(bracket)
+    n = teams.size
+    rounds = n.bit_length() - 1
+    if n < 2 or n != 1 << rounds: raise ValueError("analyze_bracket needs a bracket of 2, 4, 8, ... teams")
+
+    q = knockout_matrix(ratings, engine)[np.ix_(teams, teams)]
+
+    # reach[s, r + 1] = reach[s, r] * P(beat the opponent coming out of the other half of the block)
+    reach = np.zeros((n, rounds + 1))
+    reach[:, 0] = 1.0
+    for r in range(rounds):
+        h = 1 << r
+        for lo in range(0, n, 2 * h):
+            up, down = slice(lo, lo + h), slice(lo + h, lo + 2 * h)
+            p = q[up, down] # Upper half plays as team1
+            reach[up, r + 1] = reach[up, r] * (p @ reach[down, r])
+            reach[down, r + 1] = reach[down, r] * ((1 - p).T @ reach[up, r])
+
+    lose = reach[:, :-1] - reach[:, 1:]
+    positions = np.zeros((n, n))
+    positions[:, 0] = reach[:, -1]
+
+    elos = ratings[teams].astype(float)
+    slot = np.arange(n)
+    ahead = (elos[:, None] > elos[None, :]) | ((elos[:, None] == elos[None, :]) & (slot[:, None] < slot[None, :])) # ahead[j, i]
+
+    # Losers of round r take positions base + 1 .. 2 * base
+    for r in range(rounds):
+        base = n >> (r + 1)
+        match = slot >> (r + 1)
+
+        if ranking == "match":
+            positions[slot, base + match] += lose[:, r]
+            continue
+
+        # Rating order: the offset is the number of better-ranked losers from the other matches, which are independent
+        for s in range(n):
+            if lose[s, r] == 0: continue
+            per_match = np.bincount(match, weights = lose[:, r] * ahead[:, s], minlength = base)
+            offsets = _count_distribution(np.delete(per_match, match[s]))
+            positions[s, base : base + offsets.size] += lose[s, r] * offsets
+
+    expected_position = positions @ np.arange(1, n + 1)
+
+    return {
+        "teams": teams,
+        "reach": reach,
+        "champion": reach[:, -1],
+        "positions": positions,
+        "expected_position": expected_position,
+        "expected_rho": expected_rho(expected_position, elos),
+    }
@@ -0,0 +1,198 @@
+from collections import OrderedDict
+from itertools import combinations, product
+
+import numpy as np
+
+from core.match_engine import MatchEngine
+from core.pairwise import PairwiseTable
+from core.score_tables import OUTCOMES
+
+# Fixtures of a 4-team group in GroupStage order (combinations of the group list; first team is team1)
+FIXTURES = list(combinations(range(4), 2))
+
+# Every W/D/L pattern of the 6 fixtures (3^6 = 729 rows), outcome codes as in core.score_tables
+PATTERNS = np.array(list(product(OUTCOMES, repeat = len(FIXTURES))), dtype = np.int8)
+
+# FIFA 2026: 8 of the 12 third-placed teams qualify
+THIRDS_QUALIFYING = 8
+
+def standing_code(points, goal_difference, goals_for):
+    """ One integer per (points, goal difference, goals for), ordered like the FIFA comparison of third-placed teams. """
+    return (np.asarray(points) * 256 + np.asarray(goal_difference) + 128) * 128 + np.asarray(goals_for)
+
+class GroupEnumerator:
+    """
+    Exact group-stage analysis by enumerating the 3^6 W/D/L patterns of a 4-team group.
+
+    Each pattern's probability is the product of its six outcome probabilities
+    (the forced-outcome step of MatchEngine, from the pairwise table), and the
+    points of every team follow exactly. Only where points are level do goal
+    difference, goals for, fair play and lots matter; those are resolved by
+    a small conditional sampler: `samples` scorelines per fixture and outcome
+    from the outcome-conditioned score distribution (the "exact" sampler's
+    model), shared by all patterns, plus fair-play cards and lots as in
+    Team.record_match / GroupStandings. Patterns without a tie on points are
+    therefore exact; the rest carry sampling error of order 1 / sqrt(samples).
+
+    Results depend only on the group's teams (in group order), so they are
+    cached per composition (bounded LRU) and reused across draws. The sampler
+    of a group is seeded from (seed, team indices): a cache miss recomputes
+    the same numbers.
+    """
+
+    def __init__(self, ratings, engine = None, samples: int = 2000, seed: int = 0, cache_size: int = 512):
+        """ Initialize for a field of `ratings` (team index order) under `engine`'s model (default MatchEngine()). """
+        self.ratings = np.asarray(ratings)
+        self.engine = engine if engine is not None else MatchEngine()
+        self.samples = samples
+        self.seed = seed
+        self.cache_size = cache_size
+
+        self.table = PairwiseTable.build(self.ratings, self.engine)
+        self.groups: OrderedDict = OrderedDict() # tuple of team indices -> analysis
+        self.hits = 0
+        self.misses = 0
+
+    # ----------------------------------------------------------
+
+    def _score_samples(self, teams, rng):
+        """ (6, 3, samples, 2) scorelines per fixture and outcome (OUTCOMES order), conditioned on the outcome. """
+        scores = np.zeros((len(FIXTURES), len(OUTCOMES), self.samples, 2), dtype = np.int16)
+
+        for f, (a, b) in enumerate(FIXTURES):
+            i, j = teams[a], teams[b]
+            for k, o in enumerate(OUTCOMES):
+                pmf = self.engine.score_tables.conditional_pmf(self.table.mu1[i, j], self.table.mu2[i, j], o)
+                cells = np.array(list(pmf))
+                scores[f, k] = cells[rng.choice(len(cells), size = self.samples, p = np.array(list(pmf.values())))]
+        return scores
+
+    def _analyze(self, teams):
+        """ Enumerate one group: position distribution and third-place standing distribution. """
+        rng = np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key = tuple(int(t) for t in teams)))
+        n_pat, n_smp = len(PATTERNS), self.samples
+
+        # Pattern probabilities: product over fixtures of P(outcome)
+        idx = np.array([[teams[a], teams[b]] for a, b in FIXTURES])
+        win = self.table.win[idx[:, 0], idx[:, 1]]
+        draw = self.table.draw[idx[:, 0], idx[:, 1]]
+        p_outcome = np.stack([win, draw, 1 - win - draw], axis = 1) # OUTCOMES order: 1, 0, -1
+        col = np.select([PATTERNS == 1, PATTERNS == 0], [0, 1], 2)
+        prob = p_outcome[np.arange(len(FIXTURES)), col].prod(axis = 1)
+
+        # Points are exact per pattern
+        points = np.zeros((n_pat, 4), dtype = np.int64)
+        for f, (a, b) in enumerate(FIXTURES):
+            points[:, a] += np.select([PATTERNS[:, f] == 1, PATTERNS[:, f] == 0], [3, 1], 0)
+            points[:, b] += np.select([PATTERNS[:, f] == -1, PATTERNS[:, f] == 0], [3, 1], 0)
+
+        # Scorelines (shared by all patterns with the same fixture outcome), fair play and lots per sample
+        scores = self._score_samples(teams, rng)
+        gf = np.zeros((n_pat, n_smp, 4), dtype = np.int16)
+        ga = np.zeros((n_pat, n_smp, 4), dtype = np.int16)
+        for f, (a, b) in enumerate(FIXTURES):
+            s = scores[f][col[:, f]] # (patterns, samples, 2)
+            gf[:, :, a] += s[..., 0]
+            ga[:, :, a] += s[..., 1]
+            gf[:, :, b] += s[..., 1]
+            ga[:, :, b] += s[..., 0]
+
+        # Three matches per team: yellows uniform in {0, 1, 2}, a red (3 points) with probability 0.05
+        fair_play = ((rng.random((n_smp, 4, 3)) * 3).astype(np.int64) + 3 * (rng.random((n_smp, 4, 3)) < 0.05)).sum(axis = -1)
+        lots = rng.random((n_smp, 4))
+
+        # Rank by points, goal difference, goals for, fair play (fewer is better), lots
+        code = standing_code(points[:, None, :], gf - ga, gf)
+        key = (code * 32 + (31 - fair_play[None])) + lots[None]
+        order = np.argsort(-key, axis = -1, kind = "stable") # (patterns, samples, 4): team at each position
+
+        weight = np.broadcast_to(prob[:, None] / n_smp, order.shape[:2]).ravel()
+        positions = np.stack([np.bincount(order[..., k].ravel(), weights = weight, minlength = 4) for k in range(4)], axis = 1)
+
+        # Standing of the third-placed team: (code, team) packed into one integer per sample
+        third = order[..., 2]
+        packed = np.take_along_axis(code, third[..., None], axis = -1)[..., 0] * 4 + third
+        values, inverse = np.unique(packed.ravel(), return_inverse = True)
+
+        return {
+            "teams": np.asarray(teams),
+            "patterns": prob,
+            "positions": positions,
+            "third_team": np.asarray(teams)[values % 4],
+            "third_code": values // 4,
+            "third_prob": np.bincount(inverse.ravel(), weights = weight),
+        }
+
+    def group(self, teams):
+        """
+        Analyse one group (team indices in group order). Returns a dict with
+            teams:      the group
+            patterns:   (729,) probability of each W/D/L pattern (PATTERNS order)
+            positions:  (4, 4) probability of each team finishing 1st..4th
+            third_team, third_code, third_prob: distribution of the third-placed
+                        team and its standing_code (points, goal difference, goals for)
+        """
+        key = tuple(int(t) for t in teams)
+        if len(key) != 4: raise ValueError("GroupEnumerator analyses groups of 4 teams")
+
+        result = self.groups.get(key)
+        if result is not None:
+            self.hits += 1
+            self.groups.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = self.groups[key] = self._analyze(key)
+        while len(self.groups) > self.cache_size: self.groups.popitem(last = False)
+        return result
+
+    def analyze_draw(self, groups):
+        """
+        Exact qualification picture of a whole draw (FIFA2026GroupStage.get_qualified_teams).
+
+        groups: team indices per group, groups in order A, B, ... (the order
+                breaks ties between third-placed teams level on points, goal
+                difference and goals for, as the stable sort does)
+
+        Returns a dict of (n_teams,) arrays over the field (NaN for teams not in the draw):
+            positions:     (n_teams, 4) group finishing-position distribution
+            third_qualify: probability of qualifying as one of the 8 best thirds
+            qualify:       probability of reaching the knockout stage
+        """
+        results = [self.group(g) for g in groups]
+        n = self.ratings.size
+        positions = np.full((n, 4), np.nan)
+        third_qualify = np.full(n, np.nan)
+
+        for res in results:
+            positions[res["teams"]] = res["positions"]
+            third_qualify[res["teams"]] = 0.0
+
+        # Per group: the distribution of its third's standing code, as sorted arrays for "P(code > v)" lookups
+        dists = []
+        for res in results:
+            codes, inverse = np.unique(res["third_code"], return_inverse = True)
+            p = np.bincount(inverse, weights = res["third_prob"], minlength = codes.size)
+            dists.append((codes, np.append(np.cumsum(p[::-1])[::-1], 0.0))) # tail[k] = P(code >= codes[k])
+
+        # A third qualifies when fewer than 8 of the other 11 thirds rank ahead of it (groups are independent);
+        # the count is a Poisson-binomial over the other groups, built for all of a group's (team, code) entries at once
+        for g, res in enumerate(results):
+            v = res["third_code"]
+            count = np.zeros((v.size, len(results)))
+            count[:, 0] = 1.0
+
+            for h, (codes, tail) in enumerate(dists):
+                if h == g: continue
+                # Level codes count as ahead for earlier groups (stable sort in group order)
+                q = tail[np.searchsorted(codes, v, side = "left" if h < g else "right")]
+                count[:, 1:] = count[:, 1:] * (1 - q[:, None]) + count[:, :-1] * q[:, None]
+                count[:, 0] *= 1 - q
+
+            np.add.at(third_qualify, res["third_team"], res["third_prob"] * count[:, :THIRDS_QUALIFYING].sum(axis = 1))
+
+        return {
+            "positions": positions,
+            "third_qualify": third_qualify,
+            "qualify": positions[:, 0] + positions[:, 1] + third_qualify,
+        }
@@ -1,28 +1,66 @@
 import argparse
+import json
 from pathlib import Path
-from collections import defaultdict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
-import pandas as pd
-from tqdm import tqdm
+import numpy as np
 
 # Core functionality
-from core.team import Team
+from core.team_table import TeamTable
 from core.match_engine import MatchEngine
 from core.knockout_stage import KnockoutStage
+from core.instrumentation import Instrumentation, NULL_INSTRUMENTATION
+from core.common_random import PairingStreams, STREAM_TAG
+from core.pairwise import PAIRWISE_TABLES, PairwiseTable
+from core.plan import compile_format, PlanEngine, bracket_size
 
 # Tournament formats
 from formats.fifa2026 import FIFA2026Tournament
 from formats.playoff import PlayoffTournament
 from formats.swiss import SwissTournament
+from formats.specs import FORMAT_SPECS, format_parameters
 
 # Evaluation modules
 from evaluators.elo_correlation import EloCorrelationEvaluator
 from evaluators.incentive_compatibility import IncentiveCompatibilityEvaluator
+from evaluators.running_stats import RunningStats
+from evaluators.paired_difference import PairedDifferenceEvaluator
+from evaluators.position_histogram import PositionHistogram
+
+# Result storage
+from storage.chunked_writer import ChunkedResultWriter, FILE_FORMATS, file_sha256
+from storage.placement_store import PlacementStore, EXTENSION
+from storage.result_cache import ResultCache, result_key
 
 # Instantiate evaluators
 corr_eval = EloCorrelationEvaluator()
 ic_eval = IncentiveCompatibilityEvaluator()
 
+# Supported tournament formats (the position of each format is part of its seed stream)
+FORMATS = {"FIFA2026": FIFA2026Tournament, "Playoff": PlayoffTournament, "Swiss8R": SwissTournament}
+
+# Per-edition metrics written by batch_sim (columns after "format")
+METRICS = ["rho", "err", "dead_pct"]
+
+# Simulation paths: "object" plays one edition at a time through the format classes,
+# "plan" runs the compiled FORMAT_SPECS on PlanEngine, PLAN_BLOCK editions per call
+ENGINES = ("object", "plan")
+
+# Plan editions come in fixed blocks [b * PLAN_BLOCK, (b + 1) * PLAN_BLOCK), each with its own stream (tagged like core.common_random)
+PLAN_BLOCK = 250
+PLAN_TAG = 0x504C4E
+
+# Default location and size bound of the result cache (storage.result_cache)
+DEFAULT_CACHE = "results/cache"
+DEFAULT_CACHE_MB = 1024
+
+# Compiled plans of the current process, per format
+_plans = {}
+
+# Team table of the current process (set once per pool worker by _init_worker)
+_team_table = None
+
 def get_rankings_from_knockout(knockout):
     """ Convert KnockoutStage object into a ranked list of teams. """
     champion = knockout.get_champion()
@@ -38,76 +76,477 @@ def get_rankings_from_knockout(knockout):
     for round_size in [4, 8, 16, 32]: rankings.extend([t for t, r in knockout.eliminated.items() if r == round_size and t not in rankings])
     return rankings
 
-def run_one(tournament_cls, ratings_df):
-    """ Run a single simulation of the given tournament class. """
-    # Create teams and match engine
-    teams = [Team(row["Country"], int(row["Rating"])) for _, row in ratings_df.iterrows()]
-    match_engine = MatchEngine()
-    tour = tournament_cls(teams, match_engine)
+def edition_rng(entropy, fmt_idx, edition):
+    """
+    Generator for one edition: child (fmt_idx, edition) of the root SeedSequence.
+
+    Equivalent to SeedSequence(entropy).spawn(...)[fmt_idx].spawn(...)[edition],
+    so every edition has its own independent stream no matter which worker runs it.
+    """
+    return np.random.default_rng(np.random.SeedSequence(entropy, spawn_key = (fmt_idx, edition)))
+
+def edition_streams(entropy, fmt_idx, edition, crn = False, antithetic = False):
+    """
+    Return (rng, streams) for one edition; streams is None for plain sampling.
+
+    crn:        every format plays edition e with the same randomness: one
+                shared edition stream (draws, cards, lots) and one stream per
+                fixture (core.common_random), so formats can be compared edition
+                by edition.
+    antithetic: editions 2m and 2m + 1 play their fixtures on mirrored
+                streams (u and 1 - u); the rest of their randomness is independent.
+    """
+    if not (crn or antithetic): return edition_rng(entropy, fmt_idx, edition), None
+
+    scope = 0 if crn else fmt_idx + 1
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key = (STREAM_TAG, scope, edition)))
+    key = (scope, edition // 2) if antithetic else (scope, edition)
+    return rng, PairingStreams(entropy, key, antithetic = antithetic and edition % 2 == 1)
+
+def play_one(tournament_cls, ratings_df, rng = None, events = None, table = None, instruments = None, streams = None):
+    """
+    Play a single edition of the given tournament class (silent unless an event sink is given).
+
+    Pass a TeamTable built from ratings_df to reuse its teams: it is reset in
+    place instead of constructing a new Team object per team and edition.
+    Pass an Instrumentation to collect stage timings and match-engine counters,
+    and PairingStreams to draw every fixture from its own stream.
+
+    Returns (positions, dead): finishing position of every team in table order
+    (0 = did not reach the final ranking) and the low-incentive match percentage.
+    """
+    # Reset (or build) the field and create the match engine
+    ins = instruments if instruments is not None else NULL_INSTRUMENTATION
+    if table is None: table = TeamTable.from_dataframe(ratings_df)
+    table.reset()
+    teams = list(table.teams)
+    match_engine = MatchEngine(rng = rng, instruments = ins, streams = streams)
+    match_engine.bind(table.rating)
+    tour = tournament_cls(teams, match_engine, events = events)
 
     # Run tournament and get rankings
-    tour.run()
+    with ins.timer("stage.run"): tour.run()
 
     if isinstance(tour, FIFA2026Tournament):
-        qualified = tour.get_qualified_teams()
-        knockout = KnockoutStage(qualified, match_engine)
-        knockout.simulate()
-        rankings = get_rankings_from_knockout(knockout)
+        with ins.timer("stage.knockout"):
+            qualified = tour.get_qualified_teams()
+            knockout = KnockoutStage(qualified, match_engine, events = events)
+            knockout.simulate()
+            rankings = get_rankings_from_knockout(knockout)
     else:
         rankings = tour.get_rankings()
 
-    # Evaluate Elo correlation
-    df = pd.DataFrame({"team": [t.name for t in rankings], "position": range(1, len(rankings) + 1)})
-    initial_elos = ratings_df.rename(columns = {"Country": "team", "Rating": "elo"})
-    corr = corr_eval.evaluate(df, initial_elos)
+    positions = np.zeros(len(table), dtype = np.int16)
+    positions[[t.index for t in rankings]] = np.arange(1, len(rankings) + 1)
 
     # Evaluate incentive compatibility
     try:
-        ic = ic_eval.evaluate(tour)
+        with ins.timer("evaluate.incentive_compatibility"): ic = ic_eval.evaluate(tour)
         dead = ic["pct_low_incentive"]
     except Exception:
         dead = 0.0
-    return corr["correlation"], corr["avg_diff"], dead
+
+    ins.count("editions")
+    return positions, dead
+
+def run_one(tournament_cls, ratings_df, rng = None, events = None, table = None):
+    """ Run a single simulation of the given tournament class and return (rho, err, dead). """
+    if table is None: table = TeamTable.from_dataframe(ratings_df)
+    positions, dead = play_one(tournament_cls, ratings_df, rng, events, table)
+
+    corr = corr_eval.evaluate_batch(positions[None], table.rating)
+    return float(corr["correlation"][0]), float(corr["avg_diff"][0]), dead
+
+def _init_worker(rating_csv, pairwise = None):
+    """ Pool initializer: load the ratings table once per worker process and attach the shared pairwise table, if given. """
+    global _team_table
+    _team_table = TeamTable.from_csv(rating_csv)
+    if pairwise is not None: PAIRWISE_TABLES.put(PairwiseTable.attach(pairwise))
+
+def run_plan_editions(fmt_name, start, stop, entropy, ins = NULL_INSTRUMENTATION):
+    """
+    Run editions [start, stop) of one format on its compiled plan.
+
+    Plays every PLAN_BLOCK block that overlaps the range with the block's own
+    generator and keeps the requested editions, so an edition's result does
+    not depend on how the range was sharded. Returns (positions, dead) arrays.
+    """
+    fmt_idx = list(FORMATS).index(fmt_name)
+    if fmt_name not in _plans: _plans[fmt_name] = compile_format(FORMAT_SPECS[fmt_name], len(_team_table))
+    positions, dead = [], []
+
+    for b in range(start // PLAN_BLOCK, -(-stop // PLAN_BLOCK)):
+        rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key = (PLAN_TAG, fmt_idx, b)))
+        engine = PlanEngine(_team_table.rating, MatchEngine(rng = rng, instruments = ins))
+        with ins.timer("stage.plan"): engine.run(_plans[fmt_name], PLAN_BLOCK)
+
+        # Low-incentive share from the group fixtures (formats without groups have none)
+        goals = engine.group_goals
+        with ins.timer("evaluate.incentive_compatibility"): pct = np.zeros(PLAN_BLOCK) if goals is None else ic_eval.evaluate_batch(goals)["pct_low_incentive"]
+
+        keep = slice(max(start - b * PLAN_BLOCK, 0), min(stop - b * PLAN_BLOCK, PLAN_BLOCK))
+        positions.append(engine.positions[keep])
+        dead.append(pct[keep])
+
+    ins.count("editions", stop - start)
+    return np.concatenate(positions), np.concatenate(dead)
+
+def run_editions(fmt_name, start, stop, entropy, instrument = False, crn = False, antithetic = False, engine = "object"):
+    """
+    Run editions [start, stop) of one format (crn / antithetic: see edition_streams; engine: one of ENGINES).
+
+    Returns (rows, positions, report): the (rho, err, dead) rows and the
+    (editions, teams) finishing positions in edition order, and the shard's
+    Instrumentation (None unless instrument is set).
+    """
+    fmt_idx = list(FORMATS).index(fmt_name)
+    ins = Instrumentation() if instrument else NULL_INSTRUMENTATION
+
+    if engine == "plan":
+        positions, dead = run_plan_editions(fmt_name, start, stop, entropy, ins)
+    else:
+        played = []
+        for e in range(start, stop):
+            rng, streams = edition_streams(entropy, fmt_idx, e, crn, antithetic)
+            played.append(play_one(FORMATS[fmt_name], None, rng, table = _team_table, instruments = ins, streams = streams))
+        positions, dead = np.array([p for p, _ in played]), [d for _, d in played]
+
+    # Elo correlation for the whole shard in one vectorised pass
+    with ins.timer("evaluate.elo_correlation"): corr = corr_eval.evaluate_batch(positions, _team_table.rating)
+    rows = list(zip(corr["correlation"].tolist(), corr["avg_diff"].tolist(), np.asarray(dead, dtype = float).tolist()))
+    return rows, positions, (ins if instrument else None)
+
+def _shards(n, workers, align = 1):
+    """ Split range(n) into contiguous (start, stop) shards, a few per worker for load balancing (sizes a multiple of align). """
+    size = max(1, -(-n // (4 * workers)))
+    size = -(-size // align) * align
+    return [(lo, min(lo + size, n)) for lo in range(0, n, size)]
+
+def run_chunks(pool, fmt_name, start, n, chunk_size, workers, entropy, instruments = None, crn = False, antithetic = False, engine = "object"):
+    """
+    Yield (lo, hi, rows, positions) for consecutive chunks of editions [start, n) of one format.
+
+    Each chunk is split into shards for the workers; the next chunk is already
+    submitted while the current one is returned, so the pool stays busy while
+    results are written. Without a pool the shards run in-process. If an
+    Instrumentation is given, every shard is instrumented and merged into it.
+    """
+    instrument = instruments is not None
+
+    def submit(lo, hi):
+        shards = [(lo + a, lo + b) for a, b in _shards(hi - lo, workers, PLAN_BLOCK if engine == "plan" else 1)]
+        if pool is None: return shards
+        return [pool.submit(run_editions, fmt_name, a, b, entropy, instrument, crn, antithetic, engine) for a, b in shards]
+
+    def collect(jobs):
+        results = [run_editions(fmt_name, a, b, entropy, instrument, crn, antithetic, engine) for a, b in jobs] if pool is None else [f.result() for f in jobs]
+        for *_, report in results:
+            if instrument: instruments.merge(report)
+        return [row for rows, _, _ in results for row in rows], np.concatenate([positions for _, positions, _ in results])
+
+    pending = deque()
+    try:
+        for lo in range(start, n, chunk_size):
+            hi = min(lo + chunk_size, n)
+            pending.append((lo, hi, submit(lo, hi)))
+            if len(pending) > 1:
+                lo, hi, jobs = pending.popleft()
+                yield (lo, hi, *collect(jobs))
+
+        while pending:
+            lo, hi, jobs = pending.popleft()
+            yield (lo, hi, *collect(jobs))
+    finally:
+        # Stopped early (adaptive mode): drop the chunk that was submitted ahead
+        for _, _, jobs in pending:
+            for job in jobs:
+                if pool is not None: job.cancel()
+
+def open_placements(path, fmt_name, run, done):
+    """
+    Placement store of one format for a run that has `done` editions stored:
+    a new store when starting, else the existing one rolled back to `done`
+    (it may hold a chunk written just before an interruption).
+    """
+    if not done: return PlacementStore.create(path, fmt_name, _team_table.names, run["ratings_sha256"], run["seed"])
+
+    store = PlacementStore.open(path, mode = "r+")
+    header = store.header
+    if (header["format"], header["seed"], header["ratings_sha256"]) != (fmt_name, run["seed"], run["ratings_sha256"]): raise ValueError(f"cannot resume: {path} belongs to another run")
+    if len(store) < done: raise ValueError(f"cannot resume: {path} holds {len(store)} editions, the checkpoint {done}")
+
+    store.truncate(done)
+    return store
+
+def open_histogram(path, fmt_name, done, store = None):
+    """
+    Position histogram of one format for a run that has `done` editions stored:
+    empty when starting, else the saved one, rebuilt from the placement store
+    if the save does not match the checkpoint.
+    """
+    hist = PositionHistogram(_team_table.names, bracket_size(FORMAT_SPECS[fmt_name]), fmt_name)
+    if not done: return hist
+
+    if path.exists():
+        saved = PositionHistogram.from_json(path)
+        if saved.editions == done: return saved
+
+    if store is None: raise ValueError(f"cannot resume: {path} does not match the checkpoint ({done} editions); rerun, or keep --placements to rebuild it")
+    for _, block in store.blocks(): hist.update(block)
+    return hist
+
+def cache_fields(fmt_name, run, engine = "object"):
+    """
+    What determines a format's per-edition metrics in a run: ratings, format
+    and its parameters, seed, engine, variance-reduction settings, the
+    simulator version and a digest of the simulation sources. The edition
+    count is left out, so a run of any length finds the entry of the same
+    inputs (see storage.result_cache).
+    """
+    from tournament_sim import __version__, source_digest
+
+    return {
+        "format": fmt_name,
+        "params": format_parameters(fmt_name),
+        "seed": run["seed"],
+        "ratings_sha256": run["ratings_sha256"],
+        "engine": engine,
+        "crn": run.get("crn", False),
+        "antithetic": run.get("antithetic", False),
+        "version": __version__,
+        "sources": source_digest(),
+    }
+
+def stored_rows(writer, fmt_name):
+    """ (editions, METRICS) array of every stored chunk of one format. """
+    chunks = [np.column_stack([np.asarray(columns[m], dtype = float) for m in METRICS]) for columns in writer.read_chunks(fmt_name)]
+    return np.concatenate(chunks) if chunks else np.empty((0, len(METRICS)))
+
+def summarize(writer):
+    """ Stream over the stored chunks and return {format: {metric: RunningStats}}. """
+    stats = {}
+    for fmt_name in FORMATS:
+        acc = {m: RunningStats() for m in METRICS}
+        for columns in writer.read_chunks(fmt_name):
+            for m in METRICS: acc[m].update(columns[m])
+        if acc[METRICS[0]].count: stats[fmt_name] = acc
+    return stats
+
+def parse_targets(specs):
+    """ Parse --target-ci values: "0.005" targets rho, "metric=0.005" any metric. Returns {metric: half-width}. """
+    targets = {}
+    for spec in specs:
+        metric, _, value = spec.rpartition("=")
+        metric = metric or "rho"
+        if metric not in METRICS: raise ValueError(f"--target-ci: unknown metric {metric!r}; expected one of {METRICS}")
+        targets[metric] = float(value)
+    return targets
+
+def precise_enough(acc, targets, confidence):
+    """ True once every targeted metric's confidence half-width is at or below its target. """
+    return all(acc[m].count > 1 and acc[m].half_width(confidence) <= hw for m, hw in targets.items())
+
+def format_precision(stats, targets, confidence, n_max):
+    """ Markdown table of editions used and achieved confidence half-width per format. """
+    from tabulate import tabulate
+
+    headers = ["format", "editions", "stopped"] + [f"{m} ± {confidence:.0%}" + (f" (target {targets[m]:g})" if m in targets else "") for m in METRICS]
+    rows = []
+    for f in sorted(stats):
+        used = stats[f][METRICS[0]].count
+        status = "target met" if precise_enough(stats[f], targets, confidence) else "max reached" if used >= n_max else "-"
+        rows.append([f, used, status] + [f"{stats[f][m].mean:.4f} ± {stats[f][m].half_width(confidence):.4f}" for m in METRICS])
+    return tabulate(rows, headers = headers, tablefmt = "pipe")
+
+def format_comparison(writer, antithetic = False, confidence = 0.95):
+    """ Markdown table of paired differences between every two formats, with their variance reduction factors. """
+    from tabulate import tabulate
+
+    diff_eval = PairedDifferenceEvaluator(antithetic, confidence)
+    columns = {}
+    for fmt_name in FORMATS:
+        chunks = list(writer.read_chunks(fmt_name))
+        if chunks: columns[fmt_name] = {m: np.concatenate([c[m] for c in chunks]) for m in METRICS}
+
+    headers = ["comparison", "editions"] + [f"{m} diff ± {confidence:.0%}" for m in METRICS] + [f"{m} VRF" for m in METRICS]
+    rows = []
+    names = list(columns)
+    for i, a in enumerate(names):
+        for b in names[i + 1:]:
+            res = [diff_eval.evaluate(columns[a][m], columns[b][m]) for m in METRICS]
+            rows.append([f"{a} - {b}", res[0]["editions"]] + [f"{r['mean_diff']:+.4f} ± {r['half_width']:.4f}" for r in res] + [f"{r['vrf']:.2f}" for r in res])
+    return tabulate(rows, headers = headers, tablefmt = "pipe")
+
+def format_summary(stats):
+    """ Markdown table of mean / SD per format (same layout as pandas' groupby(...).agg(...).to_markdown()). """
+    from tabulate import tabulate
+
+    headers = ["format"] + [str((m, agg)) for m in METRICS for agg in ("mean", "std")]
+    rows = [[f] + [round(v, 3) for m in METRICS for v in (stats[f][m].mean, stats[f][m].std())] for f in sorted(stats)]
+    return tabulate(rows, headers = headers, tablefmt = "pipe", floatfmt = "g")
 
 def main(args):
     """ Run a Monte Carlo simulation across multiple tournament formats. """
-    ratings_df = pd.read_csv(args.rating_csv)
+    if args.engine == "plan" and (args.crn or args.antithetic): raise ValueError("--crn / --antithetic need --engine object (the plan engine draws per block, not per fixture)")
+
+    _init_worker(args.rating_csv)
     out_dir = Path("results")
     out_dir.mkdir(exist_ok = True)
 
-    # Supported tournament formats
-    formats = {"FIFA2026": FIFA2026Tournament, "Playoff": PlayoffTournament, "Swiss8R": SwissTournament}
+    writer = ChunkedResultWriter(out_dir / "batch_parts", args.file_format)
+
+    # Root entropy: the given --seed, the checkpoint's seed on --resume, or a fresh one that is reported so the run can be repeated
+    entropy = args.seed
+    if entropy is None and args.resume: entropy = writer.load()["run"]["seed"]
+    if entropy is None: entropy = np.random.SeedSequence().entropy
+    print(f"Seed: {entropy}")
+
+    # Every edition's RNG is derived from (seed, format, edition), so the checkpoint only needs these settings to continue exactly
+    run = {"seed": entropy, "n": args.n, "chunk_size": args.chunk_size, "formats": list(FORMATS), "ratings_sha256": file_sha256(args.rating_csv)}
+    run.update({k: True for k in ("crn", "antithetic") if getattr(args, k)})
+    if args.engine != "object": run["engine"] = args.engine
+    if args.placements: run["placements"] = True
+    if args.histograms: run["histograms"] = True
+    writer.start(run, resume = args.resume)
 
-    # Metrics collection
-    metrics = defaultdict(list)
+    # Progress bar is an optional nicety, imported only when a run actually starts
+    from tqdm import tqdm
+
+    # Pool and shared pairwise table are released however the run ends (errors, Ctrl-C before a --resume)
+    pool = pairwise = None
+    try:
+        # Workers map the field's pairwise table from shared memory instead of each building their own
+        if args.workers > 1:
+            pairwise = MatchEngine().bind(_team_table.rating)
+            pool = ProcessPoolExecutor(args.workers, initializer = _init_worker, initargs = (args.rating_csv, pairwise.share()))
 
-    for fmt_name, tour_cls in formats.items():
-        print(f"\nRunning {args.n} editions of {fmt_name} …")
-        for _ in tqdm(range(args.n)):
-            rho, err, dead = run_one(tour_cls, ratings_df)
-            metrics["format"].append(fmt_name)
-            metrics["rho"].append(rho)
-            metrics["err"].append(err)
-            metrics["dead_pct"].append(dead)
+        # Optional per-format instrumentation (counters and timers, see core.instrumentation)
+        reports = {fmt_name: Instrumentation() for fmt_name in FORMATS} if args.instrument else {}
 
-    # Save results
-    df = pd.DataFrame(metrics)
-    df.to_csv(out_dir / "batch_metrics.csv", index=False)
+        # Optional per-team position / round-reach counts, saved after every chunk
+        hist_dir = out_dir / "histograms"
+        if args.histograms: hist_dir.mkdir(exist_ok = True)
+
+        # Adaptive mode: --n is the per-format maximum, and a format stops once its targets are met (checked every --check-every editions)
+        targets = parse_targets(args.target_ci) if args.target_ci else {}
+        step = min(args.chunk_size, args.check_every) if targets else args.chunk_size
+
+        # Result cache: only a repeatable (seeded) run can be reused. Cached editions carry metrics only, so runs that
+        # also need positions, timings or an adaptive stopping point compute everything and just write through
+        cache = None if args.no_cache or (args.seed is None and not args.resume) else ResultCache(args.cache, args.cache_max_mb << 20)
+        reuse = cache is not None and not (targets or args.placements or args.histograms or args.instrument)
+
+        for fmt_name in FORMATS:
+            done = min(writer.completed(fmt_name), args.n)
+            ins = reports.get(fmt_name)
+            key = result_key(cache_fields(fmt_name, run, args.engine)) if cache is not None else None
+
+            # Cached editions go into the chunk store like computed ones; only the editions beyond them are simulated
+            cached = cache.get(key, METRICS) if reuse else None
+            if cached is not None and len(cached) > done:
+                top = min(len(cached), args.n)
+                for lo in range(done, top, args.chunk_size):
+                    hi = min(lo + args.chunk_size, top)
+                    writer.write_chunk(fmt_name, lo, hi, {"format": [fmt_name] * (hi - lo), **dict(zip(METRICS, cached[lo:hi].T))})
+                print(f"\n{fmt_name}: editions {done}..{top - 1} from the cache ({key[:10]})")
+                done = top
+                if done >= args.n: continue
+
+            store = open_placements(out_dir / "placements" / (fmt_name + EXTENSION), fmt_name, run, done) if args.placements else None
+            hist = open_histogram(hist_dir / f"{fmt_name}.json", fmt_name, done, store) if args.histograms else None
+
+            # Streaming estimates, primed from stored chunks when resuming
+            acc = {m: RunningStats() for m in METRICS}
+            if targets:
+                for columns in writer.read_chunks(fmt_name):
+                    for m in METRICS: acc[m].update(columns[m])
+                if done >= args.min_n and precise_enough(acc, targets, args.confidence): continue
+
+            print(f"\nRunning {'up to ' if targets else ''}{args.n} editions of {fmt_name} …" + (f" (resuming at {done})" if done else ""))
+
+            # Chunks come back in edition order, so the output does not depend on the worker count
+            with tqdm(total = args.n, initial = done) as bar, (ins or NULL_INSTRUMENTATION).timer("wall"):
+                chunks = run_chunks(pool, fmt_name, done, args.n, step, args.workers, entropy, ins, args.crn, args.antithetic, args.engine)
+                for lo, hi, rows, positions in chunks:
+                    values = np.array(rows, dtype = float).reshape(-1, len(METRICS))
+
+                    # Placements first: the checkpoint below is what makes the chunk count as done
+                    if store is not None: store.append(positions)
+                    writer.write_chunk(fmt_name, lo, hi, {"format": [fmt_name] * len(rows), **dict(zip(METRICS, values.T))})
+                    if hist is not None:
+                        hist.update(positions)
+                        hist.to_json(hist_dir / f"{fmt_name}.json")
+                    bar.update(hi - lo)
+
+                    if not targets: continue
+                    for m, column in zip(METRICS, values.T): acc[m].update(column)
+                    if hi >= args.min_n and precise_enough(acc, targets, args.confidence):
+                        chunks.close()
+                        break
+
+            # Write through: the entry keeps the longest run of these inputs
+            if cache is not None: cache.put(key, cache_fields(fmt_name, run, args.engine), METRICS, stored_rows(writer, fmt_name))
+    finally:
+        if pool is not None: pool.shutdown(cancel_futures = True)
+        if pairwise is not None: pairwise.unlink()
 
     # Display summary
+    stats = summarize(writer)
     print("\n=== Monte-Carlo summary (mean ± SD) ===")
+    print(format_summary(stats))
 
-    summary = (df.groupby("format")
-                 .agg({"rho":      ["mean", "std"],
-                       "err":      ["mean", "std"],
-                       "dead_pct": ["mean", "std"]})
-                 .round(3))
+    if targets:
+        print(f"\n=== Precision ({args.confidence:.0%} CI half-width) ===")
+        print(format_precision(stats, targets, args.confidence, args.n))
 
-    print(summary.to_markdown())
-    print(f"\nRaw data saved → {out_dir/'batch_metrics.csv'}")
+    if args.crn or args.antithetic:
+        print(f"\n=== Paired differences ({args.confidence:.0%} CI, VRF = variance reduction vs independent editions) ===")
+        print(format_comparison(writer, args.antithetic, args.confidence))
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
+    # Save results: a single CSV for CSV runs, otherwise the columnar parts are the output
+    if args.file_format == "csv":
+        writer.to_csv(out_dir / "batch_metrics.csv", keys = list(FORMATS))
+        print(f"\nRaw data saved → {out_dir/'batch_metrics.csv'}")
+    else:
+        print(f"\nRaw data saved → {writer.directory} ({args.file_format} parts)")
+    if args.placements: print(f"Placements saved → {out_dir/'placements'}")
+
+    if args.histograms:
+        for fmt_name in FORMATS:
+            path = hist_dir / f"{fmt_name}.json"
+            if path.exists(): PositionHistogram.from_json(path).to_csv(hist_dir / f"{fmt_name}.csv")
+        print(f"Position histograms saved → {hist_dir} (JSON counts, CSV probabilities)")
+
+    if reports:
+        # Stage timers are summed over workers; "wall" is the elapsed time of the whole format
+        report = {"seed": entropy, "n": args.n, "workers": args.workers, "formats": {f: r.to_dict() for f, r in reports.items()}}
+        (out_dir / "instrumentation.json").write_text(json.dumps(report, indent = 1) + "\n")
+        print(f"Instrumentation saved → {out_dir/'instrumentation.json'}")
+
+def add_arguments(parser):
+    """ Register batch_sim's command-line options on `parser` (shared with the tournament_sim CLI). """
     parser.add_argument("--n", type=int, default = 1000, help = "repetitions per format (default 1000)")
     parser.add_argument("--rating_csv", required = True, help = "CSV with columns: Country, Rating")
+    parser.add_argument("--workers", type = int, default = 1, help = "worker processes (default 1 = run in-process)")
+    parser.add_argument("--seed", type = int, default = None, help = "root seed; same seed gives identical results for any --workers")
+    parser.add_argument("--chunk-size", type = int, default = 100_000, help = "editions per result chunk written to disk (default 100000)")
+    parser.add_argument("--file-format", choices = sorted(FILE_FORMATS), default = "csv", help = "format of the result chunks (parquet / arrow need pyarrow)")
+    parser.add_argument("--resume", action = "store_true", help = "continue from the last completed chunk in results/batch_parts")
+    parser.add_argument("--target-ci", nargs = "+", metavar = "[METRIC=]HW", help = "adaptive mode: stop each format once the CI half-width of the metric (default rho) is <= HW; --n becomes the per-format maximum")
+    parser.add_argument("--confidence", type = float, default = 0.95, help = "confidence level for --target-ci and the paired comparison (default 0.95)")
+    parser.add_argument("--min-n", type = int, default = 200, help = "editions per format before --target-ci may stop (default 200)")
+    parser.add_argument("--check-every", type = int, default = 250, help = "editions between precision checks in adaptive mode (default 250)")
+    parser.add_argument("--crn", action = "store_true", help = "common random numbers: all formats play edition e on the same per-fixture streams, for paired comparisons")
+    parser.add_argument("--antithetic", action = "store_true", help = "antithetic variates: editions 2m and 2m+1 play their fixtures on mirrored streams")
+    parser.add_argument("--engine", choices = ENGINES, default = "object", help = "object: one edition at a time through the format classes; plan: compiled format specs, many editions per call (default object)")
+    parser.add_argument("--placements", action = "store_true", help = "also store every edition's finishing positions in results/placements/<format>.plc (memory-mapped, see storage.placement_store)")
+    parser.add_argument("--histograms", action = "store_true", help = "count every team's finishing positions and bracket rounds reached per format into results/histograms/ (JSON counts, CSV odds)")
+    parser.add_argument("--instrument", action = "store_true", help = "collect stage timings and match-engine counters into results/instrumentation.json")
+    parser.add_argument("--cache", default = DEFAULT_CACHE, help = f"result cache directory; seeded runs reuse and extend earlier runs of the same inputs (default {DEFAULT_CACHE})")
+    parser.add_argument("--cache-max-mb", type = int, default = DEFAULT_CACHE_MB, help = f"size bound of the result cache, least recently used entries are evicted (default {DEFAULT_CACHE_MB})")
+    parser.add_argument("--no-cache", action = "store_true", help = "neither read nor write the result cache")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    add_arguments(parser)
     main(parser.parse_args())
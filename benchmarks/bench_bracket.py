@@ -0,0 +1,117 @@
+"""
+Knockout brackets: object path (KnockoutStage / PlayoffTournament, one edition
+per call) versus BracketEngine (n editions per call).
+
+Checks that fifa2026_round_of_32 builds the same bracket as
+KnockoutStage._build_fifa2026_round_of_32, times both paths for the FIFA
+round of 32 and the rating-seeded playoff, and compares per-team champion
+probabilities of the playoff as two-sample z-scores. Exits with status 1 on
+any layout mismatch or if a |z| exceeds --max-z (default 4.5).
+
+    python -m benchmarks.bench_bracket [--n 100000] [--max-z 4.5]
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.common import load_ratings, best_of
+from core.bracket import BracketEngine, fifa2026_round_of_32, playoff_seeds
+from core.knockout_stage import KnockoutStage
+from core.match_engine import MatchEngine
+from core.team_table import TeamTable
+from formats.fifa2026_group_stage import FIFA2026GroupStage
+from formats.fifa2026_batch_group_stage import FIFA2026BatchGroupStage
+from formats.playoff import PlayoffTournament
+
+def check_fifa_layout(names, ratings, editions, seed):
+    """ Compare both round-of-32 builders on object-path group stages; return the number of mismatches. """
+    table = TeamTable(names, ratings.astype(int))
+    engine = MatchEngine(rng = np.random.default_rng(seed))
+    mismatches = 0
+
+    for _ in range(editions):
+        table.reset()
+        stage = FIFA2026GroupStage(list(table.teams), engine)
+        stage.simulate()
+        qualified = stage.get_qualified_teams()
+
+        ranked = np.zeros((1, 12, 4), dtype = np.int64)
+        for t in table.teams: ranked[0, ord(t.group) - 65, t.group_pos - 1] = t.index
+        best_third_groups = np.array([[ord(t.group) - 65 for t in qualified[24:]]])
+
+        expected = [t.index for t in KnockoutStage(qualified, engine)._build_fifa2026_round_of_32()]
+        mismatches += int(not np.array_equal(fifa2026_round_of_32(ranked, best_third_groups)[0], expected))
+
+    return mismatches
+
+def object_knockouts(names, ratings, n, seed):
+    """ Time n FIFA knockouts and n playoffs through the object path; return playoff champion counts too. """
+    table = TeamTable(names, ratings.astype(int))
+    engine = MatchEngine(rng = np.random.default_rng(seed))
+    stage = FIFA2026GroupStage(list(table.teams), engine)
+    stage.simulate()
+    qualified = stage.get_qualified_teams()
+
+    start = time.perf_counter()
+    for _ in range(n): KnockoutStage(qualified, engine).simulate()
+    t_fifa = time.perf_counter() - start
+
+    champions = np.zeros(len(names))
+    start = time.perf_counter()
+    for _ in range(n):
+        po = PlayoffTournament(list(table.teams), engine)
+        po.run()
+        champions[po.winner.index] += 1
+    t_playoff = time.perf_counter() - start
+
+    return t_fifa, t_playoff, champions
+
+def main(args):
+    """ Run the layout check, the timings and the playoff distribution comparison. """
+    names, ratings = load_ratings(args.rating_csv)
+    mismatches = check_fifa_layout(names, ratings, args.n_check, args.seed)
+    print(f"FIFA round-of-32 layout mismatches: {mismatches} / {args.n_check}")
+
+    t_fifa, t_playoff, champions_o = object_knockouts(names, ratings, args.n_object, args.seed)
+
+    engine = MatchEngine(rng = np.random.default_rng(args.seed))
+    groups = FIFA2026BatchGroupStage(ratings, engine)
+    groups.simulate(args.n)
+    fifa_seeds = fifa2026_round_of_32(groups.get_rankings(), groups.best_third_groups)
+    po_seeds = playoff_seeds(ratings, args.n)
+
+    bracket = BracketEngine(ratings, engine)
+    t_fifa_b = best_of(lambda: bracket.run(fifa_seeds), args.repeat)
+    t_po_b = best_of(lambda: bracket.run(po_seeds), args.repeat)
+
+    print(f"\n{'bracket':10} | {'object ed/s':>12} | {'batch ed/s':>12}")
+    print(f"{'FIFA R32':10} | {args.n_object / t_fifa:12,.0f} | {args.n / t_fifa_b:12,.0f}")
+    print(f"{'Playoff':10} | {args.n_object / t_playoff:12,.0f} | {args.n / t_po_b:12,.0f}")
+
+    bracket.run(po_seeds)
+    p_o = champions_o / args.n_object
+    p_b = np.bincount(bracket.champion, minlength = len(names)) / args.n
+
+    # Two-sample z per team, pooled SE floored at one title so teams that (almost) never win do not blow up
+    pooled = np.maximum((p_o * args.n_object + p_b * args.n) / (args.n_object + args.n), 1 / args.n_object)
+    z = (np.abs(p_o - p_b) / np.sqrt(pooled * (1 - np.minimum(pooled, 1 - 1e-12)) * (1 / args.n_object + 1 / args.n))).max()
+    print(f"\nPlayoff max |P(champion)| difference: {np.abs(p_o - p_b).max():.4f} (max |z| {z:.2f}){'  FAIL' if z > args.max_z else ''}")
+    for k in np.argsort(-p_b)[:5]: print(f"  {names[k]:15} object {p_o[k]:.3f} | batch {p_b[k]:.3f}")
+
+    if mismatches or z > args.max_z:
+        print(f"\nFAILED: {mismatches} layout mismatch(es), champion odds |z| {z:.2f} (max {args.max_z:g})")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type = int, default = 100_000, help = "batch editions")
+    parser.add_argument("--n_object", type = int, default = 5_000, help = "object-path editions")
+    parser.add_argument("--n_check", type = int, default = 500, help = "editions for the layout check")
+    parser.add_argument("--repeat", type = int, default = 3)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--max-z", type = float, default = 4.5, help = "largest tolerated |z| of a champion-probability difference (default 4.5)")
+    parser.add_argument("--rating_csv", default = "data/teams.csv")
+    main(parser.parse_args())
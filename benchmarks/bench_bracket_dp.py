@@ -0,0 +1,98 @@
+"""
+Exact bracket analysis (analysis.bracket_dp) against Monte Carlo.
+
+Plays the rating-seeded Playoff bracket and one fixed FIFA 2026 round-of-32
+layout --n times through the object path and compares champion
+probabilities, expected positions and mean Spearman ρ with the exact values,
+reporting the largest deviation in Monte Carlo standard errors, plus both
+run times. Exits with status 1 if any |z| exceeds --max-z (default 4.5:
+about 100 estimates are checked, so pure noise passes).
+
+    python -m benchmarks.bench_bracket_dp [--n 20000] [--seed 0] [--max-z 4.5]
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from analysis.bracket_dp import analyze_bracket, bracket_of
+from batch_sim import corr_eval, get_rankings_from_knockout
+from core.team_table import TeamTable
+from core.match_engine import MatchEngine
+from core.knockout_stage import KnockoutStage
+from formats.playoff import PlayoffTournament
+from formats.fifa2026 import FIFA2026Tournament
+
+def play_playoff(table, rng):
+    """ Finishing positions of one Playoff edition, in table order. """
+    tour = PlayoffTournament(table.teams, MatchEngine(rng = rng))
+    tour.run()
+    return tour.get_rankings()
+
+def play_knockout(qualified, rng):
+    """ Finishing positions of one knockout stage over a fixed field, in table order. """
+    knockout = KnockoutStage(qualified, MatchEngine(rng = rng))
+    knockout.simulate()
+    return get_rankings_from_knockout(knockout)
+
+def compare(name, table, exact, play, n, rng, max_z):
+    """ Run n editions with play(rng) and print the largest deviations from the exact result; returns the number beyond max_z. """
+    start = time.perf_counter()
+    positions = np.zeros((n, len(table)), dtype = np.int16)
+    for e in range(n): positions[e, [t.index for t in play(rng)]] = np.arange(1, exact["teams"].size + 1)
+    t_mc = time.perf_counter() - start
+
+    pos = positions[:, exact["teams"]].astype(float)
+    champ = pos == 1
+    rho = corr_eval.evaluate_batch(positions, table.rating)["correlation"]
+
+    def worst(estimate, sem, truth):
+        z = np.abs(estimate - truth) / np.maximum(sem, 1e-12)
+        return np.abs(estimate - truth).max(), z.max()
+
+    rows = [
+        # Binomial SE, floored at p = 1/n so a single title of a near-hopeless team does not count as a mismatch
+        ("champion probability", *worst(champ.mean(0), np.sqrt(np.maximum(exact["champion"], 1 / n) * (1 - exact["champion"]) / n), exact["champion"])),
+        ("expected position", *worst(pos.mean(0), pos.std(0) / np.sqrt(n), exact["expected_position"])),
+        ("mean Spearman rho", *worst(rho.mean(), rho.std() / np.sqrt(n), exact["expected_rho"])),
+    ]
+
+    print(f"\n{name}: {n} Monte Carlo editions in {t_mc:.2f} s")
+    for label, diff, z in rows: print(f"  {label:22} | max |MC - exact| {diff:.4f} | max |z| {z:.2f}{'  FAIL' if z > max_z else ''}")
+    print(f"  exact rho {exact['expected_rho']:.4f} vs MC {rho.mean():.4f}")
+    return sum(z > max_z for *_, z in rows)
+
+def main(args):
+    """ Validate both bracket layouts. """
+    table = TeamTable.from_csv(args.rating_csv)
+    rng = np.random.default_rng(args.seed)
+
+    # Playoff: top 32 by rating, 1v2, 3v4, ...; same-round losers ranked by rating
+    bracket = np.argsort(-table.rating, kind = "stable")[:32]
+    start = time.perf_counter()
+    exact = analyze_bracket(table.rating, bracket, ranking = "rating")
+    print(f"Playoff exact analysis: {1000 * (time.perf_counter() - start):.1f} ms")
+    failed = compare("Playoff", table, exact, lambda g: play_playoff(table, g), args.n, rng, args.max_z)
+
+    # FIFA 2026: one group stage fixes the round-of-32 layout; losers ranked by match order
+    tour = FIFA2026Tournament(table.teams, MatchEngine(rng = rng))
+    tour.run()
+    qualified = tour.get_qualified_teams()
+    start = time.perf_counter()
+    exact = analyze_bracket(table.rating, bracket_of(KnockoutStage(qualified, MatchEngine())), ranking = "match")
+    print(f"\nFIFA 2026 knockout exact analysis: {1000 * (time.perf_counter() - start):.1f} ms")
+    failed += compare("FIFA 2026 knockout", table, exact, lambda g: play_knockout(qualified, g), args.n, rng, args.max_z)
+
+    if failed:
+        print(f"\n{failed} check(s) deviate from the exact analysis by more than {args.max_z:g} standard errors")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type = int, default = 20_000)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--max-z", type = float, default = 4.5, help = "largest tolerated |MC - exact| in standard errors (default 4.5)")
+    parser.add_argument("--rating_csv", default = "data/teams.csv")
+    main(parser.parse_args())
@@ -0,0 +1,54 @@
+"""
+Variance reduction of common random numbers and antithetic variates.
+
+Plays every comparison with independent editions, with --crn style shared
+streams and with mirrored (antithetic) pairs, and reports the paired
+difference of Spearman ρ, its half-width and the variance reduction factor
+(VRF, variance of independent editions / variance achieved). Besides the
+three batch_sim formats it compares the two Swiss pairing rules, which share
+most fixtures and so show what the shared streams buy for variants of one format.
+
+    python -m benchmarks.bench_common_random [--n 1000] [--seed 0]
+"""
+
+import argparse
+import functools
+
+import numpy as np
+
+from batch_sim import FORMATS, corr_eval, edition_streams, play_one
+from core.team_table import TeamTable
+from formats.swiss import SwissTournament
+from evaluators.paired_difference import PairedDifferenceEvaluator
+
+# name -> tournament class; position in this dict keys the independent streams
+VARIANTS = {**FORMATS, "Swiss8R-paired": functools.partial(SwissTournament, pairing = "swiss")}
+
+COMPARISONS = [("FIFA2026", "Playoff"), ("FIFA2026", "Swiss8R"), ("Playoff", "Swiss8R"), ("Swiss8R", "Swiss8R-paired")]
+
+def rho(name, n, seed, table, crn, antithetic):
+    """ Spearman ρ of n editions of one variant. """
+    idx = list(VARIANTS).index(name)
+    positions = []
+    for e in range(n):
+        rng, streams = edition_streams(seed, idx, e, crn, antithetic)
+        positions.append(play_one(VARIANTS[name], None, rng, table = table, streams = streams)[0])
+    return corr_eval.evaluate_batch(np.array(positions), table.rating)["correlation"]
+
+def main(args):
+    """ Print the paired difference and VRF of every comparison under each sampling scheme. """
+    table = TeamTable.from_csv(args.rating_csv)
+    schemes = {"independent": (False, False), "crn": (True, False), "antithetic": (False, True), "crn+antithetic": (True, True)}
+
+    print(f"{'comparison':26} | {'scheme':14} | {'rho diff':>9} | {'± 95%':>7} | {'VRF':>5}")
+    for a, b in COMPARISONS:
+        for scheme, (crn, antithetic) in schemes.items():
+            res = PairedDifferenceEvaluator(antithetic).evaluate(rho(a, args.n, args.seed, table, crn, antithetic), rho(b, args.n, args.seed, table, crn, antithetic))
+            print(f"{a + ' - ' + b:26} | {scheme:14} | {res['mean_diff']:+9.4f} | {res['half_width']:7.4f} | {res['vrf']:5.2f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type = int, default = 1000)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--rating_csv", default = "data/teams.csv")
+    main(parser.parse_args())
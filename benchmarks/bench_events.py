@@ -0,0 +1,45 @@
+"""
+Cost of per-match reporting in batch runs: batch_sim.run_one with the default
+NullSink versus a ConsoleSink (the old print-per-match behaviour) whose output
+is sent to /dev/null.
+
+    python -m benchmarks.bench_events [--n 200]
+"""
+
+import argparse
+import os
+from contextlib import redirect_stdout
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import best_of
+from batch_sim import FORMATS, run_one
+from core.events import NULL_SINK, ConsoleSink
+
+def run_batch(tour_cls, ratings_df, n, seed, events):
+    """ Play n editions of one format with the given sink. """
+    rng = np.random.default_rng(seed)
+    for _ in range(n): run_one(tour_cls, ratings_df, rng, events = events)
+
+def main(args):
+    """ Time every format with both sinks and print editions per second. """
+    ratings_df = pd.read_csv(args.rating_csv)
+
+    print(f"{'format':10} | {'console ed/s':>12} | {'null ed/s':>10} | speedup")
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        rows = []
+        for fmt_name, tour_cls in FORMATS.items():
+            t_console = best_of(lambda: run_batch(tour_cls, ratings_df, args.n, args.seed, ConsoleSink()), args.repeat)
+            t_null = best_of(lambda: run_batch(tour_cls, ratings_df, args.n, args.seed, NULL_SINK), args.repeat)
+            rows.append((fmt_name, args.n / t_console, args.n / t_null, t_console / t_null))
+
+    for fmt_name, console, null, speedup in rows: print(f"{fmt_name:10} | {console:12,.0f} | {null:10,.0f} | {speedup:.2f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type = int, default = 200, help = "editions per format")
+    parser.add_argument("--repeat", type = int, default = 3)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--rating_csv", default = "data/teams.csv")
+    main(parser.parse_args())
@@ -0,0 +1,92 @@
+"""
+FIFA 2026 group stage: object path (FIFA2026GroupStage, one edition per call)
+versus FIFA2026BatchGroupStage (n editions per call).
+
+Prints group stages per second for both paths and compares per-team
+group-win and qualification probabilities between them as two-sample
+z-scores; exits with status 1 if any |z| exceeds --max-z (default 4.5).
+
+    python -m benchmarks.bench_fifa2026_batch [--n 100000] [--max-z 4.5]
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.common import load_ratings, best_of
+from core.match_engine import MatchEngine
+from core.team_table import TeamTable
+from formats.fifa2026_group_stage import FIFA2026GroupStage
+from formats.fifa2026_batch_group_stage import FIFA2026BatchGroupStage
+
+def object_path(names, ratings, n, sampler, seed):
+    """ Run n object-path group stages; return (group-win, qualified) counts per team. """
+    table = TeamTable(names, ratings.astype(int))
+    engine = MatchEngine(sampler = sampler, rng = np.random.default_rng(seed))
+    wins = np.zeros(len(names))
+    qual = np.zeros(len(names))
+
+    for _ in range(n):
+        table.reset()
+        stage = FIFA2026GroupStage(list(table.teams), engine)
+        stage.simulate()
+        for ranked in stage.get_rankings().values(): wins[ranked[0].index] += 1
+        for t in stage.get_qualified_teams(): qual[t.index] += 1
+
+    return wins, qual
+
+def max_z(p1, n1, p2, n2):
+    """ Largest two-sample |z| of per-team proportions (pooled SE, floored at one hit so rare events do not blow up). """
+    pooled = np.maximum((p1 * n1 + p2 * n2) / (n1 + n2), 1 / min(n1, n2))
+    se = np.sqrt(pooled * (1 - np.minimum(pooled, 1 - 1e-12)) * (1 / n1 + 1 / n2))
+    return float((np.abs(p1 - p2) / se).max())
+
+def main(args):
+    """ Time both paths and compare their per-team probabilities. """
+    names, ratings = load_ratings(args.rating_csv)
+    batch = FIFA2026BatchGroupStage(ratings, MatchEngine(sampler = args.sampler, rng = np.random.default_rng(args.seed)))
+
+    start = time.perf_counter()
+    wins_o, qual_o = object_path(names, ratings, args.n_object, args.sampler, args.seed)
+    t_object = time.perf_counter() - start
+
+    batch.simulate(args.chunk) # Warm caches
+    t_batch = best_of(lambda: batch.simulate(args.chunk), args.repeat)
+
+    print(f"object path : {args.n_object / t_object:>12,.0f} group stages/s")
+    print(f"batch path  : {args.chunk / t_batch:>12,.0f} group stages/s  (sampler = {args.sampler})")
+
+    # Distribution check over args.n batch editions
+    wins_b = np.zeros(len(names))
+    qual_b = np.zeros(len(names))
+    for lo in range(0, args.n, args.chunk):
+        batch.simulate(min(args.chunk, args.n - lo))
+        np.add.at(wins_b, batch.get_rankings()[:, :, 0].ravel(), 1)
+        np.add.at(qual_b, batch.get_qualified_teams().ravel(), 1)
+
+    p_wo, p_qo = wins_o / args.n_object, qual_o / args.n_object
+    p_wb, p_qb = wins_b / args.n, qual_b / args.n
+    z_win, z_qual = max_z(p_wo, args.n_object, p_wb, args.n), max_z(p_qo, args.n_object, p_qb, args.n)
+    print(f"\nmax |P(win group)| difference : {np.abs(p_wo - p_wb).max():.4f}  (max |z| {z_win:.2f}){'  FAIL' if z_win > args.max_z else ''}")
+    print(f"max |P(qualify)|   difference : {np.abs(p_qo - p_qb).max():.4f}  (max |z| {z_qual:.2f}){'  FAIL' if z_qual > args.max_z else ''}")
+
+    print(f"\n{'team':15} {'win obj':>8} {'win bat':>8} {'qual obj':>9} {'qual bat':>9}")
+    for k in range(0, len(names), 6): print(f"{names[k]:15} {p_wo[k]:8.3f} {p_wb[k]:8.3f} {p_qo[k]:9.3f} {p_qb[k]:9.3f}")
+
+    if max(z_win, z_qual) > args.max_z:
+        print(f"\nObject and batch paths differ by more than {args.max_z:g} standard errors")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type = int, default = 100_000, help = "batch editions for the distribution check")
+    parser.add_argument("--n_object", type = int, default = 5_000, help = "object-path editions")
+    parser.add_argument("--chunk", type = int, default = 20_000, help = "editions per batch call")
+    parser.add_argument("--sampler", default = "rejection", choices = ("rejection", "exact"))
+    parser.add_argument("--repeat", type = int, default = 3)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--max-z", type = float, default = 4.5, help = "largest tolerated |z| of a per-team probability difference (default 4.5)")
+    parser.add_argument("--rating_csv", default = "data/teams.csv")
+    main(parser.parse_args())
@@ -0,0 +1,94 @@
+"""
+Exact group-stage analysis (analysis.group_enumeration) against Monte Carlo.
+
+Fixes one draw (pots by rating, group g gets the g-th team of every pot),
+plays its group stage --n times through the object path with the "exact"
+score sampler (the enumerator's score model) and compares every team's
+finishing-position and qualification probabilities with the enumerated
+values, reporting the largest deviation in Monte Carlo standard errors, plus
+both run times and the cost of a cached re-analysis. Exits with status 1 if
+any |z| exceeds --max-z (default 4.5).
+
+    python -m benchmarks.bench_group_enumeration [--n 5000] [--samples 2000] [--seed 0] [--max-z 4.5]
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from analysis.group_enumeration import GroupEnumerator
+from core.team_table import TeamTable
+from core.match_engine import MatchEngine
+from core.group_stage import GroupStage
+from formats.fifa2026_group_stage import FIFA2026GroupStage
+
+def fixed_draw(ratings):
+    """ Team indices of 12 groups: group g holds the g-th team of each rating pot. """
+    order = np.argsort(-np.asarray(ratings), kind = "stable")
+    return [[int(order[12 * pot + g]) for pot in range(4)] for g in range(12)]
+
+def play(table, groups, rng):
+    """ One group stage on the fixed draw: (group positions, qualified flags), both in table order. """
+    class FixedDraw(GroupStage):
+        def _create_groups(self):
+            return {chr(65 + g): [table.teams[t] for t in teams] for g, teams in enumerate(groups)}
+
+    table.reset()
+    stage = FIFA2026GroupStage(table.teams, MatchEngine(rng = rng, sampler = "exact"))
+    stage.stage = FixedDraw(table.teams, stage.stage.match_engine)
+    stage.simulate()
+
+    positions = np.zeros(len(table), dtype = np.int8)
+    for ranked in stage.rankings.values(): positions[[t.index for t in ranked]] = np.arange(1, 5)
+    qualified = np.zeros(len(table), dtype = bool)
+    qualified[[t.index for t in stage.get_qualified_teams()]] = True
+    return positions, qualified
+
+def main(args):
+    """ Compare the enumerated draw with n simulated group stages. """
+    table = TeamTable.from_csv(args.rating_csv)
+    groups = fixed_draw(table.rating)
+
+    enum = GroupEnumerator(table.rating, samples = args.samples, seed = args.seed)
+    start = time.perf_counter()
+    exact = enum.analyze_draw(groups)
+    t_exact = time.perf_counter() - start
+    start = time.perf_counter()
+    enum.analyze_draw(groups)
+    t_cached = time.perf_counter() - start
+
+    rng = np.random.default_rng(args.seed)
+    start = time.perf_counter()
+    runs = [play(table, groups, rng) for _ in range(args.n)]
+    t_mc = time.perf_counter() - start
+
+    positions = np.array([p for p, _ in runs])
+    qualified = np.array([q for _, q in runs])
+
+    def worst(hits, truth):
+        est = hits.mean(axis = 0)
+
+        # Binomial SE, floored at p = 1/n so a single hit of a near-impossible event does not count as a mismatch
+        sem = np.sqrt(np.maximum(truth, 1 / args.n) * np.clip(1 - truth, 1 / args.n, None) / args.n)
+        return np.abs(est - truth).max(), (np.abs(est - truth) / sem).max()
+
+    print(f"enumeration {1000 * t_exact:.0f} ms (cached {1000 * t_cached:.1f} ms) | Monte Carlo {args.n} editions {t_mc:.1f} s")
+    checks = [(f"P(position {k + 1})", *worst(positions == k + 1, exact["positions"][:, k])) for k in range(4)]
+    checks.append(("P(qualify)", *worst(qualified, exact["qualify"])))
+    for label, diff, z in checks: print(f"  {label:15} | max |MC - exact| {diff:.4f} | max |z| {z:.2f}{'  FAIL' if z > args.max_z else ''}")
+
+    failed = sum(z > args.max_z for *_, z in checks)
+    if failed:
+        print(f"\n{failed} check(s) deviate from the enumeration by more than {args.max_z:g} standard errors")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type = int, default = 5000)
+    parser.add_argument("--samples", type = int, default = 2000, help = "conditional score samples per fixture and outcome")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--max-z", type = float, default = 4.5, help = "largest tolerated |MC - exact| in standard errors (default 4.5)")
+    parser.add_argument("--rating_csv", default = "data/teams.csv")
+    main(parser.parse_args())
@@ -0,0 +1,62 @@
+"""
+Import-time regression gate for the headless simulation path.
+
+Each target module is imported in a fresh interpreter. The script reports the
+wall time above a bare `python -c pass` and fails (exit status 1) if a target
+pulls in one of the heavy reporting libraries or exceeds --max-ms.
+
+    python -m benchmarks.bench_import_time [--max-ms 250] [--repeat 5]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+# Modules that must stay importable with NumPy alone
+TARGETS = ["tournament_sim.cli", "batch_sim", "main", "core.match_engine", "core.bracket", "formats.fifa2026", "evaluators.elo_correlation", "storage.chunked_writer"]
+
+# Libraries that only reporting / plotting code may load
+HEAVY = ["pandas", "scipy", "matplotlib", "seaborn", "tqdm", "tabulate"]
+
+def run_python(code):
+    """ Run `code` in a fresh interpreter; return (wall seconds, stdout). """
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", code], capture_output = True, text = True, check = True).stdout
+    return time.perf_counter() - start, out
+
+def import_ms(module, repeat):
+    """ Best-of-`repeat` import time of `module` in milliseconds, above interpreter start-up. """
+    base = min(run_python("pass")[0] for _ in range(repeat))
+    best = min(run_python(f"import {module}")[0] for _ in range(repeat))
+    return 1000 * (best - base)
+
+def loaded_heavy(module):
+    """ Heavy libraries present in sys.modules after importing `module`. """
+    _, out = run_python(f"import sys, json, {module}; print(json.dumps(sorted(sys.modules)))")
+    loaded = set(json.loads(out))
+    return [m for m in HEAVY if m in loaded]
+
+def main(args):
+    """ Measure every target and exit non-zero if any breaks the budget. """
+    failed = False
+    print(f"{'module':28} | {'import ms':>9} | heavy imports")
+
+    for module in args.modules or TARGETS:
+        ms = import_ms(module, args.repeat)
+        heavy = loaded_heavy(module)
+        bad = heavy or ms > args.max_ms
+        failed |= bool(bad)
+        print(f"{module:28} | {ms:9.1f} | {', '.join(heavy) or '-'}{'  FAIL' if bad else ''}")
+
+    if failed:
+        print(f"\nImport budget exceeded (max {args.max_ms:.0f} ms, no {', '.join(HEAVY)})")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("modules", nargs = "*", help = "modules to check (default: the headless simulation path)")
+    parser.add_argument("--max-ms", type = float, default = 250.0, help = "import-time budget per module in ms (default 250)")
+    parser.add_argument("--repeat", type = int, default = 5, help = "fresh interpreters per measurement (default 5)")
+    main(parser.parse_args())
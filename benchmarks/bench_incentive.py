@@ -0,0 +1,74 @@
+"""
+Incentive-compatibility evaluation of FIFA 2026 group stages: the lookup
+table (IncentiveCompatibilityEvaluator.evaluate_batch / evaluate) versus the
+original per-edition replay with its points rule (safe from 6 points, out
+below 4 possible points, both teams the same status).
+
+Group results come from FIFA2026BatchGroupStage. Reports editions per second
+of each path and the share of low-incentive fixtures under each rule, plus
+the exact rule with only the top two places counted as qualifying.
+
+    python -m benchmarks.bench_incentive [--n 20000] [--seed 0]
+"""
+
+import argparse
+from collections import defaultdict
+
+import numpy as np
+
+from benchmarks.common import best_of, load_ratings
+from core.match_engine import MatchEngine
+from formats.fifa2026_batch_group_stage import FIFA2026BatchGroupStage, FIXTURES
+from evaluators.incentive_compatibility import IncentiveCompatibilityEvaluator
+
+def replay_original(goals):
+    """ The original replay: low-incentive fixtures per edition under the old points rule. """
+    low = np.zeros(goals.shape[0], dtype = np.int64)
+
+    for e, edition in enumerate(goals.tolist()):
+        for group in edition:
+            pts, played = defaultdict(int), defaultdict(int)
+            for (a, b), (g1, g2) in zip(FIXTURES.tolist(), group):
+                def status(t):
+                    if pts[t] >= 6: return "safe"
+                    if pts[t] + 3 * (3 - played[t]) < 4: return "out"
+                    return "live"
+
+                s1, s2 = status(a), status(b)
+                low[e] += s1 == s2 and s1 in {"safe", "out"}
+
+                pts[a] += 3 if g1 > g2 else 1 if g1 == g2 else 0
+                pts[b] += 3 if g2 > g1 else 1 if g1 == g2 else 0
+                played[a] += 1
+                played[b] += 1
+    return low
+
+def main(args):
+    """ Time both paths and compare their classifications. """
+    _, ratings = load_ratings(args.rating_csv)
+    stage = FIFA2026BatchGroupStage(ratings, MatchEngine(rng = np.random.default_rng(args.seed)))
+    stage.simulate(args.n)
+    goals = stage.goals
+
+    ic_eval = IncentiveCompatibilityEvaluator()
+    ic_eval.evaluate_batch(goals[:1]) # Build the status table outside the timing
+
+    new = ic_eval.evaluate_batch(goals)["low_incentive"]
+    top_two = IncentiveCompatibilityEvaluator(live_places = 2).evaluate_batch(goals)["low_incentive"]
+    old = replay_original(goals)
+    t_new = best_of(lambda: ic_eval.evaluate_batch(goals), args.repeat)
+    t_old = best_of(lambda: replay_original(goals), 1)
+
+    print(f"{'path':22} | {'editions/s':>12} | low-incentive %")
+    print(f"{'original replay':22} | {args.n / t_old:12,.0f} | {100 * old.mean() / 72:.2f}")
+    print(f"{'lookup table (batch)':22} | {args.n / t_new:12,.0f} | {100 * new.mean() / 72:.2f}")
+    print(f"{'  top two only':22} | {'':>12} | {100 * top_two.mean() / 72:.2f}")
+    print(f"\nspeedup {t_old / t_new:.0f}x; editions with a different count: {(new != old).mean():.1%}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type = int, default = 20_000)
+    parser.add_argument("--repeat", type = int, default = 3)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--rating_csv", default = "data/teams.csv")
+    main(parser.parse_args())
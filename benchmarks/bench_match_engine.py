@@ -0,0 +1,79 @@
+"""
+Throughput of MatchEngine.simulate_match (one fixture per call) versus
+MatchEngine.simulate_matches (one array of fixtures per call), plus a quick
+statistical side-by-side of the two paths.
+
+    python -m benchmarks.bench_match_engine [--n 200000]
+"""
+
+import argparse
+
+import numpy as np
+
+from benchmarks.common import load_ratings, best_of
+from core.team import Team
+from core.match_engine import MatchEngine
+
+def random_fixtures(ratings, n, seed):
+    """ Draw n random (distinct) pairings from the ratings table. """
+    rng = np.random.default_rng(seed)
+    i = rng.integers(0, len(ratings), n)
+    j = (i + rng.integers(1, len(ratings), n)) % len(ratings)
+    return ratings[i], ratings[j]
+
+def run_scalar(engine, r1, r2, is_knockout):
+    """ Play every fixture through simulate_match and collect the same arrays as the batch path. """
+    teams = {r: Team(str(r), r) for r in np.unique(np.concatenate([r1, r2]))}
+    winners = np.empty(len(r1), dtype = np.int8)
+    goals = np.empty((len(r1), 2), dtype = np.int64)
+    pens = np.empty(len(r1), dtype = bool)
+
+    for k, (a, b) in enumerate(zip(r1, r2)):
+        t1, t2 = teams[a], teams[b]
+        winner, score, pen = engine.simulate_match(t1, t2, is_knockout = is_knockout)
+        winners[k] = -1 if winner is None else (0 if winner is t1 else 1)
+        goals[k] = score
+        pens[k] = pen
+
+    return winners, goals, pens
+
+def describe(winners, goals, pens):
+    """ Summary statistics used to compare the two paths. """
+    return {
+        "P(team1)": np.mean(winners == 0),
+        "P(draw)": np.mean(winners == -1),
+        "P(team2)": np.mean(winners == 1),
+        "mean g1": goals[:, 0].mean(),
+        "mean g2": goals[:, 1].mean(),
+        "P(pens)": pens.mean(),
+    }
+
+def main(args):
+    """ Time both paths and print throughput and summary statistics. """
+    _, ratings = load_ratings(args.rating_csv)
+    r1, r2 = random_fixtures(ratings, args.n, args.seed)
+    engine = MatchEngine(rng = np.random.default_rng(args.seed))
+
+    for is_knockout in (False, True):
+        label = "knockout" if is_knockout else "group"
+
+        n_scalar = min(args.n, args.n_scalar)
+        t_scalar = best_of(lambda: run_scalar(engine, r1[:n_scalar], r2[:n_scalar], is_knockout), args.repeat)
+        t_batch = best_of(lambda: engine.simulate_matches(r1, r2, is_knockout = is_knockout), args.repeat)
+
+        print(f"\n[{label}]")
+        print(f"simulate_match   : {n_scalar / t_scalar:>14,.0f} matches/s")
+        print(f"simulate_matches : {args.n / t_batch:>14,.0f} matches/s  ({(args.n / t_batch) / (n_scalar / t_scalar):.1f}x)")
+
+        scalar = describe(*run_scalar(engine, r1[:n_scalar], r2[:n_scalar], is_knockout))
+        batch = describe(*engine.simulate_matches(r1[:n_scalar], r2[:n_scalar], is_knockout = is_knockout))
+        for key in scalar: print(f"  {key:9} scalar {scalar[key]:.4f} | batch {batch[key]:.4f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type = int, default = 200_000, help = "fixtures per batch call")
+    parser.add_argument("--n_scalar", type = int, default = 50_000, help = "fixtures timed through simulate_match")
+    parser.add_argument("--repeat", type = int, default = 3)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--rating_csv", default = "data/teams.csv")
+    main(parser.parse_args())
@@ -0,0 +1,71 @@
+"""
+Placement store (storage.placement_store) throughput.
+
+Generates --n FIFA 2026 editions with the plan engine, appends them to a
+store in a temporary directory in chunks of --chunk editions, then streams
+the memory map back in blocks to compute per-team mean position and title
+counts out of core. Reports append and scan rates, the file size, and
+checks the scan against the same reduction in memory.
+
+    python -m benchmarks.bench_placement_store [--n 2000000] [--chunk 100000]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from core.match_engine import MatchEngine
+from core.plan import compile_format, PlanEngine
+from core.team_table import TeamTable
+from formats.specs import FORMAT_SPECS
+from storage.placement_store import PlacementStore
+
+def main(args):
+    """ Fill a store, then scan it block by block. """
+    table = TeamTable.from_csv(args.rating_csv)
+    engine = PlanEngine(table.rating, MatchEngine(rng = np.random.default_rng(args.seed)))
+    plan = compile_format(FORMAT_SPECS["FIFA2026"], len(table))
+
+    # One chunk of editions is simulated once and appended repeatedly: this times the store, not the simulation
+    engine.run(plan, args.chunk)
+    chunk = engine.positions
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "FIFA2026.plc"
+        store = PlacementStore.create(path, "FIFA2026", table.names, seed = args.seed)
+
+        start = time.perf_counter()
+        for lo in range(0, args.n, args.chunk): store.append(chunk[:min(args.chunk, args.n - lo)])
+        t_append = time.perf_counter() - start
+
+        reader = PlacementStore.open(path)
+        start = time.perf_counter()
+        total = np.zeros(reader.n_teams)
+        titles = np.zeros(reader.n_teams, dtype = np.int64)
+        for _, block in reader.blocks(args.block):
+            total += block.sum(axis = 0, dtype = np.int64)
+            titles += np.bincount((block == 1).argmax(axis = 1), minlength = reader.n_teams)
+        t_scan = time.perf_counter() - start
+
+        # Same reduction in memory over the repeated chunk
+        reps = [min(args.chunk, args.n - lo) for lo in range(0, args.n, args.chunk)]
+        expected = sum(chunk[:k].sum(axis = 0, dtype = np.int64) for k in reps)
+        mb = path.stat().st_size / 1e6
+
+        print(f"editions          : {len(reader):,} x {reader.n_teams} teams ({reader.dtype})")
+        print(f"file size         : {mb:,.1f} MB ({mb * 1e6 / len(reader):.0f} bytes per edition)")
+        print(f"append            : {len(reader) / t_append:14,.0f} editions/s ({mb / t_append:,.0f} MB/s)")
+        print(f"out-of-core scan  : {len(reader) / t_scan:14,.0f} editions/s ({mb / t_scan:,.0f} MB/s)")
+        print(f"scan matches      : {np.array_equal(total, expected)} (title counts sum to {titles.sum():,})")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type = int, default = 2_000_000)
+    parser.add_argument("--chunk", type = int, default = 100_000, help = "editions per append")
+    parser.add_argument("--block", type = int, default = 1 << 20, help = "editions per scan block")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--rating_csv", default = "data/teams.csv")
+    main(parser.parse_args())
@@ -0,0 +1,88 @@
+"""
+Compiled fixture plans (formats.specs + core.plan.PlanEngine) versus the
+object path of batch_sim (play_one, one edition per call).
+
+For every format in FORMAT_SPECS: editions per second of both paths, and
+the largest deviation of per-team mean finishing position, mean Spearman ρ
+and mean low-incentive share between them, in standard errors of the
+difference. Exits with status 1 if any |z| exceeds --max-z (default 4.5),
+which points to a rule mismatch between the two implementations.
+
+    python -m benchmarks.bench_plan [--n 20000] [--n_object 2000] [--seed 0] [--max-z 4.5]
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from batch_sim import FORMATS, play_one, corr_eval, ic_eval
+from core.match_engine import MatchEngine
+from core.plan import compile_format, PlanEngine
+from core.team_table import TeamTable
+from formats.specs import FORMAT_SPECS
+
+def object_path(fmt_name, table, n, seed):
+    """ n object-path editions: (positions, dead) arrays and the elapsed time. """
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    played = [play_one(FORMATS[fmt_name], None, rng, table = table) for _ in range(n)]
+    elapsed = time.perf_counter() - start
+    return np.array([p for p, _ in played]), np.array([d for _, d in played]), elapsed
+
+def plan_path(fmt_name, table, n, chunk, seed):
+    """ n plan editions in chunks: (positions, dead) arrays and the elapsed time. """
+    engine = PlanEngine(table.rating, MatchEngine(rng = np.random.default_rng(seed)))
+    plan = compile_format(FORMAT_SPECS[fmt_name], len(table))
+    positions, dead = [], []
+
+    start = time.perf_counter()
+    for lo in range(0, n, chunk):
+        engine.run(plan, min(chunk, n - lo))
+        positions.append(engine.positions)
+        goals = engine.group_goals
+        dead.append(np.zeros(engine.n) if goals is None else ic_eval.evaluate_batch(goals)["pct_low_incentive"])
+    elapsed = time.perf_counter() - start
+    return np.concatenate(positions), np.concatenate(dead), elapsed
+
+def max_z(a, b):
+    """ Largest |mean(a) - mean(b)| over columns in standard errors of the difference. """
+    a, b = np.atleast_2d(a.T).T.astype(float), np.atleast_2d(b.T).T.astype(float)
+    se = np.sqrt(a.var(0) / len(a) + b.var(0) / len(b))
+    diff = np.abs(a.mean(0) - b.mean(0))
+    return float(np.where(se > 0, diff / np.maximum(se, 1e-12), np.where(diff > 0, np.inf, 0)).max())
+
+def main(args):
+    """ Time and compare both paths for every format. """
+    table = TeamTable.from_csv(args.rating_csv)
+    print(f"{'format':9} | {'object /s':>10} | {'plan /s':>10} | speedup | {'|z| position':>12} | {'|z| rho':>7} | {'|z| dead':>8} | rho obj / plan")
+    failed = []
+
+    for fmt_name in FORMAT_SPECS:
+        pos_o, dead_o, t_o = object_path(fmt_name, table, args.n_object, args.seed)
+        pos_p, dead_p, t_p = plan_path(fmt_name, table, args.n, args.chunk, args.seed + 1)
+        rho_o = corr_eval.evaluate_batch(pos_o, table.rating)["correlation"]
+        rho_p = corr_eval.evaluate_batch(pos_p, table.rating)["correlation"]
+
+        rate_o, rate_p = args.n_object / t_o, args.n / t_p
+        z = max_z(pos_o, pos_p), max_z(rho_o, rho_p), max_z(dead_o, dead_p)
+        if max(z) > args.max_z: failed.append(fmt_name)
+        print(
+            f"{fmt_name:9} | {rate_o:10,.0f} | {rate_p:10,.0f} | {rate_p / rate_o:6.0f}x | {z[0]:12.2f} | "
+            f"{z[1]:7.2f} | {z[2]:8.2f} | {rho_o.mean():.4f} / {rho_p.mean():.4f}{'  FAIL' if max(z) > args.max_z else ''}"
+        )
+
+    if failed:
+        print(f"\nPlan and object paths differ by more than {args.max_z:g} standard errors: {', '.join(failed)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type = int, default = 20_000, help = "plan editions per format")
+    parser.add_argument("--n_object", type = int, default = 2_000, help = "object-path editions per format")
+    parser.add_argument("--chunk", type = int, default = 5_000, help = "editions per PlanEngine.run call")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--max-z", type = float, default = 4.5, help = "largest tolerated |z| between the two paths (default 4.5)")
+    parser.add_argument("--rating_csv", default = "data/teams.csv")
+    main(parser.parse_args())
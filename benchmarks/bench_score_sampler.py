@@ -0,0 +1,111 @@
+"""
+Rejection sampler versus the exact outcome-conditioned sampler
+(MatchEngine(sampler="exact")).
+
+For a close and a lopsided pairing, tests each sampler's scorelines per
+outcome against the exact truncated conditional distribution with a
+chi-square goodness-of-fit test (cells expected fewer than 5 times pooled)
+and reports the total-variation distance; exits with status 1 if any test
+rejects at --alpha. Then times both samplers through simulate_match and
+simulate_matches.
+
+    python -m benchmarks.bench_score_sampler [--n 200000] [--alpha 1e-4]
+"""
+
+import argparse
+import sys
+from collections import Counter
+
+import numpy as np
+
+from benchmarks.common import load_ratings, best_of
+from core.team import Team
+from core.match_engine import MatchEngine
+from core.score_tables import OUTCOMES
+
+def tv_distance(samples, pmf):
+    """ Total-variation distance between an empirical scoreline sample and a pmf dict. """
+    counts = Counter(map(tuple, samples))
+    n = max(len(samples), 1)
+    keys = set(counts) | set(pmf)
+    return 0.5 * sum(abs(counts.get(k, 0) / n - pmf.get(k, 0.0)) for k in keys)
+
+def chi_square(samples, pmf, min_expected = 5.0):
+    """ (statistic, dof, p-value) of a goodness-of-fit test; rare cells and scores outside the pmf form one pooled cell. """
+    from scipy import stats
+
+    counts = Counter(map(tuple, samples))
+    n = len(samples)
+    common = [k for k, p in pmf.items() if n * p >= min_expected]
+
+    observed = [counts.get(k, 0) for k in common]
+    expected = [n * pmf[k] for k in common]
+    observed.append(n - sum(observed))
+    expected.append(n - sum(expected))
+
+    observed, expected = np.array(observed, dtype = float), np.array(expected)
+    if expected[-1] < min_expected: observed, expected = observed[:-1], expected[:-1]
+    stat = ((observed - expected) ** 2 / expected).sum()
+    dof = len(expected) - 1
+    return stat, dof, stats.chi2.sf(stat, dof)
+
+def check_pairing(r1, r2, n, seed, alpha):
+    """ Test both samplers against the analytic conditional distribution for one pairing; returns the number of rejections. """
+    exact = MatchEngine(sampler = "exact")
+    mu1, mu2 = exact._expected_goals(r1, r2)
+    print(f"\nPairing {r1:.0f} vs {r2:.0f}  (mu = {mu1:.2f}, {mu2:.2f})")
+    failed = 0
+
+    for sampler in ("rejection", "exact"):
+        engine = MatchEngine(sampler = sampler, rng = np.random.default_rng(seed))
+        winners, goals, _ = engine.simulate_matches(np.full(n, r1), np.full(n, r2))
+        outcome = np.where(winners == 0, 1, np.where(winners == 1, -1, 0))
+
+        for o in OUTCOMES:
+            sample = goals[outcome == o]
+            if len(sample) < 100: continue
+
+            pmf = exact.score_tables.conditional_pmf(mu1, mu2, o)
+            stat, dof, p = chi_square(sample, pmf)
+            failed += p < alpha
+            print(f"  {sampler:9} outcome {o:+d}: n = {len(sample):7d}  TV = {tv_distance(sample, pmf):.4f}  chi2 = {stat:8.1f} (dof {dof:3d}, p = {p:.3g}){'  FAIL' if p < alpha else ''}")
+
+    return failed
+
+def main(args):
+    """ Run the statistical comparison and the timing comparison. """
+    _, ratings = load_ratings(args.rating_csv)
+
+    # Close and lopsided pairings from the shipped table
+    failed = check_pairing(ratings[5], ratings[6], args.n, args.seed, args.alpha)
+    failed += check_pairing(ratings[0], ratings[-1], args.n, args.seed, args.alpha)
+
+    rng = np.random.default_rng(args.seed)
+    i = rng.integers(0, len(ratings), args.n)
+    j = (i + rng.integers(1, len(ratings), args.n)) % len(ratings)
+    r1, r2 = ratings[i], ratings[j]
+    teams = [Team(str(r), r) for r in ratings]
+
+    print("\nThroughput (matches/s)")
+    for sampler in ("rejection", "exact"):
+        engine = MatchEngine(sampler = sampler, rng = np.random.default_rng(args.seed))
+        engine.simulate_matches(r1, r2) # Warm the score-table cache
+
+        n_scalar = min(args.n, args.n_scalar)
+        t_scalar = best_of(lambda: [engine.simulate_match(teams[a], teams[b]) for a, b in zip(i[:n_scalar], j[:n_scalar])], args.repeat)
+        t_batch = best_of(lambda: engine.simulate_matches(r1, r2), args.repeat)
+        print(f"  {sampler:9}  simulate_match {n_scalar / t_scalar:>12,.0f}  |  simulate_matches {args.n / t_batch:>12,.0f}")
+
+    if failed:
+        print(f"\n{failed} goodness-of-fit test(s) rejected at alpha = {args.alpha:g}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type = int, default = 200_000, help = "fixtures per comparison")
+    parser.add_argument("--n_scalar", type = int, default = 50_000, help = "fixtures timed through simulate_match")
+    parser.add_argument("--repeat", type = int, default = 3)
+    parser.add_argument("--alpha", type = float, default = 1e-4, help = "significance level of each chi-square test (default 1e-4)")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--rating_csv", default = "data/teams.csv")
+    main(parser.parse_args())
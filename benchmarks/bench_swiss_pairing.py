@@ -0,0 +1,79 @@
+"""
+Swiss pairing at several field sizes: SwissPairing (score groups, no rematches)
+versus the original rule of SwissTournament (re-sort the field, pair neighbours).
+
+Results are drawn with a simple rating-free model (45 % / 25 % / 30 %), so
+only the pairing cost is measured. Reports the pairing time of a whole event
+and the number of rematches each rule produced.
+
+    python -m benchmarks.bench_swiss_pairing [--sizes 512 1024 2048 4096] [--rounds 12]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from formats.swiss_pairing import SwissPairing
+
+def play_results(pairs, points, rng):
+    """ Award 3/1/0 points for one round of pairs. """
+    u = rng.random(len(pairs))
+    for (a, b), x in zip(pairs, u):
+        if x < 0.45: points[a] += 3
+        elif x < 0.70:
+            points[a] += 1
+            points[b] += 1
+        else: points[b] += 3
+
+def run_engine(ratings, rounds, seed):
+    """ Pair a full event with SwissPairing; return (pairing seconds, rematches). """
+    rng = np.random.default_rng(seed)
+    pairer = SwissPairing(ratings, rng)
+    points = [0] * len(ratings)
+    spent = 0.0
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        pairs = pairer.pair(points)
+        spent += time.perf_counter() - start
+        play_results(pairs, points, rng)
+    return spent, pairer.rematches
+
+def run_sorted(ratings, rounds, seed):
+    """ Pair a full event with the original sort-and-zip rule; return (pairing seconds, rematches). """
+    rng = np.random.default_rng(seed)
+    points = [0] * len(ratings)
+    played = set()
+    spent, rematches = 0.0, 0
+
+    for _ in range(rounds):
+        start = time.perf_counter()
+        ordered = sorted(range(len(ratings)), key = lambda t: (points[t], ratings[t], rng.random()), reverse = True)
+        it = iter(ordered)
+        pairs = list(zip(it, it))
+        spent += time.perf_counter() - start
+
+        for a, b in pairs:
+            rematches += (min(a, b), max(a, b)) in played
+            played.add((min(a, b), max(a, b)))
+        play_results(pairs, points, rng)
+    return spent, rematches
+
+def main(args):
+    """ Time both rules at every field size. """
+    print(f"{'teams':>6} | {'rounds':>6} | {'engine ms':>9} | {'rematches':>9} | {'sorted ms':>9} | {'rematches':>9}")
+
+    for n in args.sizes:
+        ratings = np.random.default_rng(args.seed).normal(1600, 200, n).round().tolist()
+        t_engine, r_engine = min(run_engine(ratings, args.rounds, args.seed) for _ in range(args.repeat))
+        t_sorted, r_sorted = min(run_sorted(ratings, args.rounds, args.seed) for _ in range(args.repeat))
+        print(f"{n:6} | {args.rounds:6} | {1000 * t_engine:9.1f} | {r_engine:9} | {1000 * t_sorted:9.1f} | {r_sorted:9}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type = int, nargs = "+", default = [48, 512, 1024, 2048, 4096])
+    parser.add_argument("--rounds", type = int, default = 12)
+    parser.add_argument("--repeat", type = int, default = 3)
+    parser.add_argument("--seed", type = int, default = 0)
+    main(parser.parse_args())
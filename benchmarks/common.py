@@ -0,0 +1,31 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Run any benchmark from the repository root as a module, e.g.
+    python -m benchmarks.bench_match_engine
+"""
+
+import csv
+import time
+
+import numpy as np
+
+DEFAULT_RATINGS = "data/teams.csv"
+
+def load_ratings(csv_path = DEFAULT_RATINGS):
+    """ Return (names, ratings) from a ratings CSV without going through pandas. """
+    with open(csv_path, newline = "") as fh:
+        rows = list(csv.DictReader(fh))
+
+    names = [r["Country"] for r in rows]
+    ratings = np.array([int(r["Rating"]) for r in rows], dtype = float)
+    return names, ratings
+
+def best_of(fn, repeat = 3):
+    """ Call fn() `repeat` times and return the fastest wall time in seconds. """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,342 @@
+"""
+Benchmark suite over every hot path, from single matches to whole editions.
+
+All cases use fixed seeds and the shipped ratings table. Every case is timed
+as --repeat samples of at least --min-time seconds each (the callable runs as
+often as needed) and reported at the median sample, so short cases are not
+at the mercy of timer resolution and one slow sample does not move them.
+
+Results are written as JSON and, when a baseline file exists, compared
+against it: a case whose median throughput drops by more than its limit
+counts as a regression and the script exits with status 1. The limit is
+--threshold or, for cases that are noisier than that on this machine,
+--spread-factor times the run-to-run spread (max - min over median of the
+samples) of the baseline or the current run, whichever is larger, capped
+at --max-limit so a large slowdown is caught even in a noisy run.
+
+Shared machines slow down as a whole from run to run, so with five or more
+cases the changes are taken relative to the median change over all cases
+(the machine speed, reported first). A change that slows every case alike
+is then not flagged; --absolute compares raw throughput instead.
+
+    python -m benchmarks.suite                        # run, compare with benchmarks/baseline.json
+    python -m benchmarks.suite --filter swiss         # only cases whose name contains "swiss"
+    python -m benchmarks.suite --save-baseline        # store this run as the new baseline
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.common import load_ratings
+from core.team import Team
+from core.team_table import TeamTable
+from core.match_engine import MatchEngine
+from core.group_stage import GroupStage
+from core.knockout_stage import KnockoutStage
+from core.bracket import BracketEngine, playoff_seeds
+from core.plan import compile_format, PlanEngine
+from formats.fifa2026 import FIFA2026Tournament
+from formats.fifa2026_batch_group_stage import FIFA2026BatchGroupStage
+from formats.swiss import SwissTournament
+from formats.swiss_pairing import SwissPairing
+from formats.specs import FORMAT_SPECS
+from evaluators.elo_correlation import EloCorrelationEvaluator
+from evaluators.incentive_compatibility import IncentiveCompatibilityEvaluator
+
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+DEFAULT_OUT = "results/benchmarks.json"
+
+# name -> (setup, ops per call, unit); setup(ctx) returns the zero-argument callable to time
+CASES = {}
+
+def case(name, ops, unit):
+    """ Register a benchmark case. """
+    def register(setup):
+        CASES[name] = (setup, ops, unit)
+        return setup
+    return register
+
+class Context:
+    """ Shared inputs of every case: the ratings table and the root seed. """
+
+    def __init__(self, rating_csv, seed):
+        self.names, self.ratings = load_ratings(rating_csv)
+        self.seed = seed
+
+    def engine(self, **kwargs):
+        """ Fresh MatchEngine with a fixed seed. """
+        return MatchEngine(rng = np.random.default_rng(self.seed), **kwargs)
+
+    def table(self):
+        """ Fresh TeamTable for the shipped field. """
+        return TeamTable(self.names, self.ratings.astype(int))
+
+# ----------------------------------------------------------
+# Match engine
+
+MATCHES = 2_000
+
+def _scalar_matches(gap, is_knockout):
+    def setup(ctx):
+        engine = ctx.engine()
+        t1, t2 = Team("Favourite", 1700 + gap), Team("Underdog", 1700)
+        return lambda: [engine.simulate_match(t1, t2, is_knockout = is_knockout) for _ in range(MATCHES)]
+    return setup
+
+for _gap in (0, 100, 250, 500): case(f"match.simulate_match.gap_{_gap}", MATCHES, "matches")(_scalar_matches(_gap, False))
+case("match.simulate_match.knockout_gap_0", MATCHES, "matches")(_scalar_matches(0, True))
+
+@case("match.simulate_match.bound_field", MATCHES, "matches")
+def _(ctx):
+    engine, table = ctx.engine(), ctx.table()
+    engine.bind(table.rating) # Pairwise table lookups (core.pairwise)
+    pairs = [(table.teams[k % len(table)], table.teams[(7 * k + 1) % len(table)]) for k in range(MATCHES)]
+    return lambda: [engine.simulate_match(t1, t2) for t1, t2 in pairs if t1 is not t2]
+
+@case("match.simulate_matches", 100_000, "matches")
+def _(ctx):
+    engine = ctx.engine()
+    rng = np.random.default_rng(ctx.seed)
+    i = rng.integers(0, ctx.ratings.size, 100_000)
+    j = (i + rng.integers(1, ctx.ratings.size, 100_000)) % ctx.ratings.size
+    return lambda: engine.simulate_matches(ctx.ratings[i], ctx.ratings[j])
+
+# ----------------------------------------------------------
+# Stages and formats (object path)
+
+@case("stage.group_stage.simulate", 20, "group stages")
+def _(ctx):
+    engine, table = ctx.engine(), ctx.table()
+
+    def run():
+        for _ in range(20):
+            table.reset()
+            GroupStage(table.teams, engine).simulate()
+    return run
+
+@case("stage.knockout.simulate", 50, "knockouts")
+def _(ctx):
+    engine, table = ctx.engine(), ctx.table()
+    tour = FIFA2026Tournament(table.teams, engine)
+    tour.run()
+    qualified = tour.get_qualified_teams()
+
+    # Includes _build_fifa2026_round_of_32
+    return lambda: [KnockoutStage(qualified, engine).simulate() for _ in range(50)]
+
+@case("format.swiss._pair_round", 200, "pairings")
+def _(ctx):
+    engine, table = ctx.engine(), ctx.table()
+    tour = SwissTournament(table.teams, engine)
+    tour.run() # Pair on a realistic (non-zero) table
+    return lambda: [tour._pair_round() for _ in range(200)]
+
+@case("format.swiss.run", 5, "tournaments")
+def _(ctx):
+    engine, table = ctx.engine(), ctx.table()
+
+    def run():
+        for _ in range(5):
+            table.reset()
+            SwissTournament(table.teams, engine).run()
+    return run
+
+@case("format.swiss_pairing.4096x12", 1, "events")
+def _(ctx):
+    from benchmarks.bench_swiss_pairing import play_results
+
+    ratings = np.random.default_rng(ctx.seed).normal(1600, 200, 4096)
+
+    def run():
+        rng = np.random.default_rng(ctx.seed)
+        pairer, points = SwissPairing(ratings, rng), [0] * ratings.size
+        for _ in range(12): play_results(pairer.pair(points), points, rng)
+    return run
+
+# ----------------------------------------------------------
+# Evaluators
+
+@case("evaluator.elo_correlation.evaluate", 20, "evaluations")
+def _(ctx):
+    import pandas as pd
+
+    corr_eval = EloCorrelationEvaluator()
+    order = np.random.default_rng(ctx.seed).permutation(len(ctx.names))
+    standings = pd.DataFrame({"team": [ctx.names[k] for k in order], "position": range(1, len(order) + 1)})
+    elos = pd.DataFrame({"team": ctx.names, "elo": ctx.ratings})
+    return lambda: [corr_eval.evaluate(standings, elos) for _ in range(20)]
+
+@case("evaluator.elo_correlation.evaluate_batch", 10_000, "evaluations")
+def _(ctx):
+    corr_eval = EloCorrelationEvaluator()
+    rng = np.random.default_rng(ctx.seed)
+    positions = np.argsort(rng.random((10_000, ctx.ratings.size)), axis = 1) + 1
+    return lambda: corr_eval.evaluate_batch(positions, ctx.ratings)
+
+@case("evaluator.incentive_compatibility.evaluate", 200, "evaluations")
+def _(ctx):
+    ic_eval = IncentiveCompatibilityEvaluator()
+    tour = FIFA2026Tournament(ctx.table().teams, ctx.engine())
+    tour.run()
+    return lambda: [ic_eval.evaluate(tour) for _ in range(200)]
+
+# ----------------------------------------------------------
+# Whole editions (batch_sim.run_one) and the vectorised engines
+
+def _run_one(fmt_name):
+    def setup(ctx):
+        from batch_sim import FORMATS, run_one
+
+        rng, table = np.random.default_rng(ctx.seed), ctx.table()
+        return lambda: [run_one(FORMATS[fmt_name], None, rng, table = table) for _ in range(10)]
+    return setup
+
+for _fmt in ("FIFA2026", "Playoff", "Swiss8R"): case(f"edition.run_one.{_fmt}", 10, "editions")(_run_one(_fmt))
+
+@case("batch.fifa2026_group_stage", 5_000, "group stages")
+def _(ctx):
+    stage = FIFA2026BatchGroupStage(ctx.ratings, ctx.engine(sampler = "exact"))
+    return lambda: stage.simulate(5_000)
+
+@case("batch.bracket.playoff", 5_000, "brackets")
+def _(ctx):
+    bracket = BracketEngine(ctx.ratings, ctx.engine())
+    seeds = playoff_seeds(ctx.ratings, 5_000)
+    return lambda: bracket.run(seeds)
+
+def _plan(fmt_name):
+    def setup(ctx):
+        engine = PlanEngine(ctx.ratings, ctx.engine())
+        plan = compile_format(FORMAT_SPECS[fmt_name], ctx.ratings.size)
+        return lambda: engine.run(plan, 2_000)
+    return setup
+
+for _fmt in FORMAT_SPECS: case(f"plan.{_fmt}", 2_000, "editions")(_plan(_fmt))
+
+# ----------------------------------------------------------
+
+def time_case(fn, repeat, min_time):
+    """
+    Warm up, then take `repeat` samples of at least min_time seconds each;
+    returns (calls per sample, per-call seconds of every sample).
+    """
+    fn()
+
+    # Calls per sample from a second (warm) call, so that a sample lasts about min_time
+    start = time.perf_counter()
+    fn()
+    calls = max(1, math.ceil(min_time / max(time.perf_counter() - start, 1e-9)))
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls): fn()
+        samples.append((time.perf_counter() - start) / calls)
+    return calls, samples
+
+def run_suite(names, ctx, repeat, min_time):
+    """ Run the named cases and return {name: result dict}. """
+    results = {}
+    for name in names:
+        setup, ops, unit = CASES[name]
+        calls, samples = time_case(setup(ctx), repeat, min_time)
+        median = statistics.median(samples)
+        results[name] = {
+            "ops": ops,
+            "unit": unit,
+            "calls": calls,
+            "best_s": min(samples),
+            "median_s": median,
+            "spread": (max(samples) - min(samples)) / median,
+            "ops_per_s": ops / median,
+        }
+        print(f"{name:45} | {ops / median:>14,.0f} {unit}/s  (spread {results[name]['spread']:5.1%})")
+    return results
+
+def compare(results, baseline, threshold, spread_factor, max_limit = 0.5, absolute = False):
+    """ Print throughput against the baseline; return the names of regressed cases. """
+    regressed = []
+
+    # Machine speed of this run relative to the baseline's: median throughput ratio over the common cases
+    ratios = [res["ops_per_s"] / baseline[name]["ops_per_s"] for name, res in results.items() if name in baseline]
+    machine = statistics.median(ratios) if len(ratios) >= 5 and not absolute else 1.0
+    print(f"\nMachine speed vs baseline: {machine:.2f}x" + ("" if machine == 1.0 else f" (median over {len(ratios)} cases; changes below are relative to it)"))
+    print(f"\n{'case':45} | {'ops/s':>14} | {'baseline':>14} | change | limit")
+
+    for name, res in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:45} | {res['ops_per_s']:>14,.0f} | {'-':>14} |    new |")
+            continue
+
+        # Noisy cases get a limit from their observed spread (baselines without one use the fixed threshold)
+        limit = min(max(threshold, spread_factor * max(base.get("spread", 0.0), res["spread"])), max_limit)
+        change = res["ops_per_s"] / base["ops_per_s"] / machine - 1
+        flag = ""
+        if change < -limit:
+            regressed.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:45} | {res['ops_per_s']:>14,.0f} | {base['ops_per_s']:>14,.0f} | {change:+6.1%} | {-limit:+5.0%}{flag}")
+
+    return regressed
+
+def main(args):
+    """ Run the selected cases, write JSON and compare with the baseline. """
+    names = [n for n in CASES if not args.filter or any(f in n for f in args.filter)]
+    if not names: sys.exit(f"No benchmark case matches {args.filter}")
+
+    ctx = Context(args.rating_csv, args.seed)
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+        },
+        "results": run_suite(names, ctx, args.repeat, args.min_time),
+    }
+
+    out = Path(args.baseline if args.save_baseline else args.out)
+    out.parent.mkdir(parents = True, exist_ok = True)
+
+    # A filtered --save-baseline only replaces the cases it ran
+    if args.save_baseline and out.exists(): report["results"] = {**json.loads(out.read_text())["results"], **report["results"]}
+    out.write_text(json.dumps(report, indent = 1) + "\n")
+    print(f"\nResults saved → {out}")
+
+    if args.save_baseline or not Path(args.baseline).exists(): return
+
+    baseline = json.loads(Path(args.baseline).read_text())["results"]
+    regressed = compare(report["results"], baseline, args.threshold, args.spread_factor, args.max_limit, args.absolute)
+    if regressed:
+        print(f"\n{len(regressed)} case(s) slower than the baseline by more than their limit")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--filter", nargs = "*", help = "run only cases whose name contains one of these substrings")
+    parser.add_argument("--repeat", type = int, default = 7, help = "timed samples per case; the median is reported (default 7)")
+    parser.add_argument("--min-time", type = float, default = 0.2, help = "minimum seconds per sample; short cases are called repeatedly (default 0.2)")
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--rating_csv", default = "data/teams.csv")
+    parser.add_argument("--out", default = DEFAULT_OUT, help = f"JSON results file (default {DEFAULT_OUT})")
+    parser.add_argument("--baseline", default = DEFAULT_BASELINE, help = f"baseline JSON to compare with (default {DEFAULT_BASELINE})")
+    parser.add_argument("--threshold", type = float, default = 0.25, help = "allowed throughput drop before a case counts as a regression (default 0.25)")
+    parser.add_argument("--spread-factor", type = float, default = 3.0, help = "noisy cases may drop by this many times their sample spread (default 3)")
+    parser.add_argument("--max-limit", type = float, default = 0.5, help = "largest allowed drop before a case counts as a regression, however noisy (default 0.5)")
+    parser.add_argument("--absolute", action = "store_true", help = "compare raw throughput, without correcting for the machine speed of this run")
+    parser.add_argument("--save-baseline", action = "store_true", help = "write the results to --baseline instead of comparing")
+    main(parser.parse_args())
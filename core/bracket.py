@@ -0,0 +1,137 @@
+import numpy as np
+
+# FIFA 2026 round-of-32 layout (same order as KnockoutStage._build_fifa2026_round_of_32).
+# ("W", g) = winner of group g, ("R", g) = runner-up of group g,
+# ("T", groups) = best available third-placed team from one of `groups`.
+FIFA2026_ROUND_OF_32 = [
+    (("R", "A"), ("R", "B")),
+    (("W", "E"), ("T", "ABCDF")),
+    (("W", "F"), ("R", "C")),
+    (("W", "C"), ("R", "F")),
+    (("W", "I"), ("T", "CDFGH")),
+    (("R", "E"), ("R", "I")),
+    (("W", "A"), ("T", "CEFHI")),
+    (("W", "L"), ("T", "EHIJK")),
+    (("W", "D"), ("T", "BEFIJ")),
+    (("W", "G"), ("T", "AEHIJ")),
+    (("R", "K"), ("R", "L")),
+    (("W", "H"), ("R", "J")),
+    (("W", "B"), ("T", "EFGIJ")),
+    (("W", "J"), ("R", "H")),
+    (("W", "K"), ("T", "DEIJL")),
+    (("R", "D"), ("R", "G")),
+]
+
+def fifa2026_round_of_32(ranked, best_third_groups):
+    """
+    Build (n, 32) bracket seeds from batched group results.
+
+    ranked:            (n, 12, 4) team indices in group finishing order (groups A-L)
+    best_third_groups: (n, 8) groups of the qualified thirds, best first
+
+    Thirds are assigned like pick_third in KnockoutStage: the best remaining
+    third from an allowed group, else the best remaining third.
+    """
+    n = ranked.shape[0]
+    rows = np.arange(n)
+    third_teams = np.take_along_axis(ranked[:, :, 2], best_third_groups, axis = 1)
+    available = np.ones(third_teams.shape, dtype = bool)
+
+    def resolve(kind, arg):
+        if kind == "W": return ranked[:, ord(arg) - 65, 0]
+        if kind == "R": return ranked[:, ord(arg) - 65, 1]
+
+        allowed = np.isin(best_third_groups, [ord(g) - 65 for g in arg]) & available
+        pick = np.where(allowed.any(axis = 1), allowed.argmax(axis = 1), available.argmax(axis = 1))
+        available[rows, pick] = False
+        return third_teams[rows, pick]
+
+    return np.stack([resolve(*side) for match in FIFA2026_ROUND_OF_32 for side in match], axis = 1)
+
+def playoff_seeds(ratings, n, bracket_size: int = 32):
+    """ (n, bracket_size) seeds of PlayoffTournament: top teams by rating, paired 1v2, 3v4, ... """
+    order = np.argsort(-np.asarray(ratings, dtype = float), kind = "stable")[:bracket_size]
+    return np.broadcast_to(order, (n, bracket_size))
+
+class BracketEngine:
+    """
+    Single-elimination bracket for many editions at once.
+
+    Takes an (n, size) array of team indices in bracket order (slot 2k plays
+    slot 2k + 1, winners keep their order) and plays every round as one
+    batched MatchEngine.simulate_matches call.
+    """
+
+    def __init__(self, ratings, match_engine):
+        """ Initialize with the field's ratings (indexed by team) and a match engine. """
+        self.ratings = np.asarray(ratings, dtype = float)
+        self.match_engine = match_engine
+
+    # ----------------------------------------------------------
+
+    def run(self, seeds):
+        """
+        Play out the brackets.
+
+        Stores:
+            rounds      list of (team1, team2, goals, winners, pens) per round, each (n, matches[, 2])
+            losers      list of (n, matches) losers per round, in match order
+            champion    (n,) champion per edition
+            runner_up   (n,) losing finalist per edition
+            elim_round  (n, n_teams) size of the round each team lost in (1 = champion, 0 = not in bracket),
+                        the batched equivalent of KnockoutStage.eliminated
+        """
+        seeds = np.asarray(seeds)
+        n, size = seeds.shape
+        if size < 2 or size & (size - 1): raise ValueError("BracketEngine expects a power-of-two bracket")
+
+        rows = np.arange(n)[:, None]
+        self.elim_round = np.zeros((n, self.ratings.size), dtype = np.int16)
+        self.rounds = []
+        self.losers = []
+
+        current = seeds
+        while size > 1:
+            t1, t2 = current[:, 0::2], current[:, 1::2]
+            winners, goals, pens = self.match_engine.simulate_matches(self.ratings[t1], self.ratings[t2], is_knockout = True)
+            first = winners.reshape(t1.shape) == 0
+
+            won = np.where(first, t1, t2)
+            lost = np.where(first, t2, t1)
+            self.elim_round[rows, lost] = size
+
+            self.rounds.append((t1, t2, goals.reshape(t1.shape + (2,)), won, pens.reshape(t1.shape)))
+            self.losers.append(lost)
+            current = won
+            size //= 2
+
+        self.champion = current[:, 0]
+        self.runner_up = self.losers[-1][:, 0]
+        self.elim_round[rows[:, 0], self.champion] = 1
+
+    # ----------------------------------------------------------
+
+    def get_rankings(self, tiebreak: str = "bracket"):
+        """
+        Return (n, size) team indices in final order: champion, runner-up, then
+        losers round by round (semi-finals first).
+
+        tiebreak orders teams that went out in the same round:
+            "bracket" - match order (like get_rankings_from_knockout in batch_sim / main)
+            "rating"  - rating descending, then match order (like PlayoffTournament.get_rankings)
+        """
+        if tiebreak not in ("bracket", "rating"): raise ValueError(f"Unknown tiebreak {tiebreak!r}")
+
+        tiers = [self.champion[:, None]]
+        for lost in reversed(self.losers):
+            if tiebreak == "rating": lost = np.take_along_axis(lost, np.argsort(-self.ratings[lost], axis = 1, kind = "stable"), axis = 1)
+            tiers.append(lost)
+
+        return np.concatenate(tiers, axis = 1)
+
+    def get_positions(self, tiebreak: str = "bracket"):
+        """ Return (n, n_teams) finishing positions (1 = champion, 0 = not in the bracket). """
+        ranking = self.get_rankings(tiebreak)
+        positions = np.zeros(self.elim_round.shape, dtype = np.int16)
+        np.put_along_axis(positions, ranking, np.arange(1, ranking.shape[1] + 1, dtype = np.int16), axis = 1)
+        return positions
@@ -0,0 +1,69 @@
+from math import exp
+
+import numpy as np
+
+# Leading spawn-key word of every pairing stream, keeps them apart from the per-edition streams of batch_sim
+STREAM_TAG = 0x43524E
+
+class InverseCDFStream:
+    """
+    Uniform stream for one fixture, with Poisson draws by inversion.
+
+    Provides the part of the numpy Generator interface that
+    MatchEngine.simulate_match uses (random() and poisson(lam), scalars only).
+    Every Poisson draw consumes exactly one uniform through the inverse CDF,
+    so results are monotone in the uniforms; with antithetic=True each uniform
+    u is replaced by 1 - u, which turns a stream into its mirror image.
+    """
+
+    def __init__(self, rng, antithetic: bool = False):
+        """ Wrap a Generator; antithetic mirrors every uniform. """
+        self.rng = rng
+        self.antithetic = antithetic
+
+    def random(self):
+        """ One uniform on [0, 1). """
+        u = self.rng.random()
+        return 1.0 - u if self.antithetic else u
+
+    def poisson(self, lam):
+        """ One Poisson(lam) draw: the smallest k with CDF(k) >= u. """
+        u = self.random()
+        k = 0
+        p = cdf = exp(-lam)
+
+        while cdf < u and p > 0:
+            k += 1
+            p *= lam / k
+            cdf += p
+        return k
+
+class PairingStreams:
+    """
+    Common random numbers keyed by fixture: one stream per meeting of two teams.
+
+    The k-th meeting of teams i and j in an edition (in either order) draws
+    from the child SeedSequence(entropy, spawn_key = (STREAM_TAG, *key, min(i, j),
+    max(i, j), k)). Two tournaments built with the same entropy and key
+    therefore play the same fixture with the same uniforms, however many other
+    matches either one plays in between; antithetic=True gives the mirrored
+    streams (1 - u) of the same key.
+
+    Create one instance per edition and tournament: meeting counts start at zero.
+    """
+
+    def __init__(self, entropy, key = (), antithetic: bool = False):
+        """ Initialize the streams of one edition; `key` is a tuple of spawn-key words. """
+        self.entropy = entropy
+        self.key = tuple(key)
+        self.antithetic = antithetic
+        self.meetings = {} # (i, j) -> meetings so far
+
+    def stream(self, i: int, j: int):
+        """ Stream for the next meeting of teams i and j (team indices). """
+        pair = (min(i, j), max(i, j))
+        k = self.meetings.get(pair, 0)
+        self.meetings[pair] = k + 1
+
+        seed = np.random.SeedSequence(self.entropy, spawn_key = (STREAM_TAG,) + self.key + pair + (k,))
+        return InverseCDFStream(np.random.default_rng(seed), self.antithetic)
@@ -0,0 +1,103 @@
+import json
+from pathlib import Path
+
+class EventSink:
+    """
+    Observer interface for tournament progress.
+
+    Stages and formats report what happens through three hooks:
+        - round_started(stage, label)
+        - match_played(stage, label, team1, team2, score, winner, pens)
+        - table_finalized(stage, label, table)
+
+    `stage` is one of "group", "knockout", "playoff", "swiss"; `label` names the
+    round or group (e.g. "Group A", "Round of 16"). Every hook is a no-op here,
+    so sinks only override what they care about.
+    """
+
+    def round_started(self, stage, label):
+        pass
+
+    def match_played(self, stage, label, team1, team2, score, winner, pens = False):
+        pass
+
+    def table_finalized(self, stage, label, table):
+        pass
+
+    def close(self):
+        pass
+
+class NullSink(EventSink):
+    """ Discards every event. Default for all stages, so batch runs pay only a no-op call. """
+
+# Shared instance used whenever no sink is given
+NULL_SINK = NullSink()
+
+class ConsoleSink(EventSink):
+    """ Print events as human-readable lines (the classic console output of main.py). """
+
+    def round_started(self, stage, label):
+        print(f"\n{label}")
+
+    def match_played(self, stage, label, team1, team2, score, winner, pens = False):
+        head = f"{team1.name} {score[0]}-{score[1]} {team2.name}"
+
+        if stage == "group":
+            verb = "Draw" if winner is None else f"{winner.name} wins"
+            print(f"[{label}] {head} → {verb}")
+        elif winner is None:
+            print(f"{head} → draw")
+        elif stage == "swiss":
+            print(f"{head} → {winner.name} wins")
+        else:
+            pen_flag = " (p)" if pens else ""
+            print(f"{head} → {winner.name}{pen_flag}")
+
+    def table_finalized(self, stage, label, table):
+        print(f"\n{label}")
+        for t in table: print(f"{t.name:15} | Pts: {t.points} | GD: {t.goal_difference():+} | GF: {t.goals_for}")
+
+class JSONLSink(EventSink):
+    """ Write one JSON object per event to a file (path or open text handle). """
+
+    def __init__(self, target):
+        """ Open `target` for appending, or wrap an already open handle. """
+        self._owns = isinstance(target, (str, Path))
+        self._fh = open(target, "a") if self._owns else target
+
+    def _write(self, record):
+        self._fh.write(json.dumps(record) + "\n")
+
+    def round_started(self, stage, label):
+        self._write({"event": "round_started", "stage": stage, "label": label})
+
+    def match_played(self, stage, label, team1, team2, score, winner, pens = False):
+        self._write({
+            "event": "match_played",
+            "stage": stage,
+            "label": label,
+            "team1": team1.name,
+            "team2": team2.name,
+            "score": [int(score[0]), int(score[1])],
+            "winner": None if winner is None else winner.name,
+            "pens": bool(pens),
+        })
+
+    def table_finalized(self, stage, label, table):
+        self._write({
+            "event": "table_finalized",
+            "stage": stage,
+            "label": label,
+            "table": [{"team": t.name, "points": t.points, "gd": t.goal_difference(), "gf": t.goals_for, "fair_play": t.fair_play} for t in table],
+        })
+
+    def close(self):
+        """ Flush, and close the file if this sink opened it. """
+        self._fh.flush()
+        if self._owns: self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
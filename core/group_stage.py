@@ -1,17 +1,21 @@
-import random
 from itertools import combinations
 
+from core.events import NULL_SINK
+from core.standings import GroupStandings
+
 class GroupStage:
     """
     4-team group with FIFA tie-breaks.
-    Points → Goal Difference → Goals For → Fair-play points → Drawing of lots.
+    Points → Goal Difference → Goals For → Fair-play points → Drawing of lots
+    (with head_to_head = True, results between the tied teams come before fair play).
     """
 
-    def __init__(self, teams, match_engine, group_size: int = 4):
-        """ Initialize the group stage. """
+    def __init__(self, teams, match_engine, group_size: int = 4, events = None, head_to_head: bool = False):
+        """ Initialize the group stage (events: optional core.events sink). """
         self.teams = teams
         self.match_engine = match_engine
         self.group_size = group_size
+        self.events = events if events is not None else NULL_SINK
 
         # Create groups (typically groups A to L with 12 groups of 4 teams each)
         self.groups = self._create_groups()
@@ -19,6 +23,12 @@ class GroupStage:
         # Dictionary to hold results per group: key = group letter, value = list of matches
         self.results = {}
 
+        # Incrementally maintained standings per group (cached ranking, lots drawn once)
+        self.standings = {g: GroupStandings(teams, match_engine.rng, head_to_head) for g, teams in self.groups.items()}
+
+        # Final group rankings, set by simulate()
+        self.rankings = {}
+
     # ----------------------------------------------------------
 
     def _create_groups(self):
@@ -37,7 +47,7 @@ class GroupStage:
         pots = [sorted_teams[i * 12 : (i + 1) * 12] for i in range(4)]
 
         # Shuffle teams within each pot to randomize group assignment
-        for pot in pots: random.shuffle(pot)
+        for pot in pots: self.match_engine.rng.shuffle(pot)
 
         # Create 12 groups labeled from 'A' to 'L'
         groups = {chr(65 + i): [] for i in range(12)}
@@ -59,7 +69,7 @@ class GroupStage:
             - Iterate over all unique pairs of teams (each team plays others once).
             - Simulate the match using match_engine.
             - Record match results for each team.
-            - Store match results for reporting.
+            - Store match results and report them to the event sink.
 
         - After all matches:
             - Rank teams within each group using FIFA tie-break criteria.
@@ -72,19 +82,17 @@ class GroupStage:
             for t1, t2 in combinations(teams, 2):
                 winner, score, _ = self.match_engine.simulate_match(t1, t2)
 
-                # Record match results on team objects (goals scored and conceded)
-                t1.record_match(score[0], score[1])
-                t2.record_match(score[1], score[0])
+                # Record match results on team objects and in the group standings
+                self.standings[g].record(t1, t2, score)
 
                 # Store result tuple: (team1, team2, score, winner)
                 self.results[g].append((t1, t2, score, winner))
 
-                # Display match result for feedback
-                verb = "Draw" if winner is None else f"{winner.name} wins"
-                print(f"[Group {g}] {t1.name} {score[0]}-{score[1]} {t2.name} → {verb}")
+                self.events.match_played("group", f"Group {g}", t1, t2, score, winner)
 
         # Assign group and position labels based on rankings for knockout stage usage
-        for g, ranked in self.get_group_rankings().items():
+        self.rankings = self.get_group_rankings()
+        for g, ranked in self.rankings.items():
             for pos, tm in enumerate(ranked, 1):
                 tm.group = g
                 tm.group_pos = pos
@@ -92,23 +100,8 @@ class GroupStage:
     # ----------------------------------------------------------
 
     def get_group_rankings(self):
-        """ Compute and return rankings of teams within each group. """
-        ranks = {}
-
-        for g, teams in self.groups.items():
-            ranks[g] = sorted(
-                teams,
-                key = lambda t: (
-                    t.points,
-                    t.goal_difference(),
-                    t.goals_for,
-                    -t.fair_play,
-                    random.random()
-                ),
-                reverse = True
-            )
-
-        return ranks
+        """ Return rankings of teams within each group (cached per group; repeated calls agree). """
+        return {g: s.ranking() for g, s in self.standings.items()}
 
     def display_tables(self):
         """ Print the current standings tables for all groups. """
@@ -0,0 +1,101 @@
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+
+class Instrumentation:
+    """
+    Opt-in counters and wall-clock timers for the simulation hot paths.
+
+    Code under measurement calls count(name, k) and wraps sections in
+    `with instruments.timer(name):`. Hot loops check `instruments.enabled`
+    first, so the disabled default (NULL_INSTRUMENTATION) costs one attribute
+    test per match. Reports from several editions, shards or workers combine
+    with merge().
+
+    Names in use:
+        match.*      MatchEngine counters (matches, rejection tries, Poisson draws, fallbacks, extra time, penalties)
+        stage.*      wall time per tournament stage
+        evaluate.*   wall time per evaluator
+    """
+
+    enabled = True
+
+    def __init__(self):
+        """ Start with every counter and timer at zero. """
+        self.counters = defaultdict(int)
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+
+    def count(self, name, k = 1):
+        """ Add k to counter `name`. """
+        self.counters[name] += int(k)
+
+    def timer(self, name):
+        """ Context manager adding the wall time of its block to timer `name`. """
+        return _Timer(self, name)
+
+    def merge(self, other):
+        """ Fold another report into this one. """
+        for name, k in other.counters.items(): self.counters[name] += k
+        for name, s in other.seconds.items(): self.seconds[name] += s
+        for name, c in other.calls.items(): self.calls[name] += c
+
+    # ----------------------------------------------------------
+
+    def rates(self):
+        """ Derived per-match rates of the match-engine counters (empty when no match was recorded). """
+        c = self.counters
+        matches, knockout = c["match.matches"], c["match.knockout_matches"]
+        if not matches: return {}
+
+        rates = {
+            "rejection_tries_per_match": c["match.rejection_tries"] / matches,
+            "poisson_draws_per_match": c["match.poisson_draws"] / matches,
+            "fallback_rate": c["match.fallbacks"] / matches,
+        }
+        if knockout:
+            rates["extra_time_rate"] = c["match.extra_time"] / knockout
+            rates["penalty_rate"] = c["match.penalties"] / knockout
+        return rates
+
+    def to_dict(self):
+        """ JSON-ready summary: counters, timers (total seconds, calls, mean) and derived rates. """
+        return {
+            "counters": dict(sorted(self.counters.items())),
+            "timers": {name: {"seconds": s, "calls": self.calls[name], "mean_s": s / max(1, self.calls[name])} for name, s in sorted(self.seconds.items())},
+            "rates": self.rates(),
+        }
+
+class _Timer:
+    """ Timing block of Instrumentation.timer. """
+
+    def __init__(self, instruments, name):
+        self.instruments = instruments
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.instruments.seconds[self.name] += time.perf_counter() - self.start
+        self.instruments.calls[self.name] += 1
+
+class NullInstrumentation(Instrumentation):
+    """ Records nothing. Default everywhere, so uninstrumented runs pay only a flag check. """
+
+    enabled = False
+
+    def count(self, name, k = 1):
+        pass
+
+    def timer(self, name):
+        return _NULL_TIMER
+
+    def merge(self, other):
+        pass
+
+_NULL_TIMER = nullcontext()
+
+# Shared instance used whenever no instrumentation is given
+NULL_INSTRUMENTATION = NullInstrumentation()
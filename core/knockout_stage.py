@@ -1,15 +1,18 @@
+from core.events import NULL_SINK
+
 class KnockoutStage:
     """
     Knockout stage of the tournament.
     Supports 16 or 32 teams (e.g. FIFA 2026 format).
     """
 
-    def __init__(self, teams, match_engine):
-        """ Initialize the knockout stage. """
+    def __init__(self, teams, match_engine, events = None):
+        """ Initialize the knockout stage (events: optional core.events sink). """
         if len(teams) not in (16, 32): raise ValueError("KnockoutStage expects 16 or 32 teams")
 
         self.teams = teams
         self.match_engine = match_engine
+        self.events = events if events is not None else NULL_SINK
 
         # List of rounds; each round is a list of match tuples
         self.rounds: list[list[tuple]] = []
@@ -34,7 +37,7 @@ class KnockoutStage:
         """
         winners = {t.group: t for t in self.teams if t.group_pos == 1}
         runners = {t.group: t for t in self.teams if t.group_pos == 2}
-        thirds  = [t for t in self.teams if t not in winners and t not in runners]
+        thirds  = [t for t in self.teams if t not in winners.values() and t not in runners.values()]
 
         def pick_third(allowed):
             # Pick the first available 3rd-placed team from allowed groups
@@ -66,11 +69,6 @@ class KnockoutStage:
         # Flatten match list into a single ordered team list
         return [tm for pair in matches for tm in pair]
 
-    def _print_match(self, t1, t2, score, winner, pens):
-        """ Print formatted match result (with penalty note if needed). """
-        pen_flag = " (p)" if pens else ""
-        print(f"{t1.name} {score[0]}-{score[1]} {t2.name} → {winner.name}{pen_flag}")
-
     # ----------------------------------------------------------
 
     def simulate(self):
@@ -92,7 +90,8 @@ class KnockoutStage:
         size = len(current)
 
         while size > 1:
-            print(f"\nRound of {size}")
+            label = f"Round of {size}"
+            self.events.round_started("knockout", label)
             winners_next: list = []
             matches_this_round: list = []
 
@@ -104,8 +103,8 @@ class KnockoutStage:
                 winner, score, pens = self.match_engine.simulate_match(t1, t2, is_knockout = True)
 
                 # Record goals scored and conceded
-                t1.record_match(score[0], score[1])
-                t2.record_match(score[1], score[0])
+                t1.record_match(score[0], score[1], self.match_engine.rng)
+                t2.record_match(score[1], score[0], self.match_engine.rng)
 
                 # Mark loser as eliminated this round
                 loser = t2 if winner is t1 else t1
@@ -113,7 +112,7 @@ class KnockoutStage:
 
                 winners_next.append(winner)
                 matches_this_round.append((t1, t2, score, winner, pens))
-                self._print_match(t1, t2, score, winner, pens)
+                self.events.match_played("knockout", label, t1, t2, score, winner, pens)
 
             self.rounds.append(matches_this_round)
             current = winners_next
@@ -1,15 +1,75 @@
-import random
 import numpy as np
 
+from core.score_tables import ScoreTableCache, OUTCOMES
+from core.instrumentation import NULL_INSTRUMENTATION
+from core.pairwise import PAIRWISE_TABLES
+
+SAMPLERS = ("rejection", "exact")
+
 class MatchEngine:
     """
     Match simulator using Elo ratings and Poisson goal models.
     Handles both group and knockout matches, including penalties.
+
+    Scorelines for the forced W/D/L outcome come from one of two samplers:
+        - "rejection": redraw Poisson scores (up to 50 times) until they fit.
+        - "exact":     draw from the truncated outcome-conditioned score
+                       distribution via cached alias tables (see core.score_tables).
+
+    All randomness comes from `rng` (a numpy Generator). Stages and teams that
+    need random draws (pot shuffles, fair-play cards, drawing of lots) use the
+    same generator, so one seeded engine makes a whole edition reproducible.
+
+    Pass an Instrumentation as `instruments` to count matches, rejection tries,
+    Poisson draws, fallbacks, extra time and penalties (see core.instrumentation).
+
+    Pass a PairingStreams as `streams` for common random numbers: every
+    simulate_match call then draws from the stream of its fixture (teams need
+    an `index`, as TeamTable teams have) instead of `rng`. The fixture is
+    played with the caller's probabilities (the model is not symmetric), but
+    every uniform is read from the lower index's point of view (its W/D/L and
+    shootout thresholds first, its goals drawn first, its side of the exact
+    score table), so a fixture gives the same result in either order wherever
+    the two orders' probabilities agree. The batched simulate_matches always
+    uses `rng`.
+
+    bind(ratings) attaches the field's precomputed PairwiseTable (from the
+    `pairwise` cache, core.pairwise): simulate_match then looks W/D/L
+    probabilities and goal means up by team index instead of recomputing them.
+    Teams without an index or with a rating that differs from the table use
+    the formulas; changing base_goal_expectation re-binds to a matching table.
     """
 
-    def __init__(self, base_goal_expectation: float = 1.1):
+    def __init__(self, base_goal_expectation: float = 1.1, sampler: str = "rejection", cache_size: int = 4096, rng = None, instruments = None, streams = None, pairwise = PAIRWISE_TABLES):
         """ Initialize the match engine. """
+        if sampler not in SAMPLERS: raise ValueError(f"Unknown sampler {sampler!r}; expected one of {SAMPLERS}")
+
+        self.pairwise = pairwise
+        self.field = None # PairwiseTable of the bound field
         self.base_goal_expectation = base_goal_expectation
+        self.sampler = sampler
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.instruments = instruments if instruments is not None else NULL_INSTRUMENTATION
+        self.streams = streams
+
+        # Outcome-conditioned score tables, keyed by goal means (only used by the exact sampler)
+        self.score_tables = ScoreTableCache(maxsize = cache_size)
+
+    @property
+    def base_goal_expectation(self):
+        return self._base_goal_expectation
+
+    @base_goal_expectation.setter
+    def base_goal_expectation(self, value):
+        """ Set the goal expectation; a bound field is re-bound and cached score tables dropped so both match. """
+        self._base_goal_expectation = value
+        if self.field is not None: self.bind(self.field.ratings)
+        if hasattr(self, "score_tables"): self.score_tables.clear()
+
+    def bind(self, ratings):
+        """ Use the precomputed pairwise table of `ratings` (team index order) for simulate_match. """
+        self.field = self.pairwise.get(ratings, self) if self.pairwise is not None else None
+        return self.field
 
     # ----------------------------------------------------------
     # Probability helpers - kept exactly as requested
@@ -23,6 +83,14 @@ class MatchEngine:
         """ Return probability of draw for rating1 vs rating2. """
         return 0.05
 
+    def _elo_win_probabilities(self, ratings1, ratings2):
+        """ Vectorised counterpart of _elo_win_probability for rating arrays. """
+        return np.where(ratings1 > ratings2, 0.90, 0.05)
+
+    def _draw_probabilities(self, ratings1, ratings2):
+        """ Vectorised counterpart of _draw_probability for rating arrays. """
+        return np.full(np.shape(ratings1), 0.05)
+
     # ----------------------------------------------------------
     # Translate Elo gap → two attacking means
     # ----------------------------------------------------------
@@ -36,11 +104,104 @@ class MatchEngine:
         g2 = max(0.2, self.base_goal_expectation / factor)
         return g1, g2
 
+    def _expected_goals_array(self, ratings1, ratings2):
+        """ Vectorised counterpart of _expected_goals for rating arrays. """
+        factor = 1 + (ratings1 - ratings2) / 1200
+
+        g1 = np.maximum(0.2, self.base_goal_expectation * factor)
+        g2 = np.maximum(0.2, self.base_goal_expectation / factor)
+        return g1, g2
+
     # ----------------------------------------------------------
 
-    def _simulate_penalty(self, rating1, rating2):
-        """ Simulate penalty shootout based on ratings. """
-        return random.random() < self._elo_win_probability(rating1, rating2)
+    @staticmethod
+    def _poisson_pair(rng, mu1, mu2, swap = False):
+        """ Draw (g1, g2) ~ Poisson(mu1), Poisson(mu2); with swap, team2's goals are drawn first. """
+        if swap:
+            g2 = rng.poisson(mu2)
+            return rng.poisson(mu1), g2
+        return rng.poisson(mu1), rng.poisson(mu2)
+
+    def _sample_exact(self, outcome, mu1, mu2, rng = None):
+        """ Draw one scoreline for the forced outcome from the cached score table of (mu1, mu2). """
+        rng = rng if rng is not None else self.rng
+        row = self.score_tables.row_for((mu1, mu2), mu1, mu2)
+        return self.score_tables.sample(row, outcome, rng.random(), rng.random())
+
+    def _sample_rejection_many(self, forced, mu1, mu2, g1, g2):
+        """
+        Batch version of the 50-try rejection loop in simulate_match; fills g1/g2 in place.
+
+        Returns (tries, fallbacks): total rejection rounds over all fixtures and
+        the number of fixtures that needed the artificial-score fallback.
+        """
+        pending = np.arange(len(forced))
+        tries = 0
+
+        # Redraw only the fixtures that have not matched their outcome yet
+        for _ in range(50):
+            tries += pending.size
+            s1 = self.rng.poisson(mu1[pending])
+            s2 = self.rng.poisson(mu2[pending])
+            g1[pending], g2[pending] = s1, s2
+
+            pending = pending[np.sign(s1 - s2) != forced[pending]]
+            if pending.size == 0: return tries, 0
+
+        # Fallback in case no sample matched forced result (same rules as simulate_match)
+        f = forced[pending]
+        p1, p2 = g1[pending], g2[pending]
+        g1[pending] = np.where(f == 1, p2 + 1, np.where(f == -1, p1, np.maximum(p1, p2)))
+        g2[pending] = np.where(f == 1, p2, np.where(f == -1, p1 + 1, np.maximum(p1, p2)))
+        return tries, pending.size
+
+    def _sample_exact_many(self, forced, mu1, mu2, g1, g2):
+        """ Vectorised _sample_exact: fill g1/g2 in place for every fixture of a batch. """
+        if mu1.size == 0: return
+
+        # Distinct (mu1, mu2) pairings via integer codes (much cheaper than a row-wise unique)
+        u1, i1 = np.unique(mu1, return_inverse = True)
+        u2, i2 = np.unique(mu2, return_inverse = True)
+        pair_code = i1 * len(u2) + i2
+
+        # Compact the pair codes that occur: a counting pass when the code space is small, else a sort
+        if len(u1) * len(u2) <= max(1 << 16, pair_code.size):
+            present = np.bincount(pair_code, minlength = len(u1) * len(u2)) > 0
+            codes = np.flatnonzero(present)
+            inverse = (np.cumsum(present) - 1)[pair_code]
+        else:
+            codes, inverse = np.unique(pair_code, return_inverse = True)
+        pairs = np.stack([u1[codes // len(u2)], u2[codes % len(u2)]], axis = 1)
+        step = self.score_tables.maxsize
+
+        # Resolve at most one cache-full of distinct pairings at a time so eviction never drops a live row
+        for lo in range(0, len(pairs), step):
+            chunk = pairs[lo : lo + step]
+            rows_u = np.array([self.score_tables.row_for((a, b), a, b) for a, b in chunk.tolist()])
+
+            idx = np.flatnonzero((inverse >= lo) & (inverse < lo + len(chunk)))
+            rows = rows_u[inverse[idx] - lo]
+
+            for o in OUTCOMES:
+                hit = forced[idx] == o
+                sel = idx[hit]
+                g1[sel], g2[sel] = self.score_tables.sample_many(rows[hit], o, self.rng.random(sel.size), self.rng.random(sel.size))
+
+    def _record(self, matches, tries, fallbacks, is_knockout, extra_time, penalties):
+        """ Add one call's sampling statistics to the instrumentation counters. """
+        ins = self.instruments
+        ins.count("match.matches", matches)
+        ins.count("match.rejection_tries", tries)
+        ins.count("match.fallbacks", fallbacks)
+        if self.sampler == "exact": ins.count("match.exact_samples", matches)
+
+        # Two Poisson draws per rejection try and per extra time
+        ins.count("match.poisson_draws", 2 * (tries + extra_time))
+
+        if is_knockout:
+            ins.count("match.knockout_matches", matches)
+            ins.count("match.extra_time", extra_time)
+            ins.count("match.penalties", penalties)
 
     # ----------------------------------------------------------
 
@@ -50,50 +211,139 @@ class MatchEngine:
 
         Process:
             - Determine outcome type (win/loss/draw) based on Elo win prob.
-            - Sample Poisson scores until they match desired outcome.
+            - Sample Poisson scores until they match desired outcome
+              (or draw directly from the conditioned table with sampler="exact").
             - For knockouts:
                 - Add extra time if draw.
                 - Use penalty shootout if still level.
         """
+        rng = self.rng
+        swap = False
+        if self.streams is not None:
+            # Common random numbers: both orders of a fixture share one stream, and goals are drawn lower index first
+            rng = self.streams.stream(team1.index, team2.index)
+            swap = team1.index > team2.index
+
         r1, r2 = team1.rating, team2.rating
 
-        # Decide W/D/L outcome probabilistically
-        win_p = self._elo_win_probability(r1, r2)
-        draw_p = self._draw_probability(r1, r2)
-        rand = random.random()
-        forced = "win1" if rand < win_p else "draw" if rand < win_p + draw_p else "win2"
+        # Outcome probabilities and goal means: table lookup for a bound field, else the formulas
+        entry = self.field.lookup(team1, team2) if self.field is not None else None
+        if entry is not None:
+            win_p, draw_p, mu1, mu2, et1, et2 = entry
+        else:
+            win_p = self._elo_win_probability(r1, r2)
+            draw_p = self._draw_probability(r1, r2)
+            mu1, mu2 = self._expected_goals(r1, r2)
+            et1, et2 = mu1 * 0.4, mu2 * 0.4
 
-        # Get expected goal means based on Elo gap
-        mu1, mu2 = self._expected_goals(r1, r2)
+        # Decide W/D/L outcome probabilistically (with swap, the thresholds are team2's: its win, draw, then team1's win)
+        rand = rng.random()
+        if swap:
+            forced = "win2" if rand < 1 - win_p - draw_p else "draw" if rand < 1 - win_p else "win1"
+        else:
+            forced = "win1" if rand < win_p else "draw" if rand < win_p + draw_p else "win2"
 
-        # Try multiple times to sample goals matching forced outcome
-        for _ in range(50):
-            g1 = np.random.poisson(mu1)
-            g2 = np.random.poisson(mu2)
-            if (forced == "win1" and g1 > g2) or (forced == "win2" and g2 > g1) or (forced == "draw" and g1 == g2): break
+        tries = fallback = 0
+
+        if self.sampler == "exact":
+            outcome = {"win1": 1, "draw": 0, "win2": -1}[forced]
+            if swap:
+                # Canonical orientation: team2's table of the mirrored outcome
+                g2, g1 = self._sample_exact(-outcome, mu2, mu1, rng)
+            else:
+                g1, g2 = self._sample_exact(outcome, mu1, mu2, rng)
         else:
-            # Fallback in case no sample matched forced result
-            if forced == "win1":
-                g1, g2 = g2 + 1, g2
-            elif forced == "win2":
-                g1, g2 = g1, g1 + 1
+            # Try multiple times to sample goals matching forced outcome
+            for tries in range(1, 51):
+                g1, g2 = self._poisson_pair(rng, mu1, mu2, swap)
+                if (forced == "win1" and g1 > g2) or (forced == "win2" and g2 > g1) or (forced == "draw" and g1 == g2): break
             else:
-                g1 = g2 = max(g1, g2)
+                # Fallback in case no sample matched forced result
+                fallback = 1
+                if forced == "win1":
+                    g1, g2 = g2 + 1, g2
+                elif forced == "win2":
+                    g1, g2 = g1, g1 + 1
+                else:
+                    g1 = g2 = max(g1, g2)
 
-        went_to_pens = False
+        went_to_pens = extra_time = False
 
         # Knockout rules: add extra time and/or penalties if tied
         if is_knockout and g1 == g2:
-            g1 += np.random.poisson(mu1 * 0.4)
-            g2 += np.random.poisson(mu2 * 0.4)
+            extra_time = True
+            e1, e2 = self._poisson_pair(rng, et1, et2, swap)
+            g1 += e1
+            g2 += e2
 
             if g1 == g2:
                 went_to_pens = True
-                if self._simulate_penalty(r1, r2):
+                shootout = rng.random() >= 1 - win_p if swap else rng.random() < win_p
+                if shootout:
                     g1 += 1
                 else:
                     g2 += 1
 
+        if self.instruments.enabled: self._record(1, tries, fallback, is_knockout, extra_time, went_to_pens)
+
         # Determine winner
         winner = None if g1 == g2 else (team1 if g1 > g2 else team2)
         return winner, (int(g1), int(g2)), went_to_pens
+
+    # ----------------------------------------------------------
+
+    def simulate_matches(self, ratings1, ratings2, *, is_knockout = False):
+        """
+        Simulate a batch of fixtures given two arrays of ratings.
+
+        Mirrors simulate_match draw for draw (forced W/D/L outcome, up to 50
+        Poisson rejection rounds with the same fallback, extra time and
+        penalties), but every step runs on the whole batch at once.
+
+        Returns:
+            winners: int8 array, 0 = team1 won, 1 = team2 won, -1 = draw.
+            goals:   (n, 2) int array of final scores.
+            pens:    bool array, True where a knockout went to penalties.
+        """
+        r1, r2 = np.broadcast_arrays(np.asarray(ratings1, dtype = float), np.asarray(ratings2, dtype = float))
+        r1, r2 = r1.ravel(), r2.ravel()
+        n = r1.size
+
+        # Decide W/D/L outcome probabilistically: +1 = team1 wins, 0 = draw, -1 = team2 wins
+        win_p = self._elo_win_probabilities(r1, r2)
+        draw_p = self._draw_probabilities(r1, r2)
+        rand = self.rng.random(n)
+        forced = np.where(rand < win_p, 1, np.where(rand < win_p + draw_p, 0, -1))
+
+        mu1, mu2 = self._expected_goals_array(r1, r2)
+
+        g1 = np.zeros(n, dtype = np.int64)
+        g2 = np.zeros(n, dtype = np.int64)
+
+        tries = fallbacks = extra_time = 0
+
+        if self.sampler == "exact":
+            self._sample_exact_many(forced, mu1, mu2, g1, g2)
+        else:
+            tries, fallbacks = self._sample_rejection_many(forced, mu1, mu2, g1, g2)
+
+        pens = np.zeros(n, dtype = bool)
+
+        # Knockout rules: add extra time and/or penalties if tied
+        if is_knockout:
+            level = np.flatnonzero(g1 == g2)
+            extra_time = level.size
+            g1[level] += self.rng.poisson(mu1[level] * 0.4)
+            g2[level] += self.rng.poisson(mu2[level] * 0.4)
+
+            level = level[g1[level] == g2[level]]
+            pens[level] = True
+            shootout = self.rng.random(level.size) < self._elo_win_probabilities(r1[level], r2[level])
+            g1[level] += shootout
+            g2[level] += ~shootout
+
+        if self.instruments.enabled: self._record(n, tries, fallbacks, is_knockout, extra_time, int(pens.sum()))
+
+        # Determine winner index
+        winners = np.where(g1 > g2, 0, np.where(g2 > g1, 1, -1)).astype(np.int8)
+        return winners, np.stack([g1, g2], axis = 1), pens
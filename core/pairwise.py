@@ -0,0 +1,147 @@
+from collections import OrderedDict
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Planes of PairwiseTable.data: W/D probabilities, Poisson means and extra-time means of every (team1, team2)
+PLANES = ("win", "draw", "mu1", "mu2", "et1", "et2")
+
+# Extra-time goal means are this fraction of the full-match means (as in MatchEngine.simulate_match)
+EXTRA_TIME_FACTOR = 0.4
+
+class PairwiseTable:
+    """
+    Dense match parameters for every ordered pairing of one field.
+
+    data[k, i, j] holds plane PLANES[k] for team i (team1) against team j,
+    computed once with the vectorised helpers of a MatchEngine, so every
+    value is exactly what the per-match formulas give. `entries[i][j]` holds
+    the same six numbers as a tuple of Python floats for the scalar match path.
+
+    A table is keyed by (ratings, base_goal_expectation) and can be placed in
+    shared memory (share / attach), read-only, for pool workers.
+    """
+
+    def __init__(self, ratings, base_goal_expectation, data, shm = None):
+        """ Wrap a (len(PLANES), n, n) parameter array; use build() or attach() to create one. """
+        self.ratings = np.asarray(ratings)
+        self.rating_list = self.ratings.tolist()
+        self.base_goal_expectation = base_goal_expectation
+        self.data = data
+        self.shm = shm # SharedMemory backing `data`, if any
+
+        for k, plane in enumerate(PLANES): setattr(self, plane, data[k])
+        self.entries = [list(zip(*(row.tolist() for row in data[:, i]))) for i in range(self.ratings.size)]
+
+    @classmethod
+    def build(cls, ratings, engine):
+        """ Compute the table of `ratings` with the probability and goal formulas of `engine`. """
+        ratings = np.asarray(ratings)
+        r1, r2 = np.meshgrid(ratings, ratings, indexing = "ij")
+
+        mu1, mu2 = engine._expected_goals_array(r1, r2)
+        planes = [engine._elo_win_probabilities(r1, r2), engine._draw_probabilities(r1, r2), mu1, mu2, mu1 * EXTRA_TIME_FACTOR, mu2 * EXTRA_TIME_FACTOR]
+        return cls(ratings, engine.base_goal_expectation, np.stack(planes).astype(float))
+
+    @property
+    def key(self):
+        """ Cache key: the ratings and the base goal expectation the table was built for. """
+        return table_key(self.ratings, self.base_goal_expectation)
+
+    # ----------------------------------------------------------
+
+    def lookup(self, team1, team2):
+        """
+        Return (win, draw, mu1, mu2, et1, et2) for a fixture, or None if the
+        teams have no index or their ratings no longer match the table.
+        """
+        i = getattr(team1, "index", None)
+        j = getattr(team2, "index", None)
+        if i is None or j is None: return None
+        if self.rating_list[i] != team1.rating or self.rating_list[j] != team2.rating: return None
+        return self.entries[i][j]
+
+    # ----------------------------------------------------------
+
+    def share(self):
+        """
+        Copy the table into a new shared-memory block and return a picklable
+        handle for attach(). The caller owns the block: call unlink() when done.
+        """
+        self.shm = shared_memory.SharedMemory(create = True, size = self.data.nbytes)
+        shared = np.ndarray(self.data.shape, dtype = self.data.dtype, buffer = self.shm.buf)
+        shared[:] = self.data
+
+        self.data = shared
+        for k, plane in enumerate(PLANES): setattr(self, plane, shared[k])
+        return {"name": self.shm.name, "ratings": self.rating_list, "base_goal_expectation": self.base_goal_expectation}
+
+    @classmethod
+    def attach(cls, handle):
+        """ Map a table shared by another process (read-only). """
+        shm = shared_memory.SharedMemory(name = handle["name"])
+        n = len(handle["ratings"])
+        data = np.ndarray((len(PLANES), n, n), dtype = float, buffer = shm.buf)
+        data.flags.writeable = False
+        return cls(handle["ratings"], handle["base_goal_expectation"], data, shm)
+
+    def unlink(self):
+        """ Release the shared-memory block created by share(). """
+        if self.shm is None: return
+        self.data = self.data.copy()
+        self.shm.close()
+        self.shm.unlink()
+        self.shm = None
+
+def table_key(ratings, base_goal_expectation):
+    """ Hashable key of a (ratings, base goal expectation) combination. """
+    ratings = np.asarray(ratings)
+    return ratings.dtype.str, ratings.tobytes(), float(base_goal_expectation)
+
+class PairwiseCache:
+    """
+    Bounded LRU of PairwiseTables, one per (ratings, base_goal_expectation).
+
+    Sweeps over ratings sets or goal expectations keep their most recent
+    tables; any other change of either simply maps to a new key, so a stale
+    table is never returned.
+    """
+
+    def __init__(self, maxsize: int = 8):
+        """ Initialize an empty cache. """
+        if maxsize < 1: raise ValueError("PairwiseCache needs maxsize >= 1")
+
+        self.maxsize = maxsize
+        self.tables: OrderedDict = OrderedDict() # key -> PairwiseTable
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.tables)
+
+    def clear(self):
+        """ Drop every cached table. """
+        self.tables.clear()
+
+    def get(self, ratings, engine):
+        """ Return the table of `ratings` under `engine`'s goal expectation, building it on a miss. """
+        key = table_key(ratings, engine.base_goal_expectation)
+        table = self.tables.get(key)
+
+        if table is not None:
+            self.hits += 1
+            self.tables.move_to_end(key)
+            return table
+
+        self.misses += 1
+        return self.put(PairwiseTable.build(ratings, engine))
+
+    def put(self, table):
+        """ Insert a table (e.g. one attached from shared memory), evicting the least recently used. """
+        self.tables[table.key] = table
+        self.tables.move_to_end(table.key)
+        while len(self.tables) > self.maxsize: self.tables.popitem(last = False)
+        return table
+
+# Process-wide cache used by MatchEngine.bind
+PAIRWISE_TABLES = PairwiseCache()
@@ -0,0 +1,339 @@
+from itertools import combinations
+
+import numpy as np
+
+# Final ranking of a bracket's losers within one round:
+#   "match":  by match order (batch_sim.get_rankings_from_knockout, FIFA 2026)
+#   "rating": by rating, best first, ties in table order (PlayoffTournament.get_rankings)
+BRACKET_RANKINGS = ("match", "rating")
+
+# ----------------------------------------------------------
+# Format specs: a format is a list of stages, compiled into a FixturePlan
+# ----------------------------------------------------------
+
+class Groups:
+    """
+    Round-robin groups drawn from pots (GroupStage / FIFA2026GroupStage rules).
+
+    The best groups * size teams by rating are split into `size` pots of
+    `groups` teams; every group gets one team per pot. Groups rank on
+    Points → GD → GF → fair-play points → lots. Decides the bracket slots
+        ("W", g), ("R", g): winner / runner-up of group g ("A", "B", ...)
+        ("T", "ABCDF"):     best still unassigned third from one of those groups,
+                            among the `best_thirds` best thirds (Points → GD → GF)
+    """
+
+    def __init__(self, groups: int = 12, size: int = 4, best_thirds: int = 0):
+        """ Initialize with the number of groups, teams per group and qualifying thirds. """
+        self.groups = groups
+        self.size = size
+        self.best_thirds = best_thirds
+
+    def compile(self, plan):
+        """ Emit the draw, all group fixtures as one step, and the group tables. """
+        labels = [chr(65 + g) for g in range(self.groups)]
+        drawn = plan.registers((self.groups, self.size))
+        plan.add("draw_pots", out = drawn)
+
+        # No group fixture depends on another: one step plays all of them
+        fixtures = list(combinations(range(self.size), 2))
+        home = drawn[:, [a for a, _ in fixtures]]
+        away = drawn[:, [b for _, b in fixtures]]
+        plan.group_fixtures = (len(plan.steps), (self.groups, len(fixtures)))
+        plan.add("play", home = home.ravel(), away = away.ravel(), knockout = False)
+
+        ranked = plan.registers((self.groups, self.size))
+        plan.add("table", groups = drawn, out = ranked)
+
+        for g, label in enumerate(labels):
+            plan.slots[("W", label)] = ranked[g, 0]
+            plan.slots[("R", label)] = ranked[g, 1]
+        if self.best_thirds and self.size > 2: plan.thirds = (ranked[:, 2], labels, self.best_thirds)
+
+class Bracket:
+    """
+    Single-elimination bracket (KnockoutStage / PlayoffTournament rules).
+
+    slots: one reference per bracket position; slot 2k plays slot 2k + 1 (as
+           team1 / team2) and winners keep their order. A reference is ("S", k)
+           for the k-th best team by rating (1-based) or a slot decided by an
+           earlier stage (e.g. ("W", "E") or ("T", "ABCDF"), see Groups).
+    ranking: one of BRACKET_RANKINGS; the bracket ranks its teams champion,
+             runner-up, then losers round by round.
+    """
+
+    def __init__(self, slots, ranking: str = "match"):
+        """ Initialize with the bracket's slot references. """
+        if ranking not in BRACKET_RANKINGS: raise ValueError(f"Unknown ranking {ranking!r}; expected one of {BRACKET_RANKINGS}")
+        if len(slots) < 2 or len(slots) & (len(slots) - 1): raise ValueError("Bracket needs 2, 4, 8, ... slots")
+
+        self.slots = [tuple(s) for s in slots]
+        self.ranking = ranking
+
+    def compile(self, plan):
+        """ Resolve the slots, then emit one step per round. """
+        seeds = [s for s in self.slots if s[0] == "S"]
+        if seeds:
+            if max(k for _, k in seeds) > plan.n_teams: raise ValueError(f"Bracket seeds {max(k for _, k in seeds)} teams, the field has {plan.n_teams}")
+            top = plan.registers((max(k for _, k in seeds),))
+            plan.add("seed", out = top)
+            for _, k in seeds: plan.slots[("S", k)] = top[k - 1]
+
+        thirds = [s for s in self.slots if s[0] == "T"]
+        if thirds:
+            if plan.thirds is None: raise ValueError("Bracket uses best thirds, but no earlier stage qualifies any")
+            candidates, labels, best = plan.thirds
+            allowed = np.array([[label in groups for label in labels] for _, groups in thirds])
+            out = plan.registers((len(thirds),))
+            plan.add("pick", candidates = candidates, best = best, allowed = allowed, out = out)
+            for k, ref in enumerate(thirds): plan.slots[ref] = out[k]
+
+        current = np.array([plan.slot(s) for s in self.slots])
+        losers = []
+        while current.size > 1:
+            won, lost = plan.registers((current.size // 2,)), plan.registers((current.size // 2,))
+            plan.add("play", home = current[0::2], away = current[1::2], knockout = True, win = won, lose = lost)
+            losers.append(lost)
+            current = won
+
+        plan.add("rank_bracket", tiers = [current] + losers[::-1], key = self.ranking)
+
+class SwissRounds:
+    """
+    Swiss rounds over the whole field (SwissTournament with pairing = "sorted").
+
+    Each round sorts the field on points, rating and a fresh random key and
+    pairs neighbours; the final ranking is Points → GD → GF → rating.
+    """
+
+    def __init__(self, rounds: int = 8):
+        """ Initialize with the number of rounds. """
+        self.rounds = rounds
+
+    def compile(self, plan):
+        """ Emit one pairing and one play step per round, then the standings. """
+        if plan.n_teams % 2: raise ValueError("SwissRounds needs an even field")
+
+        field = plan.registers((plan.n_teams,))
+        plan.add("field", out = field)
+
+        for _ in range(self.rounds):
+            pairs = plan.registers((plan.n_teams // 2, 2))
+            plan.add("pair", pool = field, out = pairs)
+            plan.add("play", home = pairs[:, 0], away = pairs[:, 1], knockout = False)
+
+        plan.add("rank_table", teams = field)
+
+def bracket_size(stages):
+    """ Teams in the bracket that ranks a format spec, None if the spec does not end in one. """
+    return len(stages[-1].slots) if isinstance(stages[-1], Bracket) else None
+
+# ----------------------------------------------------------
+
+class FixturePlan:
+    """
+    A format compiled for a field of n_teams: a flat list of steps over a
+    register file of team indices (one row of registers per edition).
+
+    Every step is a dict {"op": name, ...} of small index arrays; "play"
+    steps hold all fixtures that can be played together (e.g. every group
+    match, or one bracket round) as parallel home / away register arrays and
+    may write the winner and loser of each fixture to new registers. Slots
+    such as "winner of group E" are registers written by an earlier step, so
+    the plan is executed in order with no further bookkeeping.
+    """
+
+    def __init__(self, n_teams: int):
+        """ Initialize an empty plan for a field of n_teams. """
+        self.n_teams = n_teams
+        self.n_registers = 0
+        self.steps = []
+        self.slots = {}            # Slot reference -> register
+        self.thirds = None         # (third-place registers, group labels, number qualifying), set by Groups
+        self.group_fixtures = None # (play step index, (groups, fixtures per group)), set by Groups
+
+    def registers(self, shape):
+        """ Allocate new registers, returned as an array of register numbers of `shape`. """
+        size = int(np.prod(shape))
+        regs = np.arange(self.n_registers, self.n_registers + size).reshape(shape)
+        self.n_registers += size
+        return regs
+
+    def slot(self, ref):
+        """ Register holding a slot reference; ValueError if no earlier stage decides it. """
+        if ref not in self.slots: raise ValueError(f"Slot {ref!r} is not decided by an earlier stage")
+        return self.slots[ref]
+
+    def add(self, op, **fields):
+        """ Append a step. """
+        self.steps.append({"op": op, **fields})
+
+    # ----------------------------------------------------------
+
+    def check(self):
+        """ Verify that every register is written once and only read after it is written. """
+        written = np.zeros(self.n_registers, dtype = bool)
+
+        for k, step in enumerate(self.steps):
+            for name in ("home", "away", "groups", "candidates", "pool", "teams"):
+                if name in step and not written[step[name]].all(): raise ValueError(f"Step {k} ({step['op']}) reads a register before it is written")
+            if "tiers" in step and not all(written[t].all() for t in step["tiers"]): raise ValueError(f"Step {k} ({step['op']}) reads a register before it is written")
+
+            for name in ("out", "win", "lose"):
+                regs = step.get(name)
+                if regs is None: continue
+                if written[regs].any(): raise ValueError(f"Step {k} ({step['op']}) writes a register twice")
+                written[regs] = True
+
+        if not self.steps or not self.steps[-1]["op"].startswith("rank"): raise ValueError("The last stage of a format must rank the field")
+
+def compile_format(stages, n_teams: int):
+    """ Compile a format spec (list of stages) for a field of n_teams into a checked FixturePlan. """
+    plan = FixturePlan(n_teams)
+    for stage in stages: stage.compile(plan)
+    plan.check()
+    return plan
+
+# ----------------------------------------------------------
+
+class PlanEngine:
+    """
+    Executes a FixturePlan for many editions at once.
+
+    Every step runs on all editions together: a "play" step is one batched
+    MatchEngine.simulate_matches call, group tables and pairings are
+    lexsorts over (editions, teams) arrays. Team statistics (points, goals,
+    fair play) accumulate per edition and team like Team.record_match.
+    """
+
+    def __init__(self, ratings, match_engine):
+        """ Initialize with the field's ratings (indexed by team) and a match engine. """
+        self.ratings = np.asarray(ratings, dtype = float)
+        self.match_engine = match_engine
+        self.rng = match_engine.rng
+
+    # ----------------------------------------------------------
+
+    def run(self, plan, n: int):
+        """
+        Play n editions of the plan.
+
+        Stores:
+            regs        (n, n_registers) team index held by every register
+            goals       list of (n, fixtures, 2) scores, one per play step
+            positions   (n, n_teams) finishing positions (0 = not ranked)
+        """
+        if plan.n_teams != self.ratings.size: raise ValueError(f"Plan is compiled for {plan.n_teams} teams, the field has {self.ratings.size}")
+
+        self.plan = plan
+        self.n = n
+        self.rows = np.arange(n)[:, None]
+        self.regs = np.zeros((n, plan.n_registers), dtype = np.int64)
+        self.points, self.goals_for, self.goals_against, self.fair_play = (np.zeros((n, plan.n_teams), dtype = np.int64) for _ in range(4))
+        self.goals = []
+        self.positions = np.zeros((n, plan.n_teams), dtype = np.int16)
+
+        for step in plan.steps: getattr(self, "_" + step["op"])(step)
+
+    @property
+    def group_goals(self):
+        """ (n, groups, fixtures, 2) scores of the group fixtures in GroupStage order (None without groups). """
+        if self.plan.group_fixtures is None: return None
+        step, shape = self.plan.group_fixtures
+        index = [s for s in self.plan.steps[:step + 1] if s["op"] == "play"]
+        return self.goals[len(index) - 1].reshape((self.n,) + shape + (2,))
+
+    # ----------------------------------------------------------
+
+    def _field(self, step):
+        """ Every team, in table order. """
+        self.regs[:, step["out"]] = np.arange(self.ratings.size)
+
+    def _seed(self, step):
+        """ The best teams by rating (stable: equal ratings keep table order). """
+        self.regs[:, step["out"]] = np.argsort(-self.ratings, kind = "stable")[:step["out"].size]
+
+    def _draw_pots(self, step):
+        """ Pot draw: shuffle each pot and deal one team per pot into every group. """
+        groups, size = step["out"].shape
+        pots = np.argsort(-self.ratings, kind = "stable")[:groups * size].reshape(size, groups)
+        perm = np.argsort(self.rng.random((self.n, size, groups)), axis = -1)
+        self.regs[:, step["out"]] = pots[np.arange(size)[:, None], perm].transpose(0, 2, 1)
+
+    def _play(self, step):
+        """ Play every fixture of the step in one batch and record both teams' statistics. """
+        t1, t2 = self.regs[:, step["home"]], self.regs[:, step["away"]]
+        winners, goals, _ = self.match_engine.simulate_matches(self.ratings[t1], self.ratings[t2], is_knockout = step["knockout"])
+        goals = goals.reshape(t1.shape + (2,))
+        self.goals.append(goals)
+
+        # Team.record_match for both sides (a team may play several fixtures of one step)
+        g1, g2 = goals[..., 0], goals[..., 1]
+        teams = np.concatenate([t1, t2], axis = 1)
+        gf, ga = np.concatenate([g1, g2], axis = 1), np.concatenate([g2, g1], axis = 1)
+        u = 3 * self.rng.random(teams.shape)
+        yellows = u.astype(np.int64)
+
+        rows = np.broadcast_to(self.rows, teams.shape)
+        np.add.at(self.points, (rows, teams), 3 * (gf > ga) + (gf == ga))
+        np.add.at(self.goals_for, (rows, teams), gf)
+        np.add.at(self.goals_against, (rows, teams), ga)
+        np.add.at(self.fair_play, (rows, teams), yellows + 3 * (u - yellows < 0.05))
+
+        if step.get("win") is not None:
+            first = winners.reshape(t1.shape) == 0
+            self.regs[:, step["win"]] = np.where(first, t1, t2)
+            self.regs[:, step["lose"]] = np.where(first, t2, t1)
+
+    def _stats(self, teams):
+        """ (points, goal difference, goals for, fair play) of the teams in `teams` (editions first). """
+        rows = self.rows.reshape((self.n,) + (1,) * (teams.ndim - 1))
+        gf = self.goals_for[rows, teams]
+        return self.points[rows, teams], gf - self.goals_against[rows, teams], gf, self.fair_play[rows, teams]
+
+    def _table(self, step):
+        """ Rank every group: points, GD, GF desc, fair-play points asc, then lots. """
+        teams = self.regs[:, step["groups"]]
+        points, gd, gf, fair_play = self._stats(teams)
+        order = np.lexsort((self.rng.random(teams.shape), fair_play, -gf, -gd, -points), axis = -1)
+        self.regs[:, step["out"]] = np.take_along_axis(teams, order, axis = -1)
+
+    def _pick(self, step):
+        """ Best thirds (Points → GD → GF, earlier group first), each slot taking the best remaining allowed one. """
+        teams = self.regs[:, step["candidates"]]
+        points, gd, gf, _ = self._stats(teams)
+        index = np.broadcast_to(np.arange(teams.shape[1]), teams.shape)
+        best = np.lexsort((index, -gf, -gd, -points), axis = -1)[:, :step["best"]]
+
+        rows = np.arange(self.n)
+        available = np.ones(best.shape, dtype = bool)
+        for k, allowed in enumerate(step["allowed"]):
+            ok = allowed[best] & available
+            pick = np.where(ok.any(axis = 1), ok.argmax(axis = 1), available.argmax(axis = 1))
+            available[rows, pick] = False
+            self.regs[:, step["out"][k]] = teams[rows, best[rows, pick]]
+
+    def _pair(self, step):
+        """ Sort the pool on points, rating and a random key (all descending) and pair neighbours. """
+        teams = self.regs[:, step["pool"]]
+        points = self.points[self.rows, teams]
+        order = np.lexsort((-self.rng.random(teams.shape), -self.ratings[teams], -points), axis = -1)
+        self.regs[:, step["out"].ravel()] = np.take_along_axis(teams, order, axis = -1)
+
+    def _rank_bracket(self, step):
+        """ Positions from the bracket tiers (champion, runner-up, losers by round). """
+        tiers = []
+        for regs in step["tiers"]:
+            teams = self.regs[:, regs]
+            if step["key"] == "rating": teams = np.take_along_axis(teams, np.lexsort((teams, -self.ratings[teams]), axis = -1), axis = -1)
+            tiers.append(teams)
+
+        ranking = np.concatenate(tiers, axis = 1)
+        np.put_along_axis(self.positions, ranking, np.arange(1, ranking.shape[1] + 1, dtype = np.int16), axis = 1)
+
+    def _rank_table(self, step):
+        """ Positions from the standings: points, GD, GF, rating (desc), ties in table order. """
+        teams = self.regs[:, step["teams"]]
+        points, gd, gf, _ = self._stats(teams)
+        ranking = np.take_along_axis(teams, np.lexsort((teams, -self.ratings[teams], -gf, -gd, -points), axis = -1), axis = -1)
+        np.put_along_axis(self.positions, ranking, np.arange(1, ranking.shape[1] + 1, dtype = np.int16), axis = 1)
@@ -0,0 +1,149 @@
+from collections import OrderedDict
+from math import lgamma, log
+
+import numpy as np
+
+# Outcome codes shared with MatchEngine: +1 = team1 wins, 0 = draw, -1 = team2 wins
+OUTCOMES = (1, 0, -1)
+
+class ScoreTableCache:
+    """
+    Bounded LRU cache of outcome-conditioned scoreline tables.
+
+    For a fixture with Poisson means (mu1, mu2) the joint score distribution is
+    truncated at max_goals per side and split into three regions (team1 wins,
+    draw, team2 wins). Each region is renormalised and stored as a Walker/Vose
+    alias table, so drawing a scoreline for a forced outcome costs O(1).
+
+    Tables are keyed by (mu1, mu2), so they stay valid when the goal model
+    changes (e.g. MatchEngine.base_goal_expectation), and are stored row-wise in preallocated arrays
+    so the batch sampler can gather many fixtures with plain fancy indexing.
+    """
+
+    def __init__(self, maxsize: int = 4096, max_goals: int = 15):
+        """ Initialize an empty cache. """
+        if maxsize < 1: raise ValueError("ScoreTableCache needs maxsize >= 1")
+
+        self.maxsize = maxsize
+        self.max_goals = max_goals
+
+        # Scoreline cells of each outcome region, shared by every table
+        g1, g2 = np.divmod(np.arange((max_goals + 1) ** 2), max_goals + 1)
+        self._cell_outcome = np.sign(g1 - g2)
+        self.cells = {o: (g1[self._cell_outcome == o], g2[self._cell_outcome == o]) for o in OUTCOMES}
+
+        # Row storage grows on demand up to maxsize
+        self._capacity = 0
+        self.prob = {o: np.empty((0, len(self.cells[o][0]))) for o in OUTCOMES}
+        self.alias = {o: np.empty((0, len(self.cells[o][0])), dtype = np.int16) for o in OUTCOMES}
+
+        self.rows: OrderedDict = OrderedDict() # (mu1, mu2) -> row
+        self.hits = 0
+        self.misses = 0
+
+    # ----------------------------------------------------------
+
+    def __len__(self):
+        return len(self.rows)
+
+    def clear(self):
+        """ Drop every cached table. """
+        self.rows.clear()
+
+    def _grow(self):
+        """ Double row storage (bounded by maxsize). """
+        new_cap = min(self.maxsize, max(64, 2 * self._capacity))
+
+        for o in OUTCOMES:
+            prob = np.empty((new_cap, self.prob[o].shape[1]))
+            alias = np.empty((new_cap, self.alias[o].shape[1]), dtype = np.int16)
+            prob[:self._capacity] = self.prob[o][:self._capacity]
+            alias[:self._capacity] = self.alias[o][:self._capacity]
+            self.prob[o], self.alias[o] = prob, alias
+
+        self._capacity = new_cap
+
+    def _joint_pmf(self, mu1, mu2):
+        """ Truncated Poisson x Poisson score probabilities, flattened in cell order. """
+        k = np.arange(self.max_goals + 1)
+        log_fact = np.array([lgamma(i + 1) for i in k])
+
+        p1 = np.exp(k * log(mu1) - mu1 - log_fact)
+        p2 = np.exp(k * log(mu2) - mu2 - log_fact)
+        return np.outer(p1, p2).ravel()
+
+    @staticmethod
+    def _build_alias(weights):
+        """ Vose's alias method: return (threshold, alias) arrays for the given weights. """
+        m = len(weights)
+        scaled = weights * (m / weights.sum())
+        prob = np.ones(m)
+        alias = np.arange(m, dtype = np.int16)
+
+        small = [i for i in range(m) if scaled[i] < 1.0]
+        large = [i for i in range(m) if scaled[i] >= 1.0]
+
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        return prob, alias
+
+    def _fill(self, row, mu1, mu2):
+        """ Build the three outcome tables of one fixture into the given row. """
+        joint = self._joint_pmf(mu1, mu2)
+
+        for o in OUTCOMES:
+            self.prob[o][row], self.alias[o][row] = self._build_alias(joint[self._cell_outcome == o])
+
+    # ----------------------------------------------------------
+
+    def row_for(self, key, mu1, mu2):
+        """ Return the storage row for `key`, building (and possibly evicting) on a miss. """
+        row = self.rows.get(key)
+
+        if row is not None:
+            self.hits += 1
+            self.rows.move_to_end(key)
+            return row
+
+        self.misses += 1
+
+        if len(self.rows) < self._capacity:
+            row = len(self.rows)
+        elif self._capacity < self.maxsize:
+            row = len(self.rows)
+            self._grow()
+        else:
+            _, row = self.rows.popitem(last = False) # Evict least recently used
+
+        self._fill(row, mu1, mu2)
+        self.rows[key] = row
+        return row
+
+    def sample(self, row, outcome, u_col, u_acc):
+        """ Draw one scoreline for `outcome` from a row using two uniforms. """
+        prob, alias = self.prob[outcome][row], self.alias[outcome][row]
+        col = int(u_col * len(prob))
+        cell = col if u_acc < prob[col] else alias[col]
+
+        g1, g2 = self.cells[outcome]
+        return int(g1[cell]), int(g2[cell])
+
+    def sample_many(self, rows, outcome, u_col, u_acc):
+        """ Vectorised sample(): one scoreline per entry of `rows`, all with the same outcome. """
+        prob, alias = self.prob[outcome], self.alias[outcome]
+        col = (u_col * prob.shape[1]).astype(np.int64)
+        cell = np.where(u_acc < prob[rows, col], col, alias[rows, col])
+
+        g1, g2 = self.cells[outcome]
+        return g1[cell], g2[cell]
+
+    def conditional_pmf(self, mu1, mu2, outcome):
+        """ Exact truncated score distribution for one outcome, as a dict {(g1, g2): p}. """
+        p = self._joint_pmf(mu1, mu2)[self._cell_outcome == outcome]
+        g1, g2 = self.cells[outcome]
+        return {(int(a), int(b)): float(q) for a, b, q in zip(g1, g2, p / p.sum())}
@@ -0,0 +1,93 @@
+class GroupStandings:
+    """
+    Standings of one group, maintained as results come in.
+
+    record() updates both teams (Team.record_match) and stores the result,
+    then invalidates the cached ranking; ranking() re-ranks only after a
+    write. Tie-breaks follow GroupStage: Points → Goal Difference → Goals
+    For → (optional head-to-head) → Fair-play points → Drawing of lots.
+
+        - Head-to-head (points, goal difference, goals scored in the matches
+          between the tied teams) is off by default and is only computed for
+          a block of teams level on the overall criteria.
+        - Lots are drawn once per team, the first time it ends up in a tie no
+          other criterion breaks, and are stored: every later ranking of the
+          same table gives the same order.
+    """
+
+    def __init__(self, teams, rng, head_to_head: bool = False):
+        """ Initialize the standings of `teams`; rng draws fair-play cards and lots. """
+        self.teams = list(teams)
+        self.rng = rng
+        self.head_to_head = head_to_head
+
+        self.results = [] # (team1, team2, score) in the order recorded
+        self.lots = {}    # Team -> lot, drawn on first need
+        self._ranking = None
+
+    # ----------------------------------------------------------
+
+    def record(self, team1, team2, score):
+        """ Record one result: update both teams and invalidate the cached ranking. """
+        team1.record_match(score[0], score[1], self.rng)
+        team2.record_match(score[1], score[0], self.rng)
+        self.results.append((team1, team2, score))
+        self._ranking = None
+
+    def invalidate(self):
+        """ Drop the cached ranking (call after changing team statistics directly). """
+        self._ranking = None
+
+    def ranking(self):
+        """ Return the teams in ranked order (cached until the next record()). """
+        if self._ranking is None: self._ranking = self._rank()
+        return list(self._ranking)
+
+    # ----------------------------------------------------------
+
+    def _lot(self, team):
+        """ The team's lot, drawn the first time it is needed. """
+        if team not in self.lots: self.lots[team] = self.rng.random()
+        return self.lots[team]
+
+    def _mini_table(self, block):
+        """ Head-to-head (points, goal difference, goals for) of each team over the matches within `block`. """
+        inside = set(block)
+        table = {t: [0, 0, 0] for t in block}
+
+        for t1, t2, (g1, g2) in self.results:
+            if t1 not in inside or t2 not in inside: continue
+            for team, gf, ga in ((t1, g1, g2), (t2, g2, g1)):
+                row = table[team]
+                row[0] += 3 if gf > ga else 1 if gf == ga else 0
+                row[1] += gf - ga
+                row[2] += gf
+
+        return {t: tuple(row) for t, row in table.items()}
+
+    def _split_ties(self, ordered, key, resolve):
+        """ Walk `ordered` (sorted by `key`) and pass every block of equal keys through resolve(). """
+        out = []
+        i = 0
+
+        while i < len(ordered):
+            j = i + 1
+            while j < len(ordered) and key(ordered[j]) == key(ordered[i]): j += 1
+            out.extend(resolve(ordered[i:j]) if j - i > 1 else ordered[i:j])
+            i = j
+
+        return out
+
+    def _break_tie(self, block):
+        """ Order a block level on points, goal difference and goals for. """
+        mini = self._mini_table(block) if self.head_to_head else {}
+        key = lambda t: (mini.get(t, ()), -t.fair_play)
+
+        # Lots only for teams still level after head-to-head and fair play
+        ordered = sorted(block, key = key, reverse = True)
+        return self._split_ties(ordered, key, lambda tied: sorted(tied, key = self._lot, reverse = True))
+
+    def _rank(self):
+        """ Full ranking: overall criteria for everyone, tie-breaks only inside tied blocks. """
+        key = lambda t: (t.points, t.goal_difference(), t.goals_for)
+        return self._split_ties(sorted(self.teams, key = key, reverse = True), key, self._break_tie)
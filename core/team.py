@@ -1,4 +1,7 @@
-import random
+import numpy as np
+
+# Fallback generator for callers that do not inject their own
+_default_rng = np.random.default_rng()
 
 class Team:
     """
@@ -26,8 +29,8 @@ class Team:
 
     # ----------------------------------------------------------
 
-    def record_match(self, goals_for: int, goals_against: int):
-        """ Record the outcome of a match. """
+    def record_match(self, goals_for: int, goals_against: int, rng = None):
+        """ Record the outcome of a match (rng draws the fair-play cards). """
         self.goals_for += goals_for
         self.goals_against += goals_against
 
@@ -41,8 +44,9 @@ class Team:
             self.losses += 1
 
         # Fair play: yellow cards = 1 pt, red cards = 3 pts
-        yellows = random.randint(0, 2)
-        reds = 1 if random.random() < 0.05 else 0
+        rng = rng if rng is not None else _default_rng
+        yellows = int(rng.random() * 3)
+        reds = 1 if rng.random() < 0.05 else 0
         self.fair_play += yellows + 3 * reds
 
     # ----------------------------------------------------------
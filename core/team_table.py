@@ -0,0 +1,164 @@
+import csv
+
+import numpy as np
+
+from core.team import Team, _default_rng
+
+# Row order of TeamTable.stats; group / group_pos are stored 1-based so 0 means "unset"
+STAT_FIELDS = ("points", "wins", "draws", "losses", "goals_for", "goals_against", "fair_play", "group", "group_pos")
+
+class TeamTable:
+    """
+    Struct-of-arrays store for a whole field of teams.
+
+    Every per-team statistic lives in one (len(STAT_FIELDS), n) integer array,
+    so resetting a field between editions is a single vectorised zero and
+    batch code can update many teams at once by index. `teams` holds one
+    TeamView per row for code that still expects Team objects.
+    """
+
+    def __init__(self, names, ratings):
+        """ Build a table from parallel name / rating sequences. """
+        if len(names) != len(ratings): raise ValueError("TeamTable needs one rating per name")
+
+        self.names = list(names)
+        self.rating = np.asarray(ratings)
+        self.stats = np.zeros((len(STAT_FIELDS), len(self.names)), dtype = np.int64)
+
+        # Named row views into self.stats
+        for k, field in enumerate(STAT_FIELDS): setattr(self, field, self.stats[k])
+
+        # Labels behind the 1-based group codes (e.g. "A" -> 1)
+        self.group_labels: list = []
+
+        self.teams = [TeamView(self, i) for i in range(len(self.names))]
+
+    @classmethod
+    def from_csv(cls, csv_path):
+        """ Build a table from a ratings CSV with Country and Rating columns. """
+        with open(csv_path, newline = "") as fh:
+            rows = list(csv.DictReader(fh))
+        return cls([r["Country"] for r in rows], [int(r["Rating"]) for r in rows])
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """ Build a table from a ratings DataFrame with Country and Rating columns. """
+        return cls(df["Country"].tolist(), df["Rating"].astype(int).tolist())
+
+    # ----------------------------------------------------------
+
+    def __len__(self):
+        return len(self.names)
+
+    def reset(self):
+        """ Reset all match and group-related statistics of every team. """
+        self.stats[:] = 0
+
+    def group_code(self, label):
+        """ Return the 1-based code of a group label, registering it if new. """
+        if label is None: return 0
+        if label not in self.group_labels: self.group_labels.append(label)
+        return self.group_labels.index(label) + 1
+
+    def group_label(self, code):
+        """ Inverse of group_code. """
+        return None if code == 0 else self.group_labels[code - 1]
+
+    # ----------------------------------------------------------
+
+    def record_many(self, idx, goals_for, goals_against, rng = None):
+        """
+        Vectorised Team.record_match for many results at once.
+
+        idx / goals_for / goals_against are parallel arrays (one entry per
+        team-appearance); a team may appear several times.
+        """
+        idx = np.asarray(idx)
+        gf = np.asarray(goals_for)
+        ga = np.asarray(goals_against)
+        rng = rng if rng is not None else _default_rng
+
+        win, draw = gf > ga, gf == ga
+        yellows = (rng.random(idx.size) * 3).astype(np.int64)
+        reds = rng.random(idx.size) < 0.05
+
+        # One scatter-add per statistic; np.add.at handles repeated indices
+        for field, delta in (
+            ("goals_for", gf),
+            ("goals_against", ga),
+            ("points", 3 * win + draw),
+            ("wins", win),
+            ("draws", draw),
+            ("losses", ~(win | draw)),
+            ("fair_play", yellows + 3 * reds),
+        ):
+            np.add.at(getattr(self, field), idx, delta)
+
+    def goal_difference(self):
+        """ Return the goal difference of every team as an array. """
+        return self.goals_for - self.goals_against
+
+def _stat_property(k):
+    """ Property that reads / writes row k of the owning table's stats array. """
+    def get(self):
+        return self._col.item(k)
+
+    def set(self, value):
+        self._col[k] = value
+
+    return property(get, set)
+
+class TeamView(Team):
+    """
+    Team-compatible view of one row of a TeamTable.
+
+    Behaves like core.team.Team (same attributes and methods), but every
+    statistic is stored in the table, so identity is the row index.
+    """
+
+    points = _stat_property(0)
+    wins = _stat_property(1)
+    draws = _stat_property(2)
+    losses = _stat_property(3)
+    goals_for = _stat_property(4)
+    goals_against = _stat_property(5)
+    fair_play = _stat_property(6)
+
+    def __init__(self, table, index):
+        """ Bind the view to row `index` of `table`. """
+        self.table = table
+        self.index = index
+        self._col = table.stats[:, index] # Writable view of this team's column
+        self.name = table.names[index]
+        self.rating = table.rating[index].item()
+
+    @property
+    def group(self):
+        return self.table.group_label(self._col.item(7))
+
+    @group.setter
+    def group(self, label):
+        self._col[7] = self.table.group_code(label)
+
+    @property
+    def group_pos(self):
+        return self._col.item(8) or None
+
+    @group_pos.setter
+    def group_pos(self, pos):
+        self._col[8] = pos or 0
+
+    def reset_stats(self):
+        """ Reset this team's row. """
+        self._col[:] = 0
+
+    def record_match(self, goals_for: int, goals_against: int, rng = None):
+        """ Record the outcome of a match with a single write into the table column. """
+        rng = rng if rng is not None else _default_rng
+        win, draw = goals_for > goals_against, goals_for == goals_against
+
+        # Fair play: yellow cards = 1 pt, red cards = 3 pts (same draws as Team.record_match)
+        yellows = int(rng.random() * 3)
+        reds = 1 if rng.random() < 0.05 else 0
+
+        self._col[:7] += (3 * win + draw, win, draw, not (win or draw), goals_for, goals_against, yellows + 3 * reds)
@@ -1,7 +1,4 @@
 import numpy as np
-import pandas as pd
-from scipy import stats
-import matplotlib.pyplot as plt
 
 class EloCorrelationEvaluator:
     """
@@ -15,9 +12,13 @@ class EloCorrelationEvaluator:
 
     def evaluate(self, final_standings, initial_elos):
         """ Compute correlation between Elo and final position for a single tournament. """
-        # Merge by team and sort teams by descending Elo
+        # pandas / scipy are only needed here, so batch code using evaluate_batch does not import them
+        import pandas as pd
+        from scipy import stats
+
+        # Merge by team and sort teams by descending Elo (stable: equal Elo keeps finishing order)
         merged_data = pd.merge(final_standings[['team', 'position']], initial_elos[['team', 'elo']], on = 'team')
-        merged_data = merged_data.sort_values('elo', ascending = False)
+        merged_data = merged_data.sort_values('elo', ascending = False, kind = 'stable')
 
         # Assign Elo-based rank (1 = highest Elo)
         merged_data['elo_rank'] = range(1, len(merged_data) + 1)
@@ -42,6 +43,55 @@ class EloCorrelationEvaluator:
         self.correlation_results.append(result)
         return result
 
+    def evaluate_batch(self, positions, elos):
+        """
+        Vectorised evaluate() for many tournaments at once (no pandas / scipy).
+
+        positions: (n, teams) finishing position of every team in every edition,
+                   1 = winner, 0 = team did not take part (excluded, as the merge in evaluate() does)
+        elos:      (teams,) initial Elo of each team, in the same column order
+
+        Returns a dict of (n,) arrays: correlation, n_teams, max_diff, avg_diff.
+        Results are not added to correlation_results.
+        """
+        pos = np.asarray(positions, dtype = float)
+        elos = np.asarray(elos, dtype = float)
+        mask = pos > 0
+        m = mask.astype(float)
+        n_teams = m.sum(axis = 1)
+
+        # For every team: how many participating teams have a higher / equal Elo (one matmul each)
+        higher = (elos[None, :] > elos[:, None]).astype(float)
+        equal = (elos[None, :] == elos[:, None]) & ~np.eye(elos.size, dtype = bool)
+        n_higher = m @ higher.T
+        n_equal = m @ equal.T.astype(float)
+
+        # Elo rank 1 = highest Elo; equal Elo is ordered by finishing position (stable sort in evaluate)
+        ti, tj = np.nonzero(equal)
+        tie_ahead = (m[:, tj] * (pos[:, tj] < pos[:, ti])) @ (ti[:, None] == np.arange(elos.size)).astype(float)
+        elo_rank = 1 + n_higher + tie_ahead
+
+        rank_diff = np.abs(pos - elo_rank) * m
+        max_diff = rank_diff.max(axis = 1)
+        avg_diff = rank_diff.sum(axis = 1) / n_teams
+
+        # Spearman ρ = Pearson on ranks: reverse position vs. average (tie-aware) ascending Elo rank
+        x = (n_teams[:, None] - pos + 1) * m
+        y = (n_teams[:, None] - n_higher - n_equal / 2) * m
+        mean = ((n_teams + 1) / 2)[:, None]
+
+        cov = ((x - mean) * (y - mean) * m).sum(axis = 1)
+        var_x = ((x - mean) ** 2 * m).sum(axis = 1)
+        var_y = ((y - mean) ** 2 * m).sum(axis = 1)
+        correlation = cov / np.sqrt(var_x * var_y)
+
+        return {
+            'correlation': correlation,
+            'n_teams': n_teams.astype(int),
+            'max_diff': max_diff,
+            'avg_diff': avg_diff,
+        }
+
     def get_summary(self):
         """ Summarize all evaluations conducted so far. """
         if not self.correlation_results: return "No evaluations performed yet."
@@ -66,44 +116,6 @@ class EloCorrelationEvaluator:
         return summary
 
     def plot_correlation(self, final_standings, initial_elos):
-        """ Plot relationship between Elo rating and final position. """
-        try:
-            merged_data = pd.merge(final_standings[['team', 'position']], initial_elos[['team', 'elo']], on = 'team')
-            merged_data = merged_data.sort_values('elo', ascending = False)
-            merged_data['elo_rank'] = range(1, len(merged_data) + 1)
-
-            # Scatter plot: Elo vs final position
-            plt.figure(figsize = (10,7))
-            plt.scatter(merged_data['elo_rank'], merged_data['position'], s = 30)
-
-            # Annotate each team
-            for _, row in merged_data.iterrows(): plt.annotate(row['team'], (row['elo_rank'], row['position']), xytext = (5, 5), textcoords = 'offset points')
-
-            # Add linear trend line
-            z = np.polyfit(merged_data['elo_rank'], merged_data['position'], 1)
-            p = np.poly1d(z)
-            plt.plot(merged_data['elo_rank'], p(merged_data['elo_rank']), "r--")
-
-            # Show correlation on plot
-            correlation = stats.spearmanr(merged_data['position'], merged_data['elo_rank'])[0]
-            plt.annotate(f'Correlation: {correlation:.3f}', xy = (0.025, 0.950), xycoords = 'axes fraction', fontsize = 12)
-
-            # Final plot formatting
-            plt.title('Final Position vs Initial ELO', fontsize = 18, pad = 15)
-            plt.xlabel('Initial ELO', fontsize = 12)
-            plt.ylabel('Final Position', fontsize = 12)
-
-            elo_min = merged_data['elo_rank'].min()
-            elo_max = merged_data['elo_rank'].max()
-            plt.xticks(np.arange(0, elo_max + 2))
-
-            pos_min = merged_data['position'].min()
-            pos_max = merged_data['position'].max()
-            plt.yticks(np.arange(int(pos_min // 5 * 5), int(pos_max // 5 * 5) + 6, 5))
-
-            plt.tight_layout()
-            return plt
-
-        except ImportError:
-            print("Matplotlib is required for plotting. Please install it using 'pip install matplotlib'")
-            return None 
+        """ Plot relationship between Elo rating and final position (see evaluators.plotting). """
+        from evaluators.plotting import plot_correlation
+        return plot_correlation(final_standings, initial_elos)
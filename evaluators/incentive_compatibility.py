@@ -1,13 +1,73 @@
-from collections import defaultdict
+from functools import lru_cache
+from itertools import combinations, product
+
+import numpy as np
+
+# Qualification status of a team before a fixture
+LIVE, SAFE, OUT = 0, 1, 2
+
+@lru_cache(maxsize = None)
+def status_table(group_size: int = 4, safe_places: int = 2, live_places: int = 3):
+    """
+    Exact qualification status of every team in every reachable group state.
+
+    Fixtures are played in GroupStage order (combinations of the group slots).
+    The state before fixture f is the points of each slot (matches played
+    follow from f), packed as code = sum(points[t] * base ** t). Enumerating
+    every W/D/L completion of the remaining fixtures gives, per team:
+        SAFE: in every completion at most safe_places - 1 other teams reach
+              its points (a top-`safe_places` finish whatever the tie-breaks)
+        OUT:  in every completion at least live_places teams finish strictly
+              above it (no place that can still qualify, e.g. FIFA 2026's
+              best thirds, is reachable)
+        LIVE: anything else
+
+    Returns (table, base): table[f, code] is the (group_size,) status array.
+    """
+    fixtures = list(combinations(range(group_size), 2))
+    base = 3 * (group_size - 1) + 1
+    weights = base ** np.arange(group_size)
+    table = np.full((len(fixtures), base ** group_size, group_size), LIVE, dtype = np.int8)
+
+    def gains(fx):
+        """ (3 ** len(fx), group_size) points from every W/D/L pattern of the fixtures fx. """
+        pts = np.zeros((3 ** len(fx), group_size), dtype = np.int64)
+        for k, pattern in enumerate(product((3, 1, 0), repeat = len(fx))):
+            for (a, b), p in zip(fx, pattern):
+                pts[k, a] += p
+                pts[k, b] += {3: 0, 1: 1, 0: 3}[p]
+        return pts
+
+    for f in range(len(fixtures)):
+        before, rest = gains(fixtures[:f]), gains(fixtures[f:])
+        final = before[:, None, :] + rest[None, :, :] # (states, completions, teams)
+
+        at_least = (final[..., None, :] >= final[..., :, None]).sum(axis = -1) - 1 # Others with >= points
+        above = (final[..., None, :] > final[..., :, None]).sum(axis = -1)         # Others with > points
+
+        status = np.where((at_least <= safe_places - 1).all(axis = 1), SAFE, np.where((above >= live_places).all(axis = 1), OUT, LIVE))
+        table[f, before @ weights] = status
+
+    return table, base
 
 class IncentiveCompatibilityEvaluator:
     """
     Evaluates incentive compatibility of a tournament format.
     Supports:
         - Full evaluation using recorded match results
+        - Batch evaluation of group results for many editions (evaluate_batch)
         - Heuristic fallback for incomplete simulations
+
+    A group fixture is low-incentive when, before kickoff, neither team can
+    change its own qualification fate: each is already safe or already out
+    (see status_table; third places that may still qualify count as live).
     """
 
+    def __init__(self, safe_places: int = 2, live_places: int = 3):
+        """ Initialize with the group places that qualify for sure (safe_places) and possibly (live_places; FIFA 2026: best thirds). """
+        self.safe_places = safe_places
+        self.live_places = live_places
+
     def evaluate(self, tournament):
         """ Evaluate a tournament object for incentive issues. """
         if hasattr(tournament, "group_stage"):
@@ -38,34 +98,62 @@ class IncentiveCompatibilityEvaluator:
             "pct_low_incentive": pct,
         }
 
-    def _evaluate_group_stage_full(self, gs):
-        """ Full match-by-match evaluation using group stage results. """
-        low = tot = 0
+    def evaluate_batch(self, goals):
+        """
+        Vectorised group-stage evaluation for many editions at once.
+
+        goals: (n, groups, fixtures, 2) score of every group fixture, fixtures
+               in GroupStage order (as FIFA2026BatchGroupStage.goals)
+
+        Returns a dict of (n,) arrays: total_matches, low_incentive, pct_low_incentive.
+        """
+        goals = np.asarray(goals)
+        n_fix = goals.shape[-2]
+        group_size = int(round((1 + (1 + 8 * n_fix) ** 0.5) / 2))
+        table, base = status_table(group_size, self.safe_places, self.live_places)
+        fixtures = np.array(list(combinations(range(group_size), 2)))
+
+        # Points of every slot before each fixture (exclusive running sum over fixtures)
+        sign = np.sign(goals[..., 0] - goals[..., 1]) + 1 # 0 = team2 won, 1 = draw, 2 = team1 won
+        home = np.eye(group_size, dtype = np.int64)[fixtures[:, 0]]
+        away = np.eye(group_size, dtype = np.int64)[fixtures[:, 1]]
+        won = np.array([0, 1, 3])[sign][..., None] * home + np.array([3, 1, 0])[sign][..., None] * away
+        before = np.cumsum(won, axis = -2) - won
+
+        # Look up both teams' status in the precomputed table
+        code = before @ base ** np.arange(group_size)
+        status = table[np.arange(n_fix), code]                       # (n, groups, fixtures, teams)
+        s1 = status[..., np.arange(n_fix), fixtures[:, 0]]
+        s2 = status[..., np.arange(n_fix), fixtures[:, 1]]
+
+        low = ((s1 != LIVE) & (s2 != LIVE)).sum(axis = (-2, -1))
+        tot = np.full(low.shape, goals.shape[-3] * n_fix)
 
-        for _, matches in gs.results.items():
-            pts = defaultdict(int)    # Team points
-            played = defaultdict(int) # Matches played
-
-            for t1, t2, score, _ in matches:
-                tot += 1
-                if self._both_safe_or_out(t1, t2, pts, played): low += 1
+        return {
+            "total_matches": tot,
+            "low_incentive": low,
+            "pct_low_incentive": 100 * low / np.maximum(tot, 1),
+        }
 
-                # Update points based on match result
-                p1, p2 = score
+    def _evaluate_group_stage_full(self, gs):
+        """ Full match-by-match evaluation using group stage results (through evaluate_batch). """
+        goals = []
+        round_robin = {}
 
-                if p1 > p2:
-                    pts[t1] += 3
-                elif p2 > p1:
-                    pts[t2] += 3
-                else:
-                    pts[t1] += 1
-                    pts[t2] += 1
+        for matches in gs.results.values():
+            # Slots in order of first appearance, which for GroupStage's round robin is the group order
+            slots = {}
+            for t1, t2, *_ in matches:
+                for t in (t1, t2): slots.setdefault(t, len(slots))
 
-                # Track games played
-                played[t1] += 1
-                played[t2] += 1
+            fixtures = [(slots[t1], slots[t2]) for t1, t2, *_ in matches]
+            if len(slots) not in round_robin: round_robin[len(slots)] = list(combinations(range(len(slots)), 2))
+            if fixtures != round_robin[len(slots)]: raise ValueError("group results are not in round-robin order")
+            goals.append([score for _, _, score, *_ in matches])
 
-        return low, tot
+        if not goals: return 0, 0
+        res = self.evaluate_batch(np.array(goals)[None])
+        return int(res["low_incentive"][0]), int(res["total_matches"][0])
 
     def _evaluate_group_stage_heuristic(self, gs):
         """ Heuristic evaluation when results aren't available. """
@@ -88,18 +176,3 @@ class IncentiveCompatibilityEvaluator:
         # Assume 1 low-incentive match per group as a heuristic
         low_incentive = num_groups
         return low_incentive, total_matches
-
-    def _both_safe_or_out(self, t1, t2, pts, played):
-        """ Determine if both teams are "safe" or "out" given current standings. """
-        def status(t):
-            p = pts.get(t, 0)
-            left = 3 - played.get(t, 0)
-            max_p = p + 3 * left
-            if p >= 6:
-                return "safe"
-            if max_p < 4:
-                return "out"
-            return "live"
-
-        s1, s2 = status(t1), status(t2)
-        return s1 == s2 and s1 in {"safe", "out"}
@@ -0,0 +1,60 @@
+"""
+Plotting helpers, kept apart from the evaluators so that simulation and batch
+code never import pandas / matplotlib. Everything here loads them on first use.
+"""
+
+import numpy as np
+
+# Style used for every figure saved by main.py
+STYLE = 'seaborn-v0_8-darkgrid'
+
+def use_default_style():
+    """ Apply the project's matplotlib style (call before drawing). """
+    import matplotlib.pyplot as plt
+    plt.style.use(STYLE)
+
+def plot_correlation(final_standings, initial_elos):
+    """ Plot relationship between Elo rating and final position. """
+    try:
+        import pandas as pd
+        from scipy import stats
+        import matplotlib.pyplot as plt
+
+        merged_data = pd.merge(final_standings[['team', 'position']], initial_elos[['team', 'elo']], on = 'team')
+        merged_data = merged_data.sort_values('elo', ascending = False, kind = 'stable')
+        merged_data['elo_rank'] = range(1, len(merged_data) + 1)
+
+        # Scatter plot: Elo vs final position
+        plt.figure(figsize = (10,7))
+        plt.scatter(merged_data['elo_rank'], merged_data['position'], s = 30)
+
+        # Annotate each team
+        for _, row in merged_data.iterrows(): plt.annotate(row['team'], (row['elo_rank'], row['position']), xytext = (5, 5), textcoords = 'offset points')
+
+        # Add linear trend line
+        z = np.polyfit(merged_data['elo_rank'], merged_data['position'], 1)
+        p = np.poly1d(z)
+        plt.plot(merged_data['elo_rank'], p(merged_data['elo_rank']), "r--")
+
+        # Show correlation on plot
+        correlation = stats.spearmanr(merged_data['position'], merged_data['elo_rank'])[0]
+        plt.annotate(f'Correlation: {correlation:.3f}', xy = (0.025, 0.950), xycoords = 'axes fraction', fontsize = 12)
+
+        # Final plot formatting
+        plt.title('Final Position vs Initial ELO', fontsize = 18, pad = 15)
+        plt.xlabel('Initial ELO', fontsize = 12)
+        plt.ylabel('Final Position', fontsize = 12)
+
+        elo_max = merged_data['elo_rank'].max()
+        plt.xticks(np.arange(0, elo_max + 2))
+
+        pos_min = merged_data['position'].min()
+        pos_max = merged_data['position'].max()
+        plt.yticks(np.arange(int(pos_min // 5 * 5), int(pos_max // 5 * 5) + 6, 5))
+
+        plt.tight_layout()
+        return plt
+
+    except ImportError:
+        print("Matplotlib is required for plotting. Please install it using 'pip install matplotlib'")
+        return None
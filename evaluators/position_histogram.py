@@ -0,0 +1,126 @@
+import csv
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+def round_labels(bracket_size: int):
+    """ Stages of a bracket of bracket_size teams, first round first: ["round of 32", ..., "final", "champion"]. """
+    names = {2: "final", 4: "semi-final", 8: "quarter-final"}
+    sizes = [bracket_size >> k for k in range(bracket_size.bit_length() - 1)]
+    return [names.get(s, f"round of {s}") for s in sizes] + ["champion"]
+
+class PositionHistogram:
+    """
+    Streaming per-team finishing-position and round-reach counts for one format.
+
+    Keeps two integer count arrays, updated in bulk from (editions, teams)
+    position matrices (0 = not ranked), as batch_sim and PlanEngine produce:
+        positions[t, p]: editions team t finished p-th (column 0 = not ranked)
+        reach[t, k]:     editions team t reached bracket stage k (round_labels),
+                         from its position: the top 2^j teams of a bracket reach
+                         the stage with 2^j teams left
+    Counts add, so per-chunk or per-worker histograms merge into exactly the
+    histogram of a single pass, and raw rankings never need to be kept.
+    """
+
+    def __init__(self, teams, bracket_size = None, fmt = None):
+        """ Initialize empty counts for the named teams (bracket_size: teams in the final bracket, None for no rounds). """
+        if bracket_size is not None and (bracket_size < 2 or bracket_size & (bracket_size - 1)): raise ValueError("bracket_size must be 2, 4, 8, ...")
+
+        self.teams = list(teams)
+        self.bracket_size = bracket_size
+        self.format = fmt
+        self.editions = 0
+
+        n = len(self.teams)
+        self.rounds = round_labels(bracket_size) if bracket_size else []
+        self.positions = np.zeros((n, n + 1), dtype = np.int64)
+        self.reach = np.zeros((n, len(self.rounds)), dtype = np.int64)
+
+        # Stage k is reached by positions 1 .. thresholds[k]
+        self.thresholds = np.array([bracket_size >> k for k in range(len(self.rounds))], dtype = np.int64)
+
+    def update(self, positions):
+        """ Add an (editions, teams) matrix of finishing positions. """
+        positions = np.asarray(positions, dtype = np.int64)
+        if positions.ndim != 2 or positions.shape[1] != len(self.teams): raise ValueError(f"expected (editions, {len(self.teams)}) positions")
+        if positions.size == 0: return
+
+        # One bincount over (team, position) cells
+        n = len(self.teams)
+        cells = np.arange(n) * (n + 1) + positions
+        self.positions += np.bincount(cells.ravel(), minlength = n * (n + 1)).reshape(n, n + 1)
+
+        if self.rounds:
+            ranked = positions > 0
+            self.reach += ((positions[:, :, None] <= self.thresholds) & ranked[:, :, None]).sum(axis = 0)
+
+        self.editions += positions.shape[0]
+
+    def merge(self, other):
+        """ Fold another histogram of the same format and field into this one. """
+        if other.teams != self.teams or other.bracket_size != self.bracket_size: raise ValueError("cannot merge histograms of different fields or brackets")
+
+        self.positions += other.positions
+        self.reach += other.reach
+        self.editions += other.editions
+
+    # ----------------------------------------------------------
+
+    def mean_position(self):
+        """ Mean finishing position per team over the editions it was ranked in (NaN if never). """
+        ranked = self.positions[:, 1:]
+        total = ranked.sum(axis = 1)
+        with np.errstate(invalid = "ignore"): return (ranked * np.arange(1, ranked.shape[1] + 1)).sum(axis = 1) / total
+
+    def to_dict(self):
+        """ JSON-serialisable counts (from_dict restores them exactly). """
+        return {
+            "format": self.format,
+            "editions": self.editions,
+            "bracket_size": self.bracket_size,
+            "teams": self.teams,
+            "rounds": self.rounds,
+            "positions": self.positions.tolist(),
+            "reach": self.reach.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """ Inverse of to_dict. """
+        hist = cls(data["teams"], data["bracket_size"], data["format"])
+        hist.editions = data["editions"]
+        hist.positions[:] = data["positions"]
+        if hist.rounds: hist.reach[:] = data["reach"]
+        return hist
+
+    def to_json(self, path):
+        """ Write the counts as JSON (atomically replaced, so it can serve as a checkpoint). """
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(self.to_dict()) + "\n")
+        os.replace(tmp, path)
+
+    @classmethod
+    def from_json(cls, path):
+        """ Load a histogram written by to_json. """
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+    def to_csv(self, path):
+        """
+        Write one row per team: mean position, the probability of reaching
+        every bracket stage (champion odds last) and of every finishing
+        position ("not ranked" first).
+        """
+        n = len(self.teams)
+        share = self.positions / max(self.editions, 1)
+        reach = self.reach / max(self.editions, 1)
+        mean = self.mean_position()
+
+        with open(path, "w", newline = "") as fh:
+            writer = csv.writer(fh, lineterminator = "\n")
+            writer.writerow(["team", "editions", "mean_position"] + [f"reach {r}" for r in self.rounds] + ["not ranked"] + [f"pos {p}" for p in range(1, n + 1)])
+            for t, name in enumerate(self.teams):
+                writer.writerow([name, self.editions, f"{mean[t]:.4f}"] + [f"{x:.6f}" for x in reach[t]] + [f"{x:.6f}" for x in share[t]])
@@ -0,0 +1,57 @@
+from statistics import NormalDist
+
+import numpy as np
+
+class RunningStats:
+    """
+    Streaming mean / standard deviation (Welford, with Chan et al.'s merge step).
+
+    Values can arrive one at a time or in arrays of any size, and two
+    accumulators can be merged, so per-chunk or per-worker results combine
+    into the same numbers as a single pass over all values.
+    """
+
+    def __init__(self):
+        """ Initialize an empty accumulator. """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0 # Sum of squared deviations from the mean
+
+    def update(self, values):
+        """ Add a scalar or an array of values. """
+        values = np.asarray(values, dtype = float).ravel()
+        if values.size == 0: return
+
+        other = RunningStats()
+        other.count = values.size
+        other.mean = float(values.mean())
+        other.m2 = float(((values - other.mean) ** 2).sum())
+        self.merge(other)
+
+    def merge(self, other):
+        """ Fold another accumulator into this one. """
+        if other.count == 0: return
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.count = total
+
+    # ----------------------------------------------------------
+
+    def variance(self, ddof: int = 1):
+        """ Variance with the given delta degrees of freedom (NaN when undefined, like pandas). """
+        return self.m2 / (self.count - ddof) if self.count > ddof else float("nan")
+
+    def std(self, ddof: int = 1):
+        """ Standard deviation (sample SD by default, matching DataFrame.std). """
+        return self.variance(ddof) ** 0.5
+
+    def sem(self):
+        """ Standard error of the mean. """
+        return self.std() / self.count ** 0.5 if self.count > 1 else float("nan")
+
+    def half_width(self, confidence: float = 0.95):
+        """ Half-width of the normal-approximation confidence interval of the mean (NaN below two values). """
+        return NormalDist().inv_cdf(0.5 + confidence / 2) * self.sem()
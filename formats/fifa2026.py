@@ -1,4 +1,5 @@
 from formats.fifa2026_group_stage import FIFA2026GroupStage
+from core.events import NULL_SINK
 
 class FIFA2026Tournament:
     """
@@ -7,19 +8,19 @@ class FIFA2026Tournament:
         - Stores qualified teams for knockout stage
     """
 
-    def __init__(self, teams, match_engine):
-        """ Initialize tournament with teams and match engine. """
+    def __init__(self, teams, match_engine, events = None):
+        """ Initialize tournament with teams and match engine (events: optional core.events sink). """
         self.match_engine = match_engine
+        self.events = events if events is not None else NULL_SINK
         self.teams = teams
         self.group_stage = None
         self.knockout_stage = None
         self.qualified_teams = []
 
     def run(self):
-        """ Run the group stage simulation and determine qualified teams. """
-        self.group_stage = FIFA2026GroupStage(self.teams, self.match_engine)
+        """ Run the group stage simulation and determine qualified teams (tables go to the event sink). """
+        self.group_stage = FIFA2026GroupStage(self.teams, self.match_engine, events = self.events)
         self.group_stage.simulate()
-        self.group_stage.display_tables()
         self.qualified_teams = self.group_stage.get_qualified_teams()
 
     def get_qualified_teams(self):
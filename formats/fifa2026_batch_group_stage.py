@@ -0,0 +1,118 @@
+from itertools import combinations
+
+import numpy as np
+
+# 12 groups of 4; fixtures in the same order GroupStage plays them (combinations of group slots)
+N_GROUPS = 12
+GROUP_SIZE = 4
+FIXTURES = np.array(list(combinations(range(GROUP_SIZE), 2)))
+
+class FIFA2026BatchGroupStage:
+    """
+    FIFA 2026 group stage for many editions at once.
+
+    Same rules as FIFA2026GroupStage (pot draw, round robin, tie-breaks
+    Points → GD → GF → fair play → lots, best eight third-placed teams on
+    Points → GD → GF), but every edition is a row of an array:
+        - teams are indices into `ratings`
+        - group tables are (n, 12, 4) tensors ranked with one lexsort
+        - all 72 * n fixtures go through MatchEngine.simulate_matches in one call
+    """
+
+    def __init__(self, ratings, match_engine):
+        """ Initialize with the field's ratings (48 values) and a match engine. """
+        self.ratings = np.asarray(ratings, dtype = float)
+        if self.ratings.size != N_GROUPS * GROUP_SIZE: raise ValueError(f"FIFA2026BatchGroupStage expects {N_GROUPS * GROUP_SIZE} teams")
+
+        self.match_engine = match_engine
+
+        # Pots: teams sorted by rating descending (stable, like sorted(..., reverse = True)), 12 per pot
+        self.pots = np.argsort(-self.ratings, kind = "stable").reshape(GROUP_SIZE, N_GROUPS)
+
+    # ----------------------------------------------------------
+
+    def _create_groups(self, n):
+        """ Draw n editions of groups: shuffle each pot and deal one team per pot into every group. """
+        perm = np.argsort(self.match_engine.rng.random((n, GROUP_SIZE, N_GROUPS)), axis = -1)
+        drawn = self.pots[np.arange(GROUP_SIZE)[:, None], perm] # (n, pot, group)
+        return drawn.transpose(0, 2, 1)                           # (n, group, slot)
+
+    def simulate(self, n: int):
+        """
+        Simulate n independent group stages.
+
+        Stores (n = editions, 12 groups, 4 slots, 6 fixtures):
+            groups      (n, 12, 4)    team index per group slot (slot = pot)
+            goals       (n, 12, 6, 2) score of every fixture
+            points, goal_diff, goals_for, fair_play   (n, 12, 4) per group slot
+            ranked      (n, 12, 4)    team indices in finishing order
+            qualified   (n, 32)       winners A-L, runners-up A-L, best eight thirds
+        """
+        rng = self.match_engine.rng
+        self.groups = self._create_groups(n)
+
+        # Every fixture of every group of every edition in one batch
+        home = self.groups[:, :, FIXTURES[:, 0]]
+        away = self.groups[:, :, FIXTURES[:, 1]]
+        _, goals, _ = self.match_engine.simulate_matches(self.ratings[home], self.ratings[away])
+        self.goals = goals.reshape(n, N_GROUPS, len(FIXTURES), 2)
+
+        # Accumulate tables per group slot
+        shape = (n, N_GROUPS, GROUP_SIZE)
+        points = np.zeros(shape, dtype = np.int64)
+        gf = np.zeros(shape, dtype = np.int64)
+        ga = np.zeros(shape, dtype = np.int64)
+
+        for f, (a, b) in enumerate(FIXTURES):
+            g1, g2 = self.goals[:, :, f, 0], self.goals[:, :, f, 1]
+            points[:, :, a] += 3 * (g1 > g2) + (g1 == g2)
+            points[:, :, b] += 3 * (g2 > g1) + (g1 == g2)
+            gf[:, :, a] += g1
+            gf[:, :, b] += g2
+            ga[:, :, a] += g2
+            ga[:, :, b] += g1
+
+        # Fair play: every team plays 3 matches, each with 0-2 yellows and a 5% red (3 pts).
+        # floor(3u) and frac(3u) of one uniform are independent, so one draw serves both cards.
+        u = 3 * rng.random(shape + (GROUP_SIZE - 1,))
+        yellows = u.astype(np.int64)
+        self.fair_play = (yellows + 3 * (u - yellows < 0.05)).sum(axis = -1)
+
+        self.points, self.goals_for, self.goal_diff = points, gf, gf - ga
+
+        # Rank each group: points, GD, GF desc, fair-play points asc, then lots (lexsort: last key is primary)
+        lots = rng.random(shape)
+        order = np.lexsort((lots, self.fair_play, -gf, -self.goal_diff, -points), axis = -1)
+        self.order = order
+        self.ranked = np.take_along_axis(self.groups, order, axis = -1)
+
+        self._select_qualifiers()
+
+    def _select_qualifiers(self):
+        """ Pick the 32 qualifiers: top two of each group plus the eight best thirds. """
+        n = self.ranked.shape[0]
+        third = self.order[:, :, 2]
+
+        def at_third(stat):
+            return np.take_along_axis(stat, third[..., None], axis = -1)[..., 0]
+
+        # Thirds ranked on Points → GD → GF, earlier group first on a full tie (like a stable sort)
+        group_idx = np.broadcast_to(np.arange(N_GROUPS), (n, N_GROUPS))
+        third_order = np.lexsort((group_idx, -at_third(self.goals_for), -at_third(self.goal_diff), -at_third(self.points)), axis = -1)
+
+        self.best_third_groups = third_order[:, :8]
+        self.third_qualified = np.zeros((n, N_GROUPS), dtype = bool)
+        np.put_along_axis(self.third_qualified, self.best_third_groups, True, axis = -1)
+
+        best_thirds = np.take_along_axis(self.ranked[:, :, 2], self.best_third_groups, axis = -1)
+        self.qualified = np.concatenate([self.ranked[:, :, 0], self.ranked[:, :, 1], best_thirds], axis = 1)
+
+    # ----------------------------------------------------------
+
+    def get_rankings(self):
+        """ Return the (n, 12, 4) array of team indices in group finishing order. """
+        return self.ranked
+
+    def get_qualified_teams(self):
+        """ Return the (n, 32) array of qualified team indices. """
+        return self.qualified
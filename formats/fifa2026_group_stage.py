@@ -1,5 +1,6 @@
 from core.group_stage_base import GroupStageBase
 from core.group_stage import GroupStage
+from core.events import NULL_SINK
 
 class FIFA2026GroupStage(GroupStageBase):
     """
@@ -11,18 +12,21 @@ class FIFA2026GroupStage(GroupStageBase):
     Wraps the core GroupStage logic and conforms to the GroupStageBase interface.
     """
 
-    def __init__(self, teams, match_engine):
-        """ Initialize the FIFA 2026 group stage format. """
-        self.stage = GroupStage(teams, match_engine, group_size = 4)
+    def __init__(self, teams, match_engine, events = None):
+        """ Initialize the FIFA 2026 group stage format (events: optional core.events sink). """
+        self.events = events if events is not None else NULL_SINK
+        self.stage = GroupStage(teams, match_engine, group_size = 4, events = self.events)
         self.rankings = {} # Group rankings after simulation
         self.results = {}  # Match results by group
 
     def simulate(self):
-        """ Simulate all matches in the group stage and store results. """
+        """ Simulate all matches in the group stage, store results and report final tables. """
         self.stage.simulate()
-        self.rankings = self.stage.get_group_rankings()
+        self.rankings = self.stage.rankings
         self.results = self.stage.results
 
+        for group_name in sorted(self.rankings.keys()): self.events.table_finalized("group", f"Group {group_name}", self.rankings[group_name])
+
     def get_rankings(self):
         """ Get the full group stage rankings. """
         return self.rankings
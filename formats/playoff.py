@@ -1,3 +1,5 @@
+from core.events import NULL_SINK
+
 class PlayoffTournament:
     """
     Simulates a single-elimination playoff tournament.
@@ -5,11 +7,12 @@ class PlayoffTournament:
     Tracks match results, team statistics, and supports ranking teams based on the round they were eliminated.
     """
 
-    def __init__(self, teams, match_engine, bracket_size: int = 32):
-        """ Initialize playoff tournament with top teams by rating. """
+    def __init__(self, teams, match_engine, bracket_size: int = 32, events = None):
+        """ Initialize playoff tournament with top teams by rating (events: optional core.events sink). """
         # Sort teams by rating descending and take top bracket_size
         self.teams = sorted(teams, key = lambda t: t.rating, reverse = True)[:bracket_size]
         self.me = match_engine
+        self.events = events if events is not None else NULL_SINK
         self.winner = None
         self.rounds = [] # Store matches per round
         self.match_count = 0
@@ -24,22 +27,23 @@ class PlayoffTournament:
         rnd_idx = 1
 
         while size > 1:
-            print(f"\nPlay-off Round of {size}")
+            label = f"Play-off Round of {size}"
+            self.events.round_started("playoff", label)
             next_round = []
             rnd_results = []
 
             for i in range(0, size, 2):
                 t1, t2 = current[i], current[i + 1]
-                winner, score, _ = self.me.simulate_match(t1, t2, is_knockout = True)
+                winner, score, pens = self.me.simulate_match(t1, t2, is_knockout = True)
 
                 # Update team stats
-                t1.record_match(score[0], score[1])
-                t2.record_match(score[1], score[0])
+                t1.record_match(score[0], score[1], self.me.rng)
+                t2.record_match(score[1], score[0], self.me.rng)
                 self.match_count += 1
 
                 next_round.append(winner)
                 rnd_results.append((t1, t2, score, winner))
-                print(f"{t1.name} {score[0]}-{score[1]} {t2.name} → {winner.name}")
+                self.events.match_played("playoff", label, t1, t2, score, winner, pens)
 
             self.rounds.append(rnd_results)
             current = next_round
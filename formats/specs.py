@@ -0,0 +1,40 @@
+from inspect import signature
+
+from core.bracket import FIFA2026_ROUND_OF_32
+from core.plan import Groups, Bracket, SwissRounds
+
+def fifa2026():
+    """ 12 groups of 4, top two plus the eight best thirds into the FIFA 2026 round of 32. """
+    return [
+        Groups(groups = 12, size = 4, best_thirds = 8),
+        Bracket([side for match in FIFA2026_ROUND_OF_32 for side in match], ranking = "match"),
+    ]
+
+def playoff(bracket_size: int = 32):
+    """ Top bracket_size teams by rating, 1v2, 3v4, ...; same-round losers ranked by rating. """
+    return [
+        Bracket([("S", k) for k in range(1, bracket_size + 1)], ranking = "rating"),
+    ]
+
+def swiss(rounds: int = 8):
+    """ `rounds` Swiss rounds over the whole field, pairing = "sorted". """
+    return [
+        SwissRounds(rounds = rounds),
+    ]
+
+# Spec builders of the formats in batch_sim.FORMATS; their keyword arguments are the format's parameters
+FORMAT_BUILDERS = {"FIFA2026": fifa2026, "Playoff": playoff, "Swiss8R": swiss}
+
+# Declarative versions of the formats at their defaults, for core.plan.compile_format / PlanEngine.
+# A new format is a new builder: stages run in order, and the last one ranks the field.
+FORMAT_SPECS = {name: build() for name, build in FORMAT_BUILDERS.items()}
+
+def format_parameters(fmt_name):
+    """ {name: default} of the parameters a format's spec builder accepts. """
+    return {name: p.default for name, p in signature(FORMAT_BUILDERS[fmt_name]).parameters.items()}
+
+def build_spec(fmt_name, **params):
+    """ Spec of a format with some parameters changed (ValueError for unknown ones). """
+    unknown = set(params) - set(format_parameters(fmt_name))
+    if unknown: raise ValueError(f"{fmt_name} has no parameter(s) {', '.join(sorted(unknown))}; expected {sorted(format_parameters(fmt_name))}")
+    return FORMAT_BUILDERS[fmt_name](**params)
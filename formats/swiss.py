@@ -1,4 +1,9 @@
-import random
+from core.events import NULL_SINK
+from formats.swiss_pairing import SwissPairing
+
+# Pairing rules: "sorted" re-sorts the field and pairs neighbours (the original rule, rematches possible),
+# "swiss" uses SwissPairing (score groups, floaters, no rematches unless unavoidable)
+PAIRINGS = ("sorted", "swiss")
 
 class SwissTournament:
     """
@@ -6,10 +11,13 @@ class SwissTournament:
     The tournament proceeds for a fixed number of rounds, updating team stats and rankings after each round.
     """
 
-    def __init__(self, teams, match_engine, rounds: int = 8):
-        """ Initialize the Swiss tournament. """
+    def __init__(self, teams, match_engine, rounds: int = 8, events = None, pairing: str = "sorted"):
+        """ Initialize the Swiss tournament (events: optional core.events sink; pairing: one of PAIRINGS). """
+        if pairing not in PAIRINGS: raise ValueError(f"Unknown pairing {pairing!r}; expected one of {PAIRINGS}")
+
         self.teams = teams
         self.me = match_engine
+        self.events = events if events is not None else NULL_SINK
         self.rounds = rounds
         self.round_results = [] # Store match results for each round
         self.match_count = 0
@@ -17,10 +25,18 @@ class SwissTournament:
         # Reset stats for all teams before starting the tournament
         for t in self.teams: t.reset_stats()
 
+        # Pairing engine over team indices (only for pairing = "swiss")
+        self.pairing = pairing
+        self.pairer = SwissPairing([t.rating for t in self.teams], self.me.rng) if pairing == "swiss" else None
+
     def _pair_round(self):
         """ Pair teams for the current round based on their points and ratings. """
+        if self.pairer is not None:
+            pairs = self.pairer.pair([t.points for t in self.teams])
+            return [(self.teams[a], self.teams[b]) for a, b in pairs]
+
         # Sort teams by points, rating, and random factor for tie-breaks
-        ordered = sorted(self.teams, key = lambda t: (t.points, t.rating, random.random()), reverse = True)
+        ordered = sorted(self.teams, key = lambda t: (t.points, t.rating, self.me.rng.random()), reverse = True)
         it = iter(ordered)
 
         # Pair off teams sequentially
@@ -31,19 +47,19 @@ class SwissTournament:
         for rnd in range(1, self.rounds + 1):
             pairs = self._pair_round()
             results_this = []
-            print(f"\nSwiss Round {rnd}")
+            label = f"Swiss Round {rnd}"
+            self.events.round_started("swiss", label)
 
             for t1, t2 in pairs:
                 winner, score, _ = self.me.simulate_match(t1, t2)
 
                 # Update team stats after match
-                t1.record_match(score[0], score[1])
-                t2.record_match(score[1], score[0])
+                t1.record_match(score[0], score[1], self.me.rng)
+                t2.record_match(score[1], score[0], self.me.rng)
                 self.match_count += 1
 
                 results_this.append((t1, t2, score, winner))
-                verb = "draw" if winner is None else f"{winner.name} wins"
-                print(f"{t1.name} {score[0]}-{score[1]} {t2.name} → {verb}")
+                self.events.match_played("swiss", label, t1, t2, score, winner)
 
             self.round_results.append(results_this)
 
@@ -0,0 +1,131 @@
+import numpy as np
+
+class SwissPairing:
+    """
+    Swiss-system pairing engine for large fields (thousands of teams, many rounds).
+
+    Teams are integer indices. The engine keeps:
+        - a fixed seeding order (rating descending, random tie-break drawn once),
+          so score groups are rebuilt each round with one linear bucketing pass
+          instead of a full sort
+        - one set of played opponents per team (adjacency sets), so a rematch
+          check is O(1)
+
+    Each round, score groups are paired from the top: within a group the
+    highest unpaired team meets the next team it has not played yet (adjacent
+    pairing, like the original sorted zip when there are no conflicts);
+    teams left over float down into the next group. Leftovers at the bottom
+    are re-paired together with the lowest formed pairs (a small depth-first
+    search over a window that widens until it succeeds), and only when no
+    rematch-free pairing exists is a rematch allowed (counted in `rematches`).
+    With an odd field the lowest-ranked team without a bye so far sits out.
+    """
+
+    def __init__(self, ratings, rng = None):
+        """ Initialize with every team's rating and the generator used for seeding ties. """
+        ratings = np.asarray(ratings, dtype = float)
+        rng = rng if rng is not None else np.random.default_rng()
+
+        self.n = ratings.size
+        self.order = np.lexsort((rng.random(self.n), -ratings)).tolist() # Seeding order, best first
+        self.seed_rank = np.argsort(self.order).tolist()                   # Position of each team in that order
+        self.played = [set() for _ in range(self.n)]
+        self.rematches = 0
+        self.byes = []
+
+    # ----------------------------------------------------------
+
+    def score_groups(self, points):
+        """ Return [(points, [teams in seeding order])] from the highest score down. """
+        groups = {}
+        for t in self.order: groups.setdefault(points[t], []).append(t)
+        return sorted(groups.items(), reverse = True)
+
+    def _pair_group(self, pool, pairs):
+        """ Adjacent pairing of one score group (plus floaters); return the teams left unpaired, in order. """
+        taken = [False] * len(pool)
+        left = []
+
+        for a, ta in enumerate(pool):
+            if taken[a]: continue
+            seen = self.played[ta]
+
+            for b in range(a + 1, len(pool)):
+                if not taken[b] and pool[b] not in seen:
+                    taken[a] = taken[b] = True
+                    pairs.append((ta, pool[b]))
+                    break
+            else:
+                left.append(ta)
+
+        return left
+
+    def _match(self, teams, budget):
+        """
+        Depth-first search for a rematch-free pairing of `teams`; None if there
+        is none within `budget` steps. The most constrained team is paired
+        first and partners are tried in `teams` order, so the result stays
+        close to adjacent pairing.
+        """
+        steps = [budget]
+
+        def solve(rest):
+            if not rest: return []
+            steps[0] -= 1
+            if steps[0] < 0: return None
+
+            options = [[y for y in rest if y != x and y not in self.played[x]] for x in rest]
+            k = min(range(len(rest)), key = lambda i: len(options[i]))
+            x = rest[k]
+
+            for y in options[k]:
+                tail = solve([t for t in rest if t != x and t != y])
+                if tail is not None: return [(x, y) if self.seed_rank[x] < self.seed_rank[y] else (y, x)] + tail
+            return None
+
+        pairs = solve(teams)
+        return None if pairs is None else sorted(pairs, key = lambda p: teams.index(p[0]))
+
+    def pair(self, points):
+        """
+        Pair the next round from each team's current points and record the pairings.
+
+        Returns a list of (team, team) index pairs, higher seed of each score
+        group first; with an odd field the team sitting out is appended to `byes`.
+        """
+        groups = self.score_groups(points)
+
+        # Odd field: the lowest-ranked team that has not had a bye yet sits out
+        if self.n % 2:
+            had_bye = set(self.byes)
+            ranked = [t for _, group in groups for t in group]
+            bye = next((t for t in reversed(ranked) if t not in had_bye), ranked[-1])
+            self.byes.append(bye)
+            groups = [(p, [t for t in group if t != bye]) for p, group in groups]
+
+        pairs = []
+        left = []
+        for _, group in groups: left = self._pair_group(left + group, pairs)
+
+        # Leftovers have all met each other: re-pair them together with the lowest formed pairs,
+        # widening the window until a rematch-free pairing exists; only then allow rematches
+        width = 1
+        while left:
+            window = [t for p in pairs[len(pairs) - width:] for t in p] + left
+            repaired = self._match(window, budget = min(20 * len(window) ** 2, 100_000))
+
+            if repaired is not None:
+                pairs[len(pairs) - width:] = repaired
+                left = []
+            elif width >= len(pairs):
+                for k in range(0, len(left), 2):
+                    pairs.append((left[k], left[k + 1]))
+                    self.rematches += left[k + 1] in self.played[left[k]]
+                left = []
+            else:
+                width = min(2 * width, len(pairs))
+
+        for a, b in pairs:
+            self.played[a].add(b)
+            self.played[b].add(a)
+        return pairs
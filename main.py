@@ -1,12 +1,8 @@
-import pandas as pd
-
-import matplotlib.pyplot as plt
-plt.style.use('seaborn-v0_8-darkgrid')
-
 # Core functionality
 from core.team import Team
 from core.match_engine import MatchEngine
 from core.knockout_stage import KnockoutStage
+from core.events import ConsoleSink
 
 # Tournament formats
 from formats.fifa2026 import FIFA2026Tournament
@@ -16,9 +12,13 @@ from formats.swiss import SwissTournament
 # Evaluation modules
 from evaluators.elo_correlation import EloCorrelationEvaluator
 from evaluators.incentive_compatibility import IncentiveCompatibilityEvaluator
+from evaluators.plotting import use_default_style
 
 def load_teams_from_csv(csv_path = "data/teams.csv"):
     """ Load team data from a CSV file and return a list of Team objects. """
+    # pandas is loaded on first use, not when the CLI imports this module
+    import pandas as pd
+
     df = pd.read_csv(csv_path)
     teams = [Team(row["Country"], int(row["Rating"])) for _, row in df.iterrows()]
     assert len(teams) == 48, f"Expected 48 teams, got {len(teams)}"
@@ -37,6 +37,8 @@ def get_rankings_from_knockout(knockout):
 
 def compute_metrics(label, rankings, tournament, initial_elos, corr_eval, ic_eval):
     """ Compute and display evaluation metrics for a completed tournament. """
+    import pandas as pd
+
     df = pd.DataFrame({"team": [t.name for t in rankings], "position": range(1, len(rankings) + 1)})
     print(f"\n[{label}]")
  
@@ -60,6 +62,7 @@ def compute_metrics(label, rankings, tournament, initial_elos, corr_eval, ic_eva
         if hasattr(fig, "savefig"):
             fig.savefig(fname, bbox_inches = "tight")
         else:
+            import matplotlib.pyplot as plt
             plt.savefig(fname, bbox_inches = "tight")
             plt.close("all")
 
@@ -67,34 +70,42 @@ def compute_metrics(label, rankings, tournament, initial_elos, corr_eval, ic_eva
 
 def main():
     """ Main entry point: runs all formats once, evaluates, and saves results. """
+    import pandas as pd
+
     # Load master team list and base Elo ratings
     teams_master = load_teams_from_csv()
     initial_elos = pd.read_csv("data/teams.csv")[["Country", "Rating"]].rename(columns={"Country": "team", "Rating": "elo"})
 
+    # Plot style (matplotlib is only loaded here, not at import time)
+    use_default_style()
+
     # Instantiate evaluators
     corr_eval = EloCorrelationEvaluator()
     ic_eval = IncentiveCompatibilityEvaluator()
 
+    # Print every match and table as it happens
+    events = ConsoleSink()
+
     # FIFA 2026 Format
     fifa_teams = [t for t in teams_master]
     match_engine = MatchEngine()
-    tournament = FIFA2026Tournament(fifa_teams, match_engine)
+    tournament = FIFA2026Tournament(fifa_teams, match_engine, events = events)
     tournament.run()
 
     qualified = tournament.get_qualified_teams()
-    knockout = KnockoutStage(qualified, match_engine)
+    knockout = KnockoutStage(qualified, match_engine, events = events)
     knockout.simulate()
 
     fifa_rankings = get_rankings_from_knockout(knockout)
     compute_metrics("FIFA 2026", fifa_rankings, tournament, initial_elos, corr_eval, ic_eval)
 
     # Pure Playoff Format
-    po_tournament = PlayoffTournament(load_teams_from_csv(), MatchEngine())
+    po_tournament = PlayoffTournament(load_teams_from_csv(), MatchEngine(), events = events)
     po_tournament.run()
     compute_metrics("Pure Playoff", po_tournament.get_rankings(), po_tournament, initial_elos, corr_eval, ic_eval)
 
     # Swiss Format (8 rounds)
-    swiss_tournament = SwissTournament(load_teams_from_csv(), MatchEngine(), rounds = 8)
+    swiss_tournament = SwissTournament(load_teams_from_csv(), MatchEngine(), rounds = 8, events = events)
     swiss_tournament.run()
     compute_metrics("8-Round Swiss", swiss_tournament.get_rankings(), swiss_tournament, initial_elos, corr_eval, ic_eval)
 
@@ -0,0 +1,199 @@
+import csv
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Supported part-file formats and their extensions (parquet / arrow need pyarrow)
+FILE_FORMATS = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}
+MANIFEST = "manifest.json"
+
+def file_sha256(path):
+    """ Hex SHA-256 of a file's bytes (used to tie a run to its input ratings). """
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""): digest.update(block)
+    return digest.hexdigest()
+
+def _require_pyarrow(file_format):
+    """ Import pyarrow lazily so CSV runs do not need it. """
+    try:
+        import pyarrow # noqa: F401
+    except ImportError as exc:
+        raise ImportError(f"file format {file_format!r} needs pyarrow (pip install pyarrow), or use 'csv'") from exc
+
+def _kind(values):
+    """ Column kind stored in the manifest schema: "str", "int" or "float". """
+    if values.dtype.kind in "OUS": return "str"
+    return "int" if values.dtype.kind in "iub" else "float"
+
+def _format_cell(value):
+    """ CSV text of one value: shortest round-trip repr for floats, empty for NaN (as pandas writes). """
+    if isinstance(value, float): return "" if value != value else repr(value)
+    return str(value)
+
+def _write_csv_rows(fh, columns, header):
+    """ Write {column: array} as CSV rows, optionally preceded by a header line. """
+    writer = csv.writer(fh, lineterminator = "\n")
+    if header: writer.writerow(columns)
+    lists = [np.asarray(v).tolist() for v in columns.values()]
+    writer.writerows([_format_cell(x) for x in row] for row in zip(*lists))
+
+def _parse(texts, kind):
+    """ Inverse of _format_cell for one CSV column. """
+    if kind == "str": return np.array(texts, dtype = object)
+    if kind == "int": return np.array([int(x) for x in texts], dtype = np.int64)
+    return np.array([float(x) if x else float("nan") for x in texts])
+
+class ChunkedResultWriter:
+    """
+    Append-only, chunked result store with a checkpoint manifest.
+
+    Results are written as immutable part files, one per (key, start, stop)
+    range of editions, next to a manifest.json that lists every completed part
+    and the run settings (seed, chunk size, input hash, ...). The manifest is
+    replaced atomically after each part is on disk, so a crash loses at most
+    the chunk in flight and a later run can resume from the manifest.
+    """
+
+    def __init__(self, directory, file_format: str = "csv"):
+        """ Use `directory` for part files and the manifest. """
+        if file_format not in FILE_FORMATS: raise ValueError(f"Unknown file format {file_format!r}; choose from {sorted(FILE_FORMATS)}")
+        if file_format != "csv": _require_pyarrow(file_format)
+
+        self.directory = Path(directory)
+        self.file_format = file_format
+        self.manifest = None
+
+    # ----------------------------------------------------------
+
+    def load(self):
+        """ Read the manifest of a previous run (FileNotFoundError if there is none). """
+        with open(self.directory / MANIFEST) as fh:
+            return json.load(fh)
+
+    def start(self, run, resume: bool = False):
+        """
+        Begin a run described by the JSON-serialisable dict `run`.
+
+        With resume, the existing manifest must describe the same run (every
+        setting except "n" must match) and its completed parts are kept;
+        otherwise previous parts are removed and the run starts empty.
+        """
+        self.directory.mkdir(parents = True, exist_ok = True)
+
+        if resume:
+            manifest = self.load()
+            if manifest["file_format"] != self.file_format: raise ValueError(f"cannot resume: parts were written as {manifest['file_format']!r}")
+
+            changed = [k for k in set(run) | set(manifest["run"]) if k != "n" and run.get(k) != manifest["run"].get(k)]
+            if changed: raise ValueError(f"cannot resume: settings differ from the checkpoint ({', '.join(sorted(changed))})")
+
+            manifest["run"] = run
+            self.manifest = manifest
+        else:
+            if (self.directory / MANIFEST).exists():
+                for part in self.load()["chunks"]: (self.directory / part["file"]).unlink(missing_ok = True)
+            self.manifest = {"file_format": self.file_format, "run": run, "chunks": []}
+
+        self._save_manifest()
+
+    def _save_manifest(self):
+        """ Atomically replace manifest.json. """
+        tmp = self.directory / (MANIFEST + ".tmp")
+        with open(tmp, "w") as fh:
+            json.dump(self.manifest, fh, indent = 1)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.directory / MANIFEST)
+
+    # ----------------------------------------------------------
+
+    def completed(self, key):
+        """ Number of leading editions of `key` already stored (parts are contiguous from 0). """
+        return max((c["stop"] for c in self.manifest["chunks"] if c["key"] == key), default = 0)
+
+    def write_chunk(self, key, start, stop, columns):
+        """
+        Store rows for editions [start, stop) of `key` as one part file and checkpoint it.
+
+        columns maps column name -> 1-D sequence (all the same length); names
+        and dtypes must be the same for every chunk of a run.
+        """
+        if start != self.completed(key): raise ValueError(f"chunk {key} [{start}, {stop}) does not continue the stored editions")
+
+        columns = {name: np.asarray(values) for name, values in columns.items()}
+        schema = [[name, _kind(values)] for name, values in columns.items()]
+        if self.manifest.setdefault("schema", schema) != schema: raise ValueError("chunk columns differ from the stored schema")
+
+        name = f"{key}-{start:010d}-{stop:010d}{FILE_FORMATS[self.file_format]}"
+        tmp = self.directory / (name + ".tmp")
+
+        if self.file_format == "csv":
+            with open(tmp, "w", newline = "") as fh: _write_csv_rows(fh, columns, header = True)
+        else:
+            import pyarrow as pa
+            table = pa.table({k: (v.astype(str) if _kind(v) == "str" else v) for k, v in columns.items()})
+
+            if self.file_format == "parquet":
+                import pyarrow.parquet as pq
+                pq.write_table(table, tmp)
+            else:
+                with pa.ipc.new_file(tmp, table.schema) as out: out.write_table(table)
+        os.replace(tmp, self.directory / name)
+
+        rows = len(next(iter(columns.values()))) if columns else 0
+        self.manifest["chunks"].append({"key": key, "start": start, "stop": stop, "rows": rows, "file": name})
+        self._save_manifest()
+
+    # ----------------------------------------------------------
+
+    def parts(self, key = None):
+        """ Part-file paths in write order, optionally only those of one key. """
+        return [self.directory / c["file"] for c in self.manifest["chunks"] if key is None or c["key"] == key]
+
+    def read_chunks(self, key = None):
+        """ Yield one {column: array} dict per part file, so callers can stream over the results. """
+        for path in self.parts(key): yield self._read(path)
+
+    def _read(self, path):
+        """ Load one part file as {column: array}. """
+        schema = self.manifest["schema"]
+
+        if self.file_format == "csv":
+            with open(path, newline = "") as fh:
+                reader = csv.reader(fh)
+                next(reader)
+                values = list(zip(*reader)) or [()] * len(schema)
+            return {name: _parse(col, kind) for (name, kind), col in zip(schema, values)}
+
+        import pyarrow as pa
+        if self.file_format == "parquet":
+            import pyarrow.parquet as pq
+            table = pq.read_table(path)
+        else:
+            with pa.memory_map(str(path)) as source: table = pa.ipc.open_file(source).read_all()
+        return {name: table.column(name).to_numpy(zero_copy_only = False) for name, _ in schema}
+
+    def to_csv(self, path, keys = None):
+        """ Concatenate the parts (of the given keys, in that order) into a single CSV, one chunk at a time. """
+        keys = keys if keys is not None else list(dict.fromkeys(c["key"] for c in self.manifest["chunks"]))
+        header = True
+
+        with open(path, "w", newline = "") as out:
+            for key in keys:
+                if self.file_format != "csv":
+                    for columns in self.read_chunks(key):
+                        _write_csv_rows(out, columns, header = header)
+                        header = False
+                    continue
+
+                # CSV parts are copied verbatim (keeping only the first header)
+                for part in self.parts(key):
+                    with open(part, newline = "") as fh:
+                        first = fh.readline()
+                        if header: out.write(first)
+                        for block in iter(lambda: fh.read(1 << 20), ""): out.write(block)
+                    header = False
@@ -0,0 +1,139 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+# File layout: MAGIC, the data offset as a little-endian uint64, a JSON header padded with spaces up to
+# that offset, then the (editions, teams) placement matrix in C order. The offset is a multiple of PAGE_SIZE,
+# so the data maps directly, and grows with the header (team names), so any field size fits.
+MAGIC = b"TSPLACE2"
+PAGE_SIZE = 4096
+EXTENSION = ".plc"
+
+# Stores written before the offset field: fixed 4096-byte header, read as before
+LEGACY_MAGIC = b"TSPLACE1"
+
+# Room left in the header for the edition count to grow when it is rewritten in place
+HEADER_SLACK = 64
+
+class PlacementStore:
+    """
+    Append-only, memory-mapped store of per-edition finishing positions.
+
+    One file per format holds an (editions, teams) matrix of small integers
+    (position of every team in table order, 0 = not ranked; uint8 for up to
+    255 teams) behind a page-aligned JSON header with the format, team names,
+    ratings hash, seed and edition count. Editions are appended in order; the
+    header count is only raised once the rows are on disk, so a crash leaves
+    the previous editions readable and truncate() rolls back to a checkpoint.
+
+    `positions` is a read-only np.memmap of the stored editions: analyses
+    slice it (or loop over blocks()) without loading the file.
+    """
+
+    def __init__(self, path, header, mode: str = "r", offset: int = None):
+        """ Wrap an existing store file; use create() or open(). """
+        self.path = Path(path)
+        self.header = header
+        self.mode = mode
+        self.legacy = False
+
+        # Data offset: the smallest page multiple that holds the header with some slack
+        self.offset = offset if offset is not None else -(-(len(MAGIC) + 8 + len(json.dumps(header)) + HEADER_SLACK) // PAGE_SIZE) * PAGE_SIZE
+        self.dtype = np.dtype(header["dtype"])
+        self.n_teams = len(header["teams"])
+
+    @classmethod
+    def create(cls, path, fmt, teams, ratings_sha256 = None, seed = None):
+        """ Start an empty store for format `fmt` over the named teams (replaces an existing file). """
+        header = {
+            "format": fmt,
+            "teams": list(teams),
+            "dtype": np.dtype(np.uint8 if len(teams) < 256 else np.uint16).str,
+            "ratings_sha256": ratings_sha256,
+            "seed": seed,
+            "editions": 0,
+        }
+        store = cls(path, header, mode = "r+")
+        store.path.parent.mkdir(parents = True, exist_ok = True)
+        with open(store.path, "wb") as fh: fh.write(store._header_bytes())
+        return store
+
+    @classmethod
+    def open(cls, path, mode: str = "r"):
+        """ Open a store for reading ("r") or appending ("r+"). """
+        with open(path, "rb") as fh:
+            magic = fh.read(len(MAGIC))
+            if magic == LEGACY_MAGIC:
+                store = cls(path, json.loads(fh.read(PAGE_SIZE - len(MAGIC)).decode()), mode, offset = PAGE_SIZE)
+                store.legacy = True
+                return store
+            if magic != MAGIC: raise ValueError(f"{path} is not a placement store")
+
+            offset = int.from_bytes(fh.read(8), "little")
+            return cls(path, json.loads(fh.read(offset - len(MAGIC) - 8).decode()), mode, offset)
+
+    def _header_bytes(self):
+        """ MAGIC, the data offset and the JSON header, padded to the offset. """
+        text = json.dumps(self.header).encode()
+        if self.legacy:
+            if len(LEGACY_MAGIC) + len(text) > self.offset: raise ValueError("placement store header too large")
+            return LEGACY_MAGIC + text.ljust(self.offset - len(LEGACY_MAGIC))
+
+        if len(MAGIC) + 8 + len(text) > self.offset: raise ValueError("placement store header too large")
+        return MAGIC + self.offset.to_bytes(8, "little") + text.ljust(self.offset - len(MAGIC) - 8)
+
+    def _write_header(self, fh):
+        """ Rewrite the header in place and flush it to disk. """
+        fh.seek(0)
+        fh.write(self._header_bytes())
+        fh.flush()
+        os.fsync(fh.fileno())
+
+    # ----------------------------------------------------------
+
+    def __len__(self):
+        return self.header["editions"]
+
+    def append(self, positions):
+        """ Append (k, teams) positions as the next k editions. """
+        if self.mode != "r+": raise ValueError("placement store opened read-only")
+
+        positions = np.asarray(positions)
+        if positions.ndim != 2 or positions.shape[1] != self.n_teams: raise ValueError(f"expected (editions, {self.n_teams}) positions")
+        if positions.size and (positions.min() < 0 or positions.max() > np.iinfo(self.dtype).max): raise ValueError("position out of range for the store")
+
+        # Rows first, then the count that makes them visible
+        with open(self.path, "r+b") as fh:
+            fh.seek(self.offset + len(self) * self.n_teams * self.dtype.itemsize)
+            fh.write(np.ascontiguousarray(positions, dtype = self.dtype).tobytes())
+            fh.truncate()
+            fh.flush()
+            os.fsync(fh.fileno())
+
+            self.header["editions"] = len(self) + positions.shape[0]
+            self._write_header(fh)
+
+    def truncate(self, editions: int):
+        """ Keep only the first `editions` editions (e.g. to match a resumed checkpoint). """
+        if self.mode != "r+": raise ValueError("placement store opened read-only")
+        if editions > len(self): raise ValueError(f"store holds only {len(self)} editions, cannot keep {editions}")
+
+        with open(self.path, "r+b") as fh:
+            self.header["editions"] = editions
+            self._write_header(fh)
+            fh.truncate(self.offset + editions * self.n_teams * self.dtype.itemsize)
+
+    # ----------------------------------------------------------
+
+    @property
+    def positions(self):
+        """ Read-only (editions, teams) memory map of the stored positions. """
+        if not len(self): return np.zeros((0, self.n_teams), dtype = self.dtype)
+        return np.memmap(self.path, dtype = self.dtype, mode = "r", offset = self.offset, shape = (len(self), self.n_teams))
+
+    def blocks(self, size: int = 1 << 20):
+        """ Yield (start, positions) for consecutive blocks of at most `size` editions (views into the map). """
+        positions = self.positions
+        for lo in range(0, len(self), size): yield lo, positions[lo:lo + size]
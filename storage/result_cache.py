@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+
+INDEX = "index.json"
+
+def result_key(fields):
+    """ Content hash of a JSON-serialisable description of a run (ratings hash, format, parameters, seed, version, ...). """
+    return hashlib.sha256(json.dumps(fields, sort_keys = True).encode()).hexdigest()
+
+class ResultCache:
+    """
+    Content-addressed, size-bounded cache of per-edition batch results.
+
+    An entry is keyed by result_key(fields) over everything that determines
+    a run's numbers except its length, and holds the (editions, columns)
+    float64 rows of editions 0 .. m-1 as <key>.npy. Editions are seeded
+    individually (see batch_sim.edition_rng), so a run of n <= m editions is
+    a prefix of the entry and a longer one only needs editions m .. n-1;
+    put() then replaces the entry with the longer rows.
+
+    index.json records every entry's fields, columns, size and last use; once
+    the entries exceed max_bytes the least recently used are evicted.
+    """
+
+    def __init__(self, directory, max_bytes: int = 1 << 30):
+        """ Use `directory` for the entries and the index. """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.index = json.loads((self.directory / INDEX).read_text()) if (self.directory / INDEX).exists() else {}
+
+    def _save_index(self):
+        """ Atomically replace index.json. """
+        self.directory.mkdir(parents = True, exist_ok = True)
+        tmp = self.directory / (INDEX + ".tmp")
+        tmp.write_text(json.dumps(self.index, indent = 1) + "\n")
+        os.replace(tmp, self.directory / INDEX)
+
+    # ----------------------------------------------------------
+
+    def get(self, key, columns):
+        """ Rows of the entry (None if absent or stored with other columns); marks it as recently used. """
+        entry = self.index.get(key)
+        path = self.directory / f"{key}.npy"
+        if entry is None or entry["columns"] != list(columns) or not path.exists(): return None
+
+        entry["last_used"] = time.time()
+        self._save_index()
+        return np.load(path)
+
+    def put(self, key, fields, columns, rows):
+        """ Store rows for key unless the entry already holds as many editions; then evict down to max_bytes. """
+        rows = np.asarray(rows, dtype = float)
+        entry = self.index.get(key)
+        if entry is not None and entry["editions"] >= len(rows) and (self.directory / f"{key}.npy").exists(): return
+
+        self.directory.mkdir(parents = True, exist_ok = True)
+        tmp = self.directory / f"{key}.tmp.npy"
+        np.save(tmp, rows)
+        os.replace(tmp, self.directory / f"{key}.npy")
+
+        self.index[key] = {"fields": fields, "columns": list(columns), "editions": len(rows), "bytes": (self.directory / f"{key}.npy").stat().st_size, "last_used": time.time()}
+        self.prune(self.max_bytes, keep = key)
+
+    # ----------------------------------------------------------
+
+    def entries(self):
+        """ (key, entry) pairs, most recently used first. """
+        return sorted(self.index.items(), key = lambda item: item[1]["last_used"], reverse = True)
+
+    def size(self):
+        """ Total bytes of all entries. """
+        return sum(e["bytes"] for e in self.index.values())
+
+    def remove(self, key):
+        """ Drop one entry. """
+        (self.directory / f"{key}.npy").unlink(missing_ok = True)
+        self.index.pop(key, None)
+
+    def prune(self, max_bytes, keep = None, older_than = None):
+        """
+        Evict least recently used entries until the cache fits in max_bytes
+        (never `keep`), plus any entry unused for more than older_than
+        seconds. Returns the evicted keys.
+        """
+        removed = []
+        now = time.time()
+        total = self.size()
+
+        for key, entry in reversed(self.entries()):
+            if key == keep: continue
+            if total > max_bytes or (older_than is not None and now - entry["last_used"] > older_than):
+                total -= entry["bytes"]
+                self.remove(key)
+                removed.append(key)
+
+        self._save_index()
+        return removed
+
+    def clear(self):
+        """ Drop every entry. """
+        for key in list(self.index): self.remove(key)
+        self._save_index()
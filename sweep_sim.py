@@ -0,0 +1,200 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+
+import batch_sim
+from batch_sim import METRICS, PLAN_BLOCK, corr_eval, ic_eval
+from core.match_engine import MatchEngine
+from core.plan import compile_format, PlanEngine, bracket_size
+from evaluators.position_histogram import PositionHistogram
+from evaluators.running_stats import RunningStats
+from formats.specs import FORMAT_BUILDERS, build_spec, format_parameters
+from storage.chunked_writer import file_sha256
+from tournament_sim import __version__, SIMULATION_SOURCES, source_digest
+
+# Parameters passed to MatchEngine; every other sweep parameter belongs to the format's spec builder
+ENGINE_PARAMETERS = ("base_goal_expectation",)
+
+# Tag of the sweep seed streams (core.common_random style): cells and the random design draw from their own children
+SWEEP_TAG = 0x535750
+
+DEFAULT_CACHE = "results/sweeps"
+
+def parse_values(text):
+    """ "1,2,3" -> [1, 2, 3]; ints stay ints, anything with a dot or exponent is a float. """
+    return [int(v) if v.lstrip("-").isdigit() else float(v) for v in text.split(",")]
+
+def grid_design(specs):
+    """ Every combination of "name=v1,v2,..." values, as a list of {name: value}. """
+    axes = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        axes[name] = parse_values(values)
+    return [dict(zip(axes, combo)) for combo in product(*axes.values())]
+
+def random_design(specs, k, seed):
+    """
+    k random points: "name=lo:hi" draws uniformly from [lo, hi] (integers if
+    both bounds are), "name=v1,v2,..." picks one of the listed values.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key = (SWEEP_TAG, 0)))
+    points = [{} for _ in range(k)]
+
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if ":" in values:
+            lo, hi = parse_values(values.replace(":", ","))
+            draw = rng.integers(lo, hi + 1, k).tolist() if isinstance(lo, int) and isinstance(hi, int) else rng.uniform(lo, hi, k).round(6).tolist()
+        else:
+            options = parse_values(values)
+            draw = [options[i] for i in rng.integers(0, len(options), k)]
+        for point, value in zip(points, draw): point[name] = value
+
+    return points
+
+def cell_key(fmt_name, params, n, seed, ratings_sha256):
+    """ Cache key of one sweep cell: SHA-256 of its parameters, edition count, seed, ratings, code version and simulation sources. """
+    cell = {"format": fmt_name, "params": params, "n": n, "seed": seed, "ratings_sha256": ratings_sha256, "version": __version__, "sources": source_digest(SIMULATION_SOURCES + ("sweep_sim.py",))}
+    return hashlib.sha256(json.dumps(cell, sort_keys = True).encode()).hexdigest()
+
+def check_params(fmt_name, params):
+    """ Split a cell's parameters into (engine kwargs, spec kwargs); ValueError for unknown names. """
+    engine = {k: v for k, v in params.items() if k in ENGINE_PARAMETERS}
+    spec = {k: v for k, v in params.items() if k not in ENGINE_PARAMETERS}
+    build_spec(fmt_name, **spec)
+    return engine, spec
+
+# ----------------------------------------------------------
+
+def run_cell(fmt_name, params, n, seed, key):
+    """
+    Play n editions of one cell on the plan engine (a pool worker's field, see batch_sim._init_worker).
+
+    Blocks of PLAN_BLOCK editions draw from SeedSequence(seed, spawn_key =
+    (SWEEP_TAG, cell, block)) with `cell` taken from the cache key, so a cell
+    gives the same result in any sweep and on any worker.
+
+    Returns the cell record: parameters, mean / SD / half-width of every
+    metric, and the position histogram counts.
+    """
+    table = batch_sim._team_table
+    engine_params, spec_params = check_params(fmt_name, params)
+    spec = build_spec(fmt_name, **spec_params)
+    plan = compile_format(spec, len(table))
+    hist = PositionHistogram(table.names, bracket_size(spec), fmt_name)
+    acc = {m: RunningStats() for m in METRICS}
+
+    cell = int(key[:16], 16)
+    for b, lo in enumerate(range(0, n, PLAN_BLOCK)):
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key = (SWEEP_TAG, cell, b)))
+        engine = PlanEngine(table.rating, MatchEngine(rng = rng, **engine_params))
+        engine.run(plan, min(PLAN_BLOCK, n - lo))
+
+        goals = engine.group_goals
+        corr = corr_eval.evaluate_batch(engine.positions, table.rating)
+        dead = np.zeros(engine.n) if goals is None else ic_eval.evaluate_batch(goals)["pct_low_incentive"]
+        for m, values in zip(METRICS, (corr["correlation"], corr["avg_diff"], dead)): acc[m].update(values)
+        hist.update(engine.positions)
+
+    return {
+        "key": key,
+        "format": fmt_name,
+        "params": params,
+        "n": n,
+        "seed": seed,
+        "version": __version__,
+        "metrics": {m: {"mean": a.mean, "std": a.std(), "half_width": a.half_width()} for m, a in acc.items()},
+        "histogram": hist.to_dict(),
+    }
+
+def save_cell(cache, record):
+    """ Store a finished cell as <cache>/<key>.json (atomically, so an interrupted sweep never leaves a partial cell). """
+    path = cache / f"{record['key']}.json"
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(record) + "\n")
+    os.replace(tmp, path)
+
+def format_cells(records, names):
+    """ Markdown table of the sweep: parameters, then mean ± half-width of every metric. """
+    from tabulate import tabulate
+
+    headers = names + [f"{m} ± 95%" for m in METRICS] + ["cell"]
+    rows = [[r["params"].get(k, "") for k in names] + [f"{r['metrics'][m]['mean']:.4f} ± {r['metrics'][m]['half_width']:.4f}" for m in METRICS] + [r["key"][:10]] for r in records]
+    return tabulate(rows, headers = headers, tablefmt = "pipe")
+
+def main(args):
+    """ Run (or reuse) every cell of a parameter sweep of one format. """
+    if bool(args.grid) == bool(args.random_specs): raise ValueError("give either --grid or --random (with --random-n)")
+    seed = args.seed
+
+    points = grid_design(args.grid) if args.grid else random_design(args.random_specs, args.random_n, seed)
+    for params in points: check_params(args.format, params)
+
+    batch_sim._init_worker(args.rating_csv)
+    ratings_sha256 = file_sha256(args.rating_csv)
+    cache = Path(args.cache)
+    cache.mkdir(parents = True, exist_ok = True)
+
+    # Cells already in the cache are reused; only new points cost compute
+    cells = [(params, cell_key(args.format, params, args.n, seed, ratings_sha256)) for params in points]
+    records = {key: json.loads((cache / f"{key}.json").read_text()) for _, key in cells if (cache / f"{key}.json").exists()}
+    todo = list({key: params for params, key in cells if key not in records}.items())
+    print(f"{args.format}: {len(cells)} cells, {len(cells) - len(todo)} cached, {len(todo)} to run ({args.n} editions each, seed {seed})")
+
+    from tqdm import tqdm
+
+    with tqdm(total = len(todo)) as bar:
+        if args.workers > 1 and todo:
+            with ProcessPoolExecutor(args.workers, initializer = batch_sim._init_worker, initargs = (args.rating_csv,)) as pool:
+                jobs = [pool.submit(run_cell, args.format, params, args.n, seed, key) for key, params in todo]
+                for job in as_completed(jobs):
+                    record = job.result()
+                    save_cell(cache, record)
+                    records[record["key"]] = record
+                    bar.update()
+        else:
+            for key, params in todo:
+                records[key] = run_cell(args.format, params, args.n, seed, key)
+                save_cell(cache, records[key])
+                bar.update()
+
+    names = list(dict.fromkeys(k for params, _ in cells for k in params))
+    ordered = [records[key] for _, key in cells]
+    print(f"\n=== Sweep of {args.format} ===")
+    print(format_cells(ordered, names))
+
+    # One summary row per cell of this sweep, in design order
+    out = Path(args.out)
+    out.parent.mkdir(parents = True, exist_ok = True)
+    stats = ("mean", "std", "half_width")
+    with open(out, "w", newline = "") as fh:
+        writer = csv.writer(fh, lineterminator = "\n")
+        writer.writerow(["format"] + names + [f"{m}_{s}" for m in METRICS for s in stats] + ["cell"])
+        for r in ordered: writer.writerow([args.format] + [r["params"].get(k, "") for k in names] + [r["metrics"][m][s] for m in METRICS for s in stats] + [r["key"]])
+    print(f"\nSweep summary saved → {out} (cells in {cache})")
+
+def add_arguments(parser):
+    """ Register sweep_sim's command-line options on `parser` (shared with the tournament_sim CLI). """
+    parser.add_argument("--format", required = True, choices = sorted(FORMAT_BUILDERS), help = "format to sweep")
+    parser.add_argument("--rating_csv", required = True, help = "CSV with columns: Country, Rating")
+    parser.add_argument("--grid", nargs = "+", metavar = "NAME=V1,V2", help = "grid design: every combination of the listed values")
+    parser.add_argument("--random", dest = "random_specs", nargs = "+", metavar = "NAME=LO:HI", help = "random design over ranges (LO:HI) or value lists (V1,V2)")
+    parser.add_argument("--random-n", type = int, default = 20, help = "points of the random design (default 20)")
+    parser.add_argument("--n", type = int, default = 10_000, help = "editions per cell (default 10000)")
+    parser.add_argument("--seed", type = int, default = 0, help = "root seed of the cells and the random design (default 0)")
+    parser.add_argument("--workers", type = int, default = 1, help = "worker processes, one cell at a time each (default 1 = in-process)")
+    parser.add_argument("--cache", default = DEFAULT_CACHE, help = f"directory of finished cells (default {DEFAULT_CACHE})")
+    parser.add_argument("--out", default = "results/sweep_summary.csv", help = "summary CSV of this sweep (default results/sweep_summary.csv)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Parameter sweep of one format on the plan engine. Parameters: " + "; ".join(
+        f"{name}: {', '.join(list(format_parameters(name)) + list(ENGINE_PARAMETERS))}" for name in FORMAT_BUILDERS))
+    add_arguments(parser)
+    main(parser.parse_args())
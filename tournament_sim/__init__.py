@@ -0,0 +1,38 @@
+"""
+Headless entry point for the tournament simulator.
+
+    python -m tournament_sim batch --rating_csv data/teams.csv --n 1000
+    python -m tournament_sim sweep --format Swiss8R --rating_csv data/teams.csv --grid rounds=6,8,10
+    python -m tournament_sim cache list
+    python -m tournament_sim play
+
+Importing this package loads nothing beyond the standard library; the
+simulation path (core / formats / batch_sim) needs only NumPy, and pandas,
+matplotlib and scipy are loaded on demand by reporting and plotting code.
+"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+# Part of every sweep cell's and cached batch result's key (sweep_sim, batch_sim): bump it when a change alters simulation results
+__version__ = "0.1.0"
+
+# Code that determines simulation results, relative to the repository root
+SIMULATION_SOURCES = ("core", "formats", "evaluators", "batch_sim.py")
+
+@lru_cache
+def source_digest(sources = SIMULATION_SOURCES):
+    """
+    SHA-256 over the Python files of `sources` (paths and contents), so cache
+    keys change with the code even when __version__ is not bumped.
+    """
+    root = Path(__file__).resolve().parent.parent
+    digest = hashlib.sha256()
+
+    for name in sources:
+        path = root / name
+        for f in sorted(path.rglob("*.py")) if path.is_dir() else [path]:
+            digest.update(f.relative_to(root).as_posix().encode() + b"\0")
+            digest.update(f.read_bytes() + b"\0")
+    return digest.hexdigest()
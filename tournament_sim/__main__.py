@@ -0,0 +1,3 @@
+from tournament_sim.cli import main
+
+main()
@@ -0,0 +1,70 @@
+import argparse
+
+def _batch(args):
+    """ Monte Carlo run across all formats (same as python batch_sim.py). """
+    import batch_sim
+    batch_sim.main(args)
+
+def _sweep(args):
+    """ Parameter sweep of one format (same as python sweep_sim.py). """
+    import sweep_sim
+    sweep_sim.main(args)
+
+def _cache(args):
+    """ List, prune or clear batch_sim's result cache. """
+    import time
+    from storage.result_cache import ResultCache
+
+    cache = ResultCache(args.cache)
+    if args.action == "clear":
+        removed = len(cache.index)
+        cache.clear()
+        print(f"Removed {removed} entries from {args.cache}")
+    elif args.action == "prune":
+        max_bytes = cache.size() if args.max_mb is None else args.max_mb << 20
+        removed = cache.prune(max_bytes, older_than = None if args.older_than is None else args.older_than * 86400)
+        print(f"Removed {len(removed)} entries; {len(cache.index)} left, {cache.size() / 1e6:.1f} MB")
+
+    if args.action == "list":
+        for key, entry in cache.entries():
+            fields = entry["fields"]
+            used = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["last_used"]))
+            print(f"{key[:10]}  {fields['format']:<9} {fields['engine']:<6} seed {fields['seed']:<10} {entry['editions']:>9,} editions {entry['bytes'] / 1e6:8.2f} MB  used {used}  v{fields['version']}")
+        print(f"{len(cache.index)} entries, {cache.size() / 1e6:.1f} MB in {args.cache}")
+
+def _play(args):
+    """ One verbose edition of every format with plots (same as python main.py). """
+    import main as single_run
+    single_run.main()
+
+def build_parser():
+    """ Argument parser with one subcommand per entry script. """
+    import batch_sim
+    import sweep_sim
+
+    parser = argparse.ArgumentParser(prog = "tournament_sim", description = "Simulate football tournament formats.")
+    sub = parser.add_subparsers(dest = "command", required = True)
+
+    batch = sub.add_parser("batch", help = "Monte Carlo run of every format (NumPy only)")
+    batch_sim.add_arguments(batch)
+    batch.set_defaults(func = _batch)
+
+    sweep = sub.add_parser("sweep", help = "parameter sweep of one format with cached cells (NumPy only)")
+    sweep_sim.add_arguments(sweep)
+    sweep.set_defaults(func = _sweep)
+
+    cache = sub.add_parser("cache", help = "inspect or prune batch_sim's result cache")
+    cache.add_argument("action", choices = ("list", "prune", "clear"), help = "list entries (most recently used first), evict least recently used / stale ones, or remove all")
+    cache.add_argument("--cache", default = batch_sim.DEFAULT_CACHE, help = f"result cache directory (default {batch_sim.DEFAULT_CACHE})")
+    cache.add_argument("--max-mb", type = int, default = None, help = "prune: evict least recently used entries until the cache fits")
+    cache.add_argument("--older-than", type = float, default = None, metavar = "DAYS", help = "prune: also evict entries unused for more than DAYS days")
+    cache.set_defaults(func = _cache)
+
+    play = sub.add_parser("play", help = "one edition of every format with console output and plots (loads pandas / matplotlib)")
+    play.set_defaults(func = _play)
+    return parser
+
+def main(argv = None):
+    """ Parse the command line and run the chosen subcommand. """
+    args = build_parser().parse_args(argv)
+    args.func(args)